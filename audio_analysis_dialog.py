@@ -0,0 +1,278 @@
+"""
+Batch audio analysis dialog for Faster Whisper GUI.
+Analyzes every selected file in background worker processes and shows the results in a sortable table.
+"""
+
+import os
+from pathlib import Path
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+    QTableWidget, QTableWidgetItem, QHeaderView, QProgressBar,
+    QSpinBox, QCheckBox, QTextEdit, QComboBox
+)
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
+
+from audio_analyzer import analyze_files, suggest_options, get_default_analysis_workers
+
+
+class BatchAnalysisWorker(QThread):
+    """Worker thread that runs audio analysis for many files through a process pool."""
+    
+    # Signals for communication with main thread
+    file_analyzed = pyqtSignal(str, dict)  # Emitted per file (path, analysis result)
+    finished = pyqtSignal()  # Emitted when all files are analyzed (or cancelled)
+    
+    def __init__(self, file_paths, max_workers, mode="auto"):
+        """
+        Initialize batch analysis worker.
+        
+        Args:
+            file_paths: List of file paths to analyze
+            max_workers: Number of analysis processes
+            mode: Analysis mode ("auto", "full" or "sampled")
+        """
+        super().__init__()
+        self.file_paths = list(file_paths)
+        self.max_workers = max_workers
+        self.mode = mode
+        self._is_cancelled = False
+    
+    def run(self):
+        """Analyze all files, streaming results back as they complete."""
+        try:
+            analyze_files(
+                self.file_paths,
+                max_workers=self.max_workers,
+                mode=self.mode,
+                callback=self.file_analyzed.emit,
+                is_cancelled=lambda: self._is_cancelled
+            )
+        except Exception as e:
+            print(f"Batch analysis failed: {e}")
+        self.finished.emit()
+    
+    def cancel(self):
+        """Stop after the analyses already running."""
+        self._is_cancelled = True
+
+
+class NumericTableItem(QTableWidgetItem):
+    """Table item that sorts by a numeric value instead of its text."""
+    
+    def __init__(self, text, value):
+        super().__init__(text)
+        self.sort_value = value if value is not None else float("-inf")
+    
+    def __lt__(self, other):
+        if isinstance(other, NumericTableItem):
+            return self.sort_value < other.sort_value
+        return super().__lt__(other)
+
+
+class AudioAnalysisDialog(QDialog):
+    """Dialog showing audio quality analysis for all selected files."""
+    
+    COLUMNS = ["File", "Score", "Volume", "Noise", "Frequency", "SNR (dB)", "Speech %", "Confidence", "Suggested Options"]
+    MODES = [("Auto (sample long files)", "auto"), ("Full (decode whole file)", "full"), ("Sampled (fastest)", "sampled")]
+    
+    def __init__(self, file_list, parent=None):
+        super().__init__(parent)
+        self.file_list = list(file_list)
+        self.results = {}  # file path -> analysis result
+        self.worker = None
+        self._stale_workers = []
+        self.init_ui()
+        self.start_analysis()
+    
+    def init_ui(self):
+        """Initialize the dialog UI."""
+        self.setWindowTitle("Audio Quality Analysis")
+        self.setMinimumWidth(950)
+        self.setMinimumHeight(550)
+        
+        layout = QVBoxLayout()
+        
+        # Header
+        header_label = QLabel(
+            f"Analyzing {len(self.file_list)} file(s) in the background. "
+            "Click a column header to sort, or select a row to see its suggestions."
+        )
+        header_label.setWordWrap(True)
+        header_label.setStyleSheet("font-weight: bold; padding: 10px; background-color: #f0f0f0; border-radius: 5px;")
+        layout.addWidget(header_label)
+        
+        # Worker count
+        workers_layout = QHBoxLayout()
+        workers_layout.addWidget(QLabel("Analysis Processes:"))
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setMinimum(1)
+        self.workers_spin.setMaximum(max(1, os.cpu_count() or 1))
+        self.workers_spin.setValue(get_default_analysis_workers())
+        workers_layout.addWidget(self.workers_spin)
+        workers_layout.addWidget(QLabel("Mode:"))
+        self.mode_combo = QComboBox()
+        for label, mode in self.MODES:
+            self.mode_combo.addItem(label, mode)
+        workers_layout.addWidget(self.mode_combo)
+        self.restart_btn = QPushButton("Restart Analysis")
+        self.restart_btn.clicked.connect(self.start_analysis)
+        workers_layout.addWidget(self.restart_btn)
+        workers_layout.addStretch()
+        layout.addLayout(workers_layout)
+        
+        # Results table
+        self.results_table = QTableWidget()
+        self.results_table.setColumnCount(len(self.COLUMNS))
+        self.results_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.results_table.setAlternatingRowColors(True)
+        self.results_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.results_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.results_table.itemSelectionChanged.connect(self.show_selected_suggestions)
+        layout.addWidget(self.results_table)
+        
+        # Suggestions for the selected file
+        self.suggestions_text = QTextEdit()
+        self.suggestions_text.setReadOnly(True)
+        self.suggestions_text.setMaximumHeight(110)
+        layout.addWidget(self.suggestions_text)
+        
+        # Progress
+        self.progress_label = QLabel("")
+        layout.addWidget(self.progress_label)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximum(max(1, len(self.file_list)))
+        layout.addWidget(self.progress_bar)
+        
+        # Apply suggestions option
+        self.apply_check = QCheckBox("Apply suggested filters (Speech Normalization, Denoise) per file when queueing")
+        self.apply_check.setChecked(True)
+        layout.addWidget(self.apply_check)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+        
+        self.setLayout(layout)
+    
+    def start_analysis(self):
+        """Start (or restart) analysis of all files."""
+        self.stop_analysis()
+        self.results = {}
+        self.results_table.setSortingEnabled(False)
+        self.results_table.setRowCount(0)
+        self.progress_bar.setValue(0)
+        self.progress_label.setText(f"Analyzed 0 of {len(self.file_list)} files...")
+        
+        self.worker = BatchAnalysisWorker(self.file_list, self.workers_spin.value(), self.mode_combo.currentData())
+        self.worker.file_analyzed.connect(self.on_file_analyzed)
+        self.worker.finished.connect(self.on_analysis_finished)
+        self.worker.start()
+    
+    def stop_analysis(self):
+        """Cancel a running analysis without blocking on files already being analyzed."""
+        if self.worker and self.worker.isRunning():
+            self.worker.file_analyzed.disconnect()
+            self.worker.finished.disconnect()
+            self.worker.cancel()
+            # Keep a reference until the thread exits
+            self._stale_workers = [w for w in self._stale_workers if w.isRunning()]
+            self._stale_workers.append(self.worker)
+        self.worker = None
+    
+    def on_file_analyzed(self, file_path, analysis):
+        """Add one file's analysis result to the table."""
+        self.results[file_path] = analysis
+        metrics = analysis.get("metrics") or {}
+        available = analysis.get("analysis_available")
+        
+        # Disable sorting while inserting so the row index stays valid
+        self.results_table.setSortingEnabled(False)
+        row = self.results_table.rowCount()
+        self.results_table.insertRow(row)
+        
+        file_item = QTableWidgetItem(Path(file_path).name)
+        file_item.setData(Qt.ItemDataRole.UserRole, file_path)
+        file_item.setToolTip(file_path)
+        self.results_table.setItem(row, 0, file_item)
+        self.results_table.setItem(row, 1, NumericTableItem(str(analysis["quality_score"]), analysis["quality_score"]))
+        self.results_table.setItem(row, 2, QTableWidgetItem(analysis["volume_level"].title()))
+        self.results_table.setItem(row, 3, QTableWidgetItem(analysis["noise_level"].title()))
+        self.results_table.setItem(row, 4, QTableWidgetItem(analysis["frequency_range"].title()))
+        
+        snr = metrics.get("snr")
+        self.results_table.setItem(row, 5, NumericTableItem(f"{snr:.1f}" if snr is not None else "", snr))
+        speech_ratio = metrics.get("speech_ratio")
+        self.results_table.setItem(
+            row, 6,
+            NumericTableItem(f"{speech_ratio * 100:.0f}" if speech_ratio is not None else "", speech_ratio)
+        )
+        
+        overrides = suggest_options(analysis)
+        if not available:
+            summary = "Analysis unavailable"
+        elif overrides:
+            summary = ", ".join(format_option(key, value) for key, value in overrides.items())
+        else:
+            summary = "No changes"
+        confidence = analysis.get("confidence")
+        self.results_table.setItem(
+            row, 7,
+            NumericTableItem(f"{confidence * 100:.0f}%" if available and confidence is not None else "", confidence)
+        )
+        self.results_table.setItem(row, 8, QTableWidgetItem(summary))
+        
+        self.results_table.setSortingEnabled(True)
+        
+        self.progress_bar.setValue(len(self.results))
+        self.progress_label.setText(f"Analyzed {len(self.results)} of {len(self.file_list)} files...")
+    
+    def on_analysis_finished(self):
+        """Handle completion of the batch analysis."""
+        self.progress_label.setText(f"Analysis complete: {len(self.results)} of {len(self.file_list)} files analyzed")
+    
+    def show_selected_suggestions(self):
+        """Show suggestions for the selected file."""
+        items = self.results_table.selectedItems()
+        if not items:
+            return
+        file_item = self.results_table.item(items[0].row(), 0)
+        analysis = self.results.get(file_item.data(Qt.ItemDataRole.UserRole))
+        if not analysis:
+            return
+        
+        text = f"{file_item.text()} - Quality Score: {analysis['quality_score']}/100\n"
+        if analysis["suggestions"]:
+            text += "\n".join(f"• {suggestion}" for suggestion in analysis["suggestions"])
+        else:
+            text += "No specific suggestions - audio quality appears good!"
+        self.suggestions_text.setPlainText(text)
+    
+    def get_file_option_overrides(self):
+        """Get suggested option overrides per file (empty if applying suggestions is disabled)."""
+        if not self.apply_check.isChecked():
+            return {}
+        overrides = {}
+        for file_path, analysis in self.results.items():
+            file_overrides = suggest_options(analysis)
+            if file_overrides:
+                overrides[file_path] = file_overrides
+        return overrides
+    
+    def done(self, result):
+        """Stop background analysis when the dialog closes."""
+        self.stop_analysis()
+        super().done(result)
+
+
+def format_option(key, value):
+    """Format an option override for display."""
+    names = {"ff_speechnorm": "Speech Normalization", "ff_fftdn": "Denoise"}
+    name = names.get(key, key)
+    if value is True:
+        return name
+    return f"{name}: {value}"
@@ -3,22 +3,358 @@ Audio quality analysis utility.
 Analyzes audio files to suggest optimal settings for transcription.
 """
 
+import math
+import os
+import re
+import shutil
 import subprocess
 import sys
 from pathlib import Path
-from file_info_extractor import get_user_data_dir, find_ffprobe
+from file_info_extractor import get_user_data_dir, find_ffprobe, get_media_metadata, format_duration
+import pcm_analyzer
 
 
-def analyze_audio_quality(file_path):
+# Silence detection settings (also used as the noise proxy)
+SILENCE_NOISE_DB = -30
+SILENCE_MIN_DURATION = 0.5
+
+# Timeout for one analysis pass: a fixed allowance plus a share of the audio duration
+ANALYSIS_BASE_TIMEOUT = 30  # seconds
+ANALYSIS_TIMEOUT_PER_AUDIO_SECOND = 0.1  # decoding is normally far faster than real time
+ANALYSIS_UNKNOWN_DURATION_TIMEOUT = 600  # seconds, when the duration could not be probed
+
+# Sampled analysis: decode a few evenly spaced windows instead of the whole file
+SAMPLED_MIN_DURATION = 30 * 60  # "auto" mode samples files longer than this (seconds)
+SAMPLE_WINDOW_COUNT = 8
+SAMPLE_WINDOW_LENGTH = 30.0  # seconds
+CONFIDENT_SAMPLE_SECONDS = 300  # Analyzed audio needed for full confidence
+
+_FILTER_LINE = re.compile(r"^\[Parsed_(\w+?)_\d+ @ [^\]]+\]\s*(.*)$")
+_NUMBER = re.compile(r"-?(?:\d+(?:\.\d*)?|\.\d+)|-?inf", re.IGNORECASE)
+
+
+def find_ffmpeg(ffprobe_path=None):
+    """Find ffmpeg executable (normally next to ffprobe)."""
+    if ffprobe_path:
+        ffmpeg_path = Path(ffprobe_path).parent / "ffmpeg.exe"
+        if ffmpeg_path.exists():
+            return str(ffmpeg_path)
+    
+    # Try user data directory
+    ffmpeg_path = get_user_data_dir() / "ffmpeg.exe"
+    if ffmpeg_path.exists():
+        return str(ffmpeg_path)
+    
+    # Fall back to ffmpeg in PATH
+    return shutil.which("ffmpeg")
+
+
+def get_analysis_timeout(duration):
+    """Get the timeout for a full analysis pass over audio of the given duration (seconds)."""
+    if not duration:
+        return ANALYSIS_UNKNOWN_DURATION_TIMEOUT
+    return ANALYSIS_BASE_TIMEOUT + duration * ANALYSIS_TIMEOUT_PER_AUDIO_SECOND
+
+
+def build_analysis_filter():
+    """Build the combined filter graph measuring volume, silence and signal statistics."""
+    return ",".join([
+        "volumedetect",
+        f"silencedetect=noise={SILENCE_NOISE_DB}dB:d={SILENCE_MIN_DURATION}",
+        "astats=metadata=0",
+    ])
+
+
+def get_sample_windows(duration, count=SAMPLE_WINDOW_COUNT, length=SAMPLE_WINDOW_LENGTH):
+    """
+    Get evenly spaced (start, length) windows covering a file of the given duration.
+    
+    Returns a single whole-file window if the windows would cover the file anyway.
+    """
+    if not duration or duration <= count * length:
+        return [(0.0, None)]
+    spacing = duration / count
+    # Center each window in its share of the file
+    return [(spacing * i + (spacing - length) / 2, length) for i in range(count)]
+
+
+def estimate_confidence(analyzed_seconds, duration, window_levels):
+    """
+    Estimate confidence (0-1) in sampled results.
+    
+    Grows with the amount of audio analyzed and drops when levels vary a lot
+    between windows (the unsampled parts may differ too).
+    """
+    if duration and analyzed_seconds >= duration * 0.99:
+        return 1.0
+    coverage = min(1.0, analyzed_seconds / CONFIDENT_SAMPLE_SECONDS)
+    
+    finite_levels = [level for level in window_levels if level is not None and level > -100]
+    variability_penalty = 0.0
+    if len(finite_levels) > 1:
+        mean = sum(finite_levels) / len(finite_levels)
+        spread = (sum((level - mean) ** 2 for level in finite_levels) / len(finite_levels)) ** 0.5
+        variability_penalty = min(0.5, spread / 20.0)
+    
+    return round(max(0.1, coverage * (1.0 - variability_penalty)), 2)
+
+
+def merge_filter_metrics(window_metrics, analyzed_seconds, duration):
+    """Combine per-window filter metrics into estimates for the whole file."""
+    def power_mean(values):
+        values = [v for v in values if v is not None]
+        if not values:
+            return None
+        mean_power = sum(10 ** (v / 10.0) for v in values) / len(values)
+        return 10.0 * math.log10(mean_power) if mean_power > 0 else float("-inf")
+    
+    def maximum(values):
+        values = [v for v in values if v is not None]
+        return max(values) if values else None
+    
+    # Silence counts scale with the length of audio they were measured over
+    scale = duration / analyzed_seconds if duration and analyzed_seconds else 1.0
+    return {
+        "mean_volume": power_mean(m["mean_volume"] for m in window_metrics),
+        "max_volume": maximum(m["max_volume"] for m in window_metrics),
+        "silence_count": int(round(sum(m["silence_count"] for m in window_metrics) * scale)),
+        "silence_duration": sum(m["silence_duration"] for m in window_metrics) * scale,
+        "rms_level": power_mean(m["rms_level"] for m in window_metrics),
+        "peak_level": maximum(m["peak_level"] for m in window_metrics),
+        "noise_floor": min((m["noise_floor"] for m in window_metrics if m["noise_floor"] is not None), default=None),
+        "dynamic_range": maximum(m["dynamic_range"] for m in window_metrics),
+        "window_levels": [m["mean_volume"] for m in window_metrics],
+    }
+
+
+def run_audio_analysis(ffmpeg_path, file_path, timeout, start=None, length=None):
+    """
+    Decode a file (or one window of it) once through the combined analysis filter graph.
+    
+    Returns:
+        Parsed metrics dictionary (see parse_analysis_output), or None if ffmpeg
+        failed or timed out.
+    """
+    cmd = [str(ffmpeg_path), "-hide_banner", "-nostats"]
+    if start:
+        cmd += ["-ss", f"{start:.3f}"]  # Before -i: fast input seeking
+    cmd += ["-i", str(file_path)]
+    if length:
+        cmd += ["-t", f"{length:.3f}"]
+    cmd += [
+        "-vn",  # Skip video decoding for video files
+        "-af", build_analysis_filter(),
+        "-f", "null",
+        "-"
+    ]
+    
+    try:
+        analysis_result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            errors="replace",
+            timeout=timeout,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+        )
+    except subprocess.TimeoutExpired:
+        print(f"Audio analysis timed out after {timeout:.0f}s: {file_path}")
+        return None
+    
+    if analysis_result.returncode != 0:
+        return None
+    
+    return parse_analysis_output(analysis_result.stderr)
+
+
+def _parse_number(text):
+    """Parse the first number in text (handles -inf), or None."""
+    match = _NUMBER.search(text)
+    if not match:
+        return None
+    try:
+        return float(match.group(0))
+    except ValueError:
+        return None
+
+
+def parse_analysis_output(stderr):
+    """
+    Parse ffmpeg stderr from the combined analysis filter graph.
+    
+    Returns a dictionary with:
+    - mean_volume, max_volume: dB from volumedetect
+    - silence_count: Number of detected silent periods
+    - silence_duration: Total seconds of detected silence
+    - rms_level, peak_level, noise_floor, dynamic_range: dB from astats (overall section)
+    Values that were not reported are None.
+    """
+    metrics = {
+        "mean_volume": None,
+        "max_volume": None,
+        "silence_count": 0,
+        "silence_duration": 0.0,
+        "rms_level": None,
+        "peak_level": None,
+        "noise_floor": None,
+        "dynamic_range": None,
+    }
+    
+    astats_keys = {
+        "RMS level dB": "rms_level",
+        "Peak level dB": "peak_level",
+        "Noise floor dB": "noise_floor",
+        "Dynamic range": "dynamic_range",
+    }
+    in_astats_overall = False
+    
+    for line in stderr.splitlines():
+        match = _FILTER_LINE.match(line.strip())
+        if not match:
+            continue
+        filter_name, message = match.groups()
+        
+        if filter_name == "volumedetect":
+            if message.startswith("mean_volume:"):
+                metrics["mean_volume"] = _parse_number(message.split(":", 1)[1])
+            elif message.startswith("max_volume:"):
+                metrics["max_volume"] = _parse_number(message.split(":", 1)[1])
+        
+        elif filter_name == "silencedetect":
+            if "silence_start" in message:
+                metrics["silence_count"] += 1
+            if "silence_duration:" in message:
+                duration = _parse_number(message.split("silence_duration:", 1)[1])
+                if duration is not None:
+                    metrics["silence_duration"] += duration
+        
+        elif filter_name == "astats":
+            # astats prints per-channel sections followed by an "Overall" section
+            if message.startswith("Channel:"):
+                in_astats_overall = False
+            elif message.startswith("Overall"):
+                in_astats_overall = True
+            elif in_astats_overall and ":" in message:
+                key, value = message.split(":", 1)
+                if key.strip() in astats_keys:
+                    metrics[astats_keys[key.strip()]] = _parse_number(value)
+    
+    return metrics
+
+
+def classify_pcm_metrics(result, metrics):
+    """Fill volume, noise and frequency range levels from streaming PCM metrics."""
+    # Overall RMS matches volumedetect's mean volume
+    rms_level = metrics["rms_level"]
+    if rms_level < -30:
+        result["volume_level"] = "low"
+        result["suggestions"].append("Low volume detected - consider enabling Speech Normalization")
+    elif rms_level > -10:
+        result["volume_level"] = "high"
+    else:
+        result["volume_level"] = "normal"
+    
+    # Noise from the gap between speech level and the quietest frames
+    snr = metrics["snr"]
+    if snr >= 30 or metrics["noise_floor"] < -60:
+        result["noise_level"] = "low"
+    elif snr >= 18:
+        result["noise_level"] = "medium"
+        result["suggestions"].append("Some noise detected - consider enabling Denoise filter if quality is poor")
+    else:
+        result["noise_level"] = "high"
+        result["suggestions"].append(
+            f"Background noise close to speech level (SNR {snr:.0f} dB) - consider enabling the Denoise filter"
+        )
+    
+    bandwidth = metrics["bandwidth"]
+    if bandwidth is not None:
+        if bandwidth < 3800:
+            result["frequency_range"] = "narrow"
+            result["suggestions"].append(
+                "Narrow frequency range (phone-quality audio) - consider the Phone Conversation Audio preset"
+            )
+        elif bandwidth > 6500:
+            result["frequency_range"] = "wide"
+        else:
+            result["frequency_range"] = "normal"
+    
+    if metrics["speech_ratio"] < 0.2:
+        result["suggestions"].append("Mostly silence detected - keep Voice Activity Detection enabled")
+
+
+def classify_filter_metrics(result, metrics):
+    """Fill volume and noise levels from ffmpeg filter metrics (used when NumPy is unavailable)."""
+    mean_volume = metrics["mean_volume"]
+    
+    # Determine volume level
+    if mean_volume is not None:
+        if mean_volume < -30:
+            result["volume_level"] = "low"
+            result["suggestions"].append("Low volume detected - consider enabling Speech Normalization")
+        elif mean_volume > -10:
+            result["volume_level"] = "high"
+        else:
+            result["volume_level"] = "normal"
+    
+    # Determine noise level (based on silence detection)
+    # Many short silent periods suggest background noise breaking up the signal
+    if metrics["silence_count"] > 10:
+        result["noise_level"] = "medium"
+        result["suggestions"].append("Some noise detected - consider enabling Denoise filter if quality is poor")
+    else:
+        result["noise_level"] = "low"
+
+
+def score_result(result):
+    """Compute the quality score and general suggestions from the classified levels."""
+    quality_score = 80  # Start with good score
+    
+    if result["volume_level"] == "low":
+        quality_score -= 15
+    elif result["volume_level"] == "normal":
+        quality_score += 5
+    
+    if result["noise_level"] == "low":
+        quality_score += 10
+        result["suggestions"].append("Clean audio detected - using minimal filters for best accuracy")
+    elif result["noise_level"] == "medium":
+        quality_score -= 10
+    elif result["noise_level"] == "high":
+        quality_score -= 25
+    
+    if result["frequency_range"] == "narrow":
+        quality_score -= 10
+    
+    result["quality_score"] = max(0, min(100, quality_score))
+    
+    # Add general suggestions based on quality
+    if result["quality_score"] >= 80:
+        result["suggestions"].append("High quality audio - current filter settings are optimal")
+    elif result["quality_score"] < 60:
+        result["suggestions"].append("Lower quality audio detected - consider enabling audio filters")
+
+
+def analyze_audio_quality(file_path, mode="auto"):
     """
     Analyze audio quality and suggest optimal settings.
     
+    Uses streaming PCM analysis when NumPy is installed, otherwise ffmpeg's
+    analysis filters.
+    
+    Args:
+        file_path: Media file to analyze
+        mode: "full" decodes the whole file, "sampled" decodes only evenly spaced
+            windows, "auto" samples files longer than SAMPLED_MIN_DURATION
+    
     Returns a dictionary with:
     - noise_level: "low", "medium", "high"
     - volume_level: "low", "normal", "high"
     - frequency_range: "narrow", "normal", "wide"
     - suggestions: List of suggested settings
     - quality_score: Overall quality score (0-100)
+    - metrics: Raw measurements from the analysis pass (if available)
+    - confidence: Confidence in the results (0-1, lower for sampled analysis)
     """
     result = {
         "noise_level": "unknown",
@@ -26,7 +362,9 @@ def analyze_audio_quality(file_path):
         "frequency_range": "unknown",
         "suggestions": [],
         "quality_score": 50,
-        "analysis_available": False
+        "analysis_available": False,
+        "metrics": {},
+        "confidence": 0.0
     }
     
     ffprobe_path = find_ffprobe()
@@ -34,112 +372,68 @@ def analyze_audio_quality(file_path):
         return result
     
     try:
-        # Get audio statistics using ffprobe
-        cmd = [
-            str(ffprobe_path),
-            "-v", "error",
-            "-show_entries", "stream=codec_name,sample_rate,channels,bit_rate",
-            "-show_entries", "format=bit_rate",
-            "-of", "json",
-            str(file_path)
-        ]
-        
-        probe_result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if probe_result.returncode != 0:
+        # Get audio stream information (cached by path, size and mtime)
+        metadata = get_media_metadata(file_path)
+        if metadata is None:
             return result
         
-        # Try to get more detailed audio analysis using ffmpeg
-        # Find ffmpeg (should be in same directory as ffprobe)
-        ffmpeg_path = ffprobe_path.parent / "ffmpeg.exe"
-        if not ffmpeg_path.exists():
-            # Try user data directory
-            user_data_dir = get_user_data_dir()
-            ffmpeg_path = user_data_dir / "ffmpeg.exe"
-            if not ffmpeg_path.exists():
-                return result
-        
-        # Analyze volume levels
-        cmd_volume = [
-            str(ffmpeg_path),
-            "-i", str(file_path),
-            "-af", "volumedetect",
-            "-f", "null",
-            "-"
-        ]
-        
-        volume_result = subprocess.run(cmd_volume, capture_output=True, text=True, timeout=30)
-        
-        # Parse volume analysis
-        mean_volume = None
-        max_volume = None
-        
-        if volume_result.returncode == 0:
-            for line in volume_result.stderr.split('\n'):
-                if 'mean_volume:' in line:
-                    try:
-                        mean_volume = float(line.split('mean_volume:')[1].split('dB')[0].strip())
-                    except:
-                        pass
-                if 'max_volume:' in line:
-                    try:
-                        max_volume = float(line.split('max_volume:')[1].split('dB')[0].strip())
-                    except:
-                        pass
+        ffmpeg_path = find_ffmpeg(ffprobe_path)
+        if not ffmpeg_path:
+            return result
         
-        # Analyze noise (using silence detection as proxy)
-        cmd_silence = [
-            str(ffmpeg_path),
-            "-i", str(file_path),
-            "-af", "silencedetect=noise=-30dB:d=0.5",
-            "-f", "null",
-            "-"
-        ]
+        duration = metadata.get("duration")
+        sampled = mode == "sampled" or (mode == "auto" and duration and duration > SAMPLED_MIN_DURATION)
+        windows = get_sample_windows(duration) if sampled else [(0.0, None)]
+        sampled = windows[0][1] is not None  # Short files are analyzed in full anyway
         
-        silence_result = subprocess.run(cmd_silence, capture_output=True, text=True, timeout=30)
+        if sampled:
+            analyzed_seconds = sum(length for start, length in windows)
+            timeout = get_analysis_timeout(analyzed_seconds) + len(windows) * 5  # Allow for seeking
+        else:
+            analyzed_seconds = duration or 0.0
+            timeout = get_analysis_timeout(duration)
         
-        # Determine volume level
-        if mean_volume is not None:
-            if mean_volume < -30:
-                result["volume_level"] = "low"
-                result["suggestions"].append("Low volume detected - consider enabling Speech Normalization")
-            elif mean_volume > -10:
-                result["volume_level"] = "high"
+        if pcm_analyzer.is_available():
+            # Measure levels, noise floor and bandwidth from the decoded samples
+            if sampled:
+                metrics = pcm_analyzer.analyze_pcm_windows(ffmpeg_path, file_path, windows, timeout)
             else:
-                result["volume_level"] = "normal"
-        
-        # Determine noise level (based on silence detection and volume consistency)
-        if silence_result.returncode == 0:
-            silence_lines = [l for l in silence_result.stderr.split('\n') if 'silence_start' in l or 'silence_end' in l]
-            # If many silence detections, might indicate noise
-            if len(silence_lines) > 20:
-                result["noise_level"] = "medium"
-                result["suggestions"].append("Some noise detected - consider enabling Denoise filter if quality is poor")
+                metrics = pcm_analyzer.analyze_pcm(ffmpeg_path, file_path, timeout)
+            if metrics is None:
+                return result
+            classify_pcm_metrics(result, metrics)
+        else:
+            # Measure volume, silence and signal statistics in one decode pass per window
+            if sampled:
+                window_metrics = []
+                window_timeout = timeout / len(windows)
+                for start, length in windows:
+                    metrics = run_audio_analysis(ffmpeg_path, file_path, window_timeout, start, length)
+                    if metrics is None:
+                        return result
+                    window_metrics.append(metrics)
+                metrics = merge_filter_metrics(window_metrics, analyzed_seconds, duration)
             else:
-                result["noise_level"] = "low"
+                metrics = run_audio_analysis(ffmpeg_path, file_path, timeout)
+                if metrics is None:
+                    return result
+            classify_filter_metrics(result, metrics)
         
-        # Determine quality score and suggestions
-        quality_score = 80  # Start with good score
-        
-        if result["volume_level"] == "low":
-            quality_score -= 15
-        elif result["volume_level"] == "normal":
-            quality_score += 5
-        
-        if result["noise_level"] == "low":
-            quality_score += 10
-            result["suggestions"].append("Clean audio detected - using minimal filters for best accuracy")
-        elif result["noise_level"] == "medium":
-            quality_score -= 10
-        
-        result["quality_score"] = max(0, min(100, quality_score))
+        metrics["sampled"] = sampled
+        metrics["analyzed_seconds"] = analyzed_seconds
+        result["metrics"] = metrics
+        result["confidence"] = estimate_confidence(
+            analyzed_seconds, duration, metrics.get("window_levels", [])
+        ) if sampled else 1.0
+        if sampled:
+            result["suggestions"].append(
+                f"Long recording - analyzed {len(windows)} samples "
+                f"({format_duration(analyzed_seconds)} of {format_duration(duration)}), "
+                f"confidence {result['confidence'] * 100:.0f}%"
+            )
+        score_result(result)
         result["analysis_available"] = True
-        
-        # Add general suggestions based on quality
-        if result["quality_score"] >= 80:
-            result["suggestions"].append("High quality audio - current filter settings are optimal")
-        elif result["quality_score"] < 60:
-            result["suggestions"].append("Lower quality audio detected - consider enabling audio filters")
-        
+    
     except Exception as e:
         # If analysis fails, provide default suggestions for iPhone recordings
         result["suggestions"].append("Clean audio detected - using minimal filters for best accuracy")
@@ -148,3 +442,89 @@ def analyze_audio_quality(file_path):
     
     return result
 
+
+def suggest_options(analysis):
+    """
+    Get queue option overrides suggested by an analysis result.
+    
+    Returns a dictionary of option keys (as used by build_command) to values,
+    empty if no filter changes are suggested.
+    """
+    options = {}
+    if not analysis.get("analysis_available"):
+        return options
+    
+    if analysis["volume_level"] == "low":
+        options["ff_speechnorm"] = True
+    
+    if analysis["noise_level"] == "medium":
+        options["ff_fftdn"] = 12
+    elif analysis["noise_level"] == "high":
+        options["ff_fftdn"] = 25
+    
+    return options
+
+
+def get_default_analysis_workers():
+    """Get the default number of analysis processes."""
+    return max(1, min(4, (os.cpu_count() or 1) // 2))
+
+
+def analyze_files(file_paths, max_workers=None, callback=None, is_cancelled=None, use_cache=True, mode="auto"):
+    """
+    Analyze many files in parallel worker processes.
+    
+    Cached results for unchanged files are returned without re-analysis, and
+    new successful results are added to the cache.
+    
+    Args:
+        file_paths: List of file paths to analyze
+        max_workers: Number of worker processes (default: get_default_analysis_workers())
+        callback: Optional function called with (file_path, analysis) as each file completes
+        is_cancelled: Optional function returning True to stop early
+        use_cache: Whether to read and write the analysis cache
+        mode: Analysis mode passed to analyze_audio_quality ("auto", "full" or "sampled")
+    
+    Returns:
+        Dictionary of file path -> analysis result (see analyze_audio_quality)
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from metadata_cache import get_metadata_cache
+    
+    cache = get_metadata_cache() if use_cache else None
+    results = {}
+    to_analyze = []
+    
+    for file_path in file_paths:
+        cached = cache.get_analysis(file_path, mode) if cache else None
+        if cached is not None:
+            results[file_path] = cached
+            if callback:
+                callback(file_path, cached)
+        else:
+            to_analyze.append(file_path)
+    
+    if not to_analyze:
+        return results
+    
+    executor = ProcessPoolExecutor(max_workers=max_workers or get_default_analysis_workers())
+    try:
+        futures = {executor.submit(analyze_audio_quality, f, mode): f for f in to_analyze}
+        for future in as_completed(futures):
+            if is_cancelled and is_cancelled():
+                break
+            file_path = futures[future]
+            try:
+                analysis = future.result()
+            except Exception as e:
+                print(f"Error analyzing {file_path}: {e}")
+                continue
+            results[file_path] = analysis
+            if cache and analysis.get("analysis_available"):
+                cache.put_analysis(file_path, mode, analysis)
+            if callback:
+                callback(file_path, analysis)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    
+    return results
@@ -0,0 +1,44 @@
+"""
+Background bulk probing for Faster Whisper GUI.
+Collects media metadata for large file selections without blocking the UI thread.
+"""
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from file_info_extractor import probe_files
+
+
+class BulkProbeWorker(QThread):
+    """Worker thread that probes many files through a bounded ffprobe pool."""
+    
+    # Signals for communication with main thread
+    file_probed = pyqtSignal(str, object)  # Emitted per file (path, metadata dict or None)
+    finished = pyqtSignal(dict)  # Emitted when all files are probed (path -> metadata)
+    
+    def __init__(self, file_paths, max_workers=None):
+        """
+        Initialize bulk probe worker.
+        
+        Args:
+            file_paths: List of file paths to probe
+            max_workers: Maximum concurrent ffprobe processes (default: based on CPU count)
+        """
+        super().__init__()
+        self.file_paths = list(file_paths)
+        self.max_workers = max_workers
+        self._is_cancelled = False
+    
+    def run(self):
+        """Probe all files, streaming results back as they complete."""
+        results = probe_files(
+            self.file_paths,
+            max_workers=self.max_workers,
+            callback=self.file_probed.emit,
+            is_cancelled=lambda: self._is_cancelled
+        )
+        if not self._is_cancelled:
+            self.finished.emit(results)
+    
+    def cancel(self):
+        """Stop probing (already running ffprobe calls finish on their own)."""
+        self._is_cancelled = True
@@ -0,0 +1,449 @@
+"""
+Headless batch runner for Faster Whisper GUI.
+Transcribes folders or a manifest of files with a preset, without a display and
+without importing PyQt6, so batches can run on servers.
+
+Usage:
+    python cli_runner.py INPUT [INPUT ...] --preset Standard --output OUT_DIR --jobs 2
+    python cli_runner.py --manifest files.jsonl --preset Standard
+
+Progress is printed to stdout as JSON lines, one event per line:
+    {"event": "queued", "job_id": 1, "input": "...", ...}
+    {"event": "started" | "progress" | "completed" | "retrying" | "failed" | "skipped", ...}
+    {"event": "summary", "completed": 10, "failed": 1, "skipped": 2, "cancelled": 0}
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+from command_builder import build_command, validate_options, find_output_files
+from eta_estimator import get_profile_key, ThroughputHistory
+from presets import get_preset, get_preset_names
+from process_runner import ProcessRunner, OUTPUT, FINISHED, ERROR
+from processing_queue import ProcessingQueue, JobStatus, SchedulingPolicy
+from progress_parser import ProgressTracker
+from result_index import find_previous_results, reuse_outputs, record_result
+from retry_policy import (
+    RetryPolicy, classify_failure, get_fallback_options, FAILURE_DESCRIPTIONS, OUT_OF_MEMORY, OUTPUT_TAIL_LINES
+)
+
+
+MEDIA_EXTENSIONS = {'.mp3', '.mp4', '.wav', '.m4a', '.flac', '.mkv', '.avi', '.mov', '.wmv'}
+PROGRESS_INTERVAL = 1.0  # Seconds between progress events per job
+
+# Command-line names of the scheduling policies
+ORDER_CHOICES = {
+    "fifo": SchedulingPolicy.FIFO,
+    "shortest": SchedulingPolicy.SHORTEST_FIRST,
+    "priority": SchedulingPolicy.PRIORITY,
+    "fair": SchedulingPolicy.FAIR_SHARE,
+}
+
+# Exit codes
+EXIT_OK = 0
+EXIT_FAILED = 1  # Some files failed
+EXIT_USAGE = 2  # Invalid arguments, options or inputs
+EXIT_CANCELLED = 130
+
+
+def emit(event, **fields):
+    """Print one machine-readable event as a JSON line."""
+    record = {"event": event, "time": round(time.time(), 3)}
+    record.update(fields)
+    print(json.dumps(record, default=str), flush=True)
+
+
+def collect_inputs(paths):
+    """Expand files and folders (recursively) to a sorted list of media files."""
+    files = []
+    for path_str in paths:
+        path = Path(path_str)
+        if path.is_file():
+            files.append(str(path))
+        elif path.is_dir():
+            files.extend(sorted(str(f) for f in path.rglob('*') if f.suffix.lower() in MEDIA_EXTENSIONS))
+        else:
+            emit("warning", message=f"Input not found: {path_str}")
+    return files
+
+
+def load_manifest(manifest_path):
+    """
+    Read a manifest of files to transcribe.
+    
+    Each non-empty line is either a file or folder path, or a JSON object with
+    "input" and optionally "output_dir", "priority" and "options" (overriding the
+    preset for that file). Lines starting with # are ignored.
+    
+    Returns:
+        List of entry dictionaries with at least "input"
+    """
+    entries = []
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                try:
+                    entry = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"{manifest_path}:{line_number}: invalid JSON: {e}")
+                if not entry.get("input"):
+                    raise ValueError(f"{manifest_path}:{line_number}: missing \"input\"")
+                for input_file in collect_inputs([entry["input"]]):
+                    entries.append(dict(entry, input=input_file))
+            else:
+                entries.extend({"input": input_file} for input_file in collect_inputs([line]))
+    return entries
+
+
+def check_gpu_available():
+    """Check if an NVIDIA GPU is available (without importing torch)."""
+    try:
+        result = subprocess.run(['nvidia-smi'], capture_output=True, timeout=2)
+        return result.returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def build_options(args):
+    """Build the shared options from the preset and command-line overrides."""
+    options = get_preset(args.preset)
+    if args.model:
+        options["model"] = args.model
+    if args.language:
+        options["language"] = args.language
+    if args.device:
+        options["device"] = args.device
+    if args.compute_type:
+        options["compute_type"] = args.compute_type
+    if args.formats:
+        options["output_formats"] = args.formats
+    for item in args.option or []:
+        key, _, value = item.partition("=")
+        try:
+            options[key] = json.loads(value)
+        except ValueError:
+            options[key] = value  # Plain string
+    options.setdefault("print_progress", True)  # Needed for progress events
+    return options
+
+
+class BatchRunner:
+    """Drives a ProcessingQueue with a ProcessRunner and reports progress as events."""
+    
+    def __init__(self, queue, runner, exe_path=None, history=None):
+        """
+        Initialize the batch runner.
+        
+        Args:
+            queue: ProcessingQueue with the jobs to run
+            runner: ProcessRunner to run the jobs with
+            exe_path: Executable to run (default: the extracted faster-whisper-xxl.exe)
+            history: ThroughputHistory to record measured speeds in (optional)
+        """
+        self.queue = queue
+        self.runner = runner
+        self.exe_path = exe_path
+        self.history = history
+        self.trackers = {}  # Job id -> ProgressTracker
+        self.tails = {}  # Job id -> last output lines (to classify failures)
+        self.started = {}  # Job id -> start time
+        self.last_progress = {}  # Job id -> time of the last progress event
+        self.retry_at = {}  # Job id -> time a job waiting to retry becomes pending again
+        self.cancelled = False
+        self.cancel_requested = set()  # Ids of running jobs being cancelled individually
+        self._gpu_available = None
+    
+    def resolve_device(self, options):
+        """Resolve the device a set of options will run on ("auto" becomes cuda or cpu)."""
+        device = options.get("device") or "auto"
+        if device == "auto":
+            if self._gpu_available is None:
+                self._gpu_available = check_gpu_available()
+            return "cuda" if self._gpu_available else "cpu"
+        return device
+    
+    def run(self, skipped=0):
+        """
+        Run all pending jobs to completion.
+        
+        Args:
+            skipped: Number of files skipped before the run (reported in the summary)
+        
+        Returns:
+            Process exit code (EXIT_OK, EXIT_FAILED or EXIT_CANCELLED)
+        """
+        try:
+            while True:
+                self.requeue_due_retries()
+                self.start_jobs()
+                if self.runner.active_count() == 0 and not self.queue.has_pending_jobs() and not self.retry_at:
+                    break
+                event = self.runner.get_event(timeout=0.5)
+                if event:
+                    self.handle_event(*event)
+        except KeyboardInterrupt:
+            self.cancel()
+        
+        emit(
+            "summary",
+            completed=self.queue.get_completed_count(),
+            failed=self.queue.get_failed_count(),
+            skipped=skipped,
+            cancelled=self.queue.get_status_count(JobStatus.CANCELLED),
+        )
+        if self.cancelled:
+            return EXIT_CANCELLED
+        return EXIT_FAILED if self.queue.get_failed_count() else EXIT_OK
+    
+    def cancel(self):
+        """Stop running jobs and cancel everything left in the queue."""
+        self.cancelled = True
+        self.runner.cancel()
+        # Handle the remaining events of the running processes so their jobs are accounted for
+        # (jobs that had already finished complete normally, the others are marked cancelled)
+        while self.runner.active_count() > 0:
+            event = self.runner.get_event(timeout=0.5)
+            if event:
+                self.handle_event(*event)
+        for job in self.queue.jobs:
+            if job.status in (JobStatus.PENDING, JobStatus.RETRYING):
+                self.queue.mark_job_cancelled(job)
+                emit("cancelled", job_id=job.job_id, input=job.input_files[0])
+        self.retry_at = {}
+    
+    def cancel_job(self, job):
+        """
+        Cancel one job.
+        
+        Returns:
+            True if the job was pending, waiting to retry or running
+        """
+        if job.status in (JobStatus.PENDING, JobStatus.RETRYING):
+            self.retry_at.pop(job.job_id, None)
+            self.queue.mark_job_cancelled(job)
+            emit("cancelled", job_id=job.job_id, input=job.input_files[0])
+            return True
+        if job.status == JobStatus.PROCESSING:
+            # Marked cancelled once the process has exited (see on_finished)
+            self.cancel_requested.add(job.job_id)
+            self.runner.cancel(job.job_id)
+            return True
+        return False
+    
+    def start_jobs(self):
+        """Start pending jobs while worker slots are free."""
+        while self.runner.can_start():
+            job = self.queue.get_next_job()
+            if not job:
+                return
+            try:
+                exe_path, args = build_command(job.input_files, job.output_dir, job.options, self.exe_path)
+            except Exception as e:
+                self.queue.mark_job_failed(job, f"Failed to build command: {str(e)}")
+                emit("failed", job_id=job.job_id, input=job.input_files[0], error=job.error_message)
+                continue
+            
+            self.queue.mark_job_processing(job)
+            self.trackers[job.job_id] = ProgressTracker(
+                job.duration, job.input_files[0], get_profile_key(job.options, self.resolve_device(job.options))
+            )
+            self.tails[job.job_id] = deque(maxlen=OUTPUT_TAIL_LINES)
+            self.started[job.job_id] = time.time()
+            emit("started", job_id=job.job_id, input=job.input_files[0], attempt=job.attempts + 1,
+                 command=[exe_path] + args)
+            self.runner.start(job.job_id, exe_path, args)
+    
+    def handle_event(self, kind, job_id, value):
+        """Handle an event from the process runner."""
+        job = self.queue.get_job(job_id)
+        if job is None:
+            return
+        if kind == OUTPUT:
+            self.on_output(job, value)
+        elif kind == ERROR:
+            self.tails.setdefault(job_id, deque(maxlen=OUTPUT_TAIL_LINES)).append(value)
+            emit("error", job_id=job_id, input=job.input_files[0], message=value)
+        elif kind == FINISHED:
+            self.on_finished(job, value)
+    
+    def on_output(self, job, lines):
+        """Track progress from a job's output lines."""
+        self.tails[job.job_id].extend(lines)
+        tracker = self.trackers.get(job.job_id)
+        if not tracker or not tracker.feed(lines):
+            return
+        now = time.monotonic()
+        if now - self.last_progress.get(job.job_id, 0.0) < PROGRESS_INTERVAL:
+            return
+        self.last_progress[job.job_id] = now
+        eta = tracker.eta()
+        emit(
+            "progress",
+            job_id=job.job_id,
+            input=job.input_files[0],
+            fraction=round(tracker.fraction, 4) if tracker.fraction is not None else None,
+            position=tracker.position,
+            duration=tracker.duration,
+            eta_seconds=round(eta, 1) if eta is not None else None,
+        )
+    
+    def on_finished(self, job, exit_code):
+        """Mark a finished job completed, failed or waiting to retry."""
+        tracker = self.trackers.pop(job.job_id, None)
+        tail = list(self.tails.pop(job.job_id, ()))
+        started = self.started.pop(job.job_id, None)
+        self.last_progress.pop(job.job_id, None)
+        if job.status != JobStatus.PROCESSING:
+            return
+        if exit_code == -1 and (self.cancelled or job.job_id in self.cancel_requested):
+            self.cancel_requested.discard(job.job_id)
+            self.queue.mark_job_cancelled(job)
+            emit("cancelled", job_id=job.job_id, input=job.input_files[0])
+            return
+        
+        output_files = []
+        for input_file in job.input_files:
+            output_files.extend(find_output_files(input_file, job.output_dir, job.options, started))
+        
+        # Treat as success if exit_code==0 OR if outputs were produced (see FasterWhisperGUI.finish_queue_job)
+        if exit_code == 0 or output_files:
+            self.queue.mark_job_completed(job, [str(f) for f in output_files])
+            record_result(job.input_files[0], job.options, output_files)
+            if tracker and self.history and tracker.fraction is not None and tracker.fraction >= 0.95:
+                # Remember the speed of completed files for future time estimates
+                self.history.record(tracker.profile, tracker.duration or tracker.position, tracker.elapsed)
+            emit("completed", job_id=job.job_id, input=job.input_files[0], exit_code=exit_code,
+                 outputs=[str(f) for f in output_files], rtf=round(tracker.rtf, 2) if tracker and tracker.rtf else None)
+            return
+        
+        error_msg = f"Process exited with code {exit_code}"
+        cause = classify_failure(tail, exit_code)
+        job.attempts += 1
+        if job.retry_policy.should_retry(cause, job.attempts):
+            if cause == OUT_OF_MEMORY:
+                fallback = get_fallback_options(job.options, self.resolve_device(job.options))
+                if fallback:
+                    self.queue.set_job_options(job, fallback)
+            delay = job.retry_policy.get_delay(job.attempts)
+            self.queue.mark_job_retrying(job, f"{FAILURE_DESCRIPTIONS[cause]}: {error_msg}")
+            self.retry_at[job.job_id] = time.monotonic() + delay
+            emit("retrying", job_id=job.job_id, input=job.input_files[0], cause=cause, attempt=job.attempts,
+                 delay_seconds=delay, compute_type=job.options.get("compute_type"))
+            return
+        
+        if job.attempts > 1:
+            error_msg = f"{error_msg} (after {job.attempts} attempts)"
+        self.queue.mark_job_failed(job, f"{FAILURE_DESCRIPTIONS[cause]}: {error_msg}")
+        emit("failed", job_id=job.job_id, input=job.input_files[0], cause=cause, error=job.error_message,
+             output_tail=tail[-10:])
+    
+    def requeue_due_retries(self):
+        """Make jobs whose retry delay has passed pending again."""
+        now = time.monotonic()
+        for job_id, retry_time in list(self.retry_at.items()):
+            if retry_time <= now:
+                del self.retry_at[job_id]
+                job = self.queue.get_job(job_id)
+                if job is not None:
+                    self.queue.requeue_job(job)
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Transcribe files with faster-whisper-xxl without the GUI. "
+                    "Progress is printed as JSON lines."
+    )
+    parser.add_argument("inputs", nargs="*", help="Media files or folders (searched recursively)")
+    parser.add_argument("--manifest", help="File with one path or JSON object per line (see module docstring)")
+    parser.add_argument("--preset", default="Standard", choices=get_preset_names(), help="Preset to use (default: Standard)")
+    parser.add_argument("-o", "--output", default="source",
+                        help="Output folder (default: \"source\" - next to each input file)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Files processed in parallel (default: 1)")
+    parser.add_argument("--order", choices=list(ORDER_CHOICES), default="fifo", help="Processing order (default: fifo)")
+    parser.add_argument("--retries", type=int, default=RetryPolicy.max_attempts - 1,
+                        help=f"Retries after temporary failures (default: {RetryPolicy.max_attempts - 1})")
+    parser.add_argument("--no-skip", action="store_true",
+                        help="Transcribe files even if they were already transcribed with identical settings")
+    parser.add_argument("--exe", help="faster-whisper-xxl executable (default: the one extracted by the GUI)")
+    parser.add_argument("--model", help="Override the preset's model")
+    parser.add_argument("--language", help="Override the preset's language")
+    parser.add_argument("--device", choices=["auto", "cuda", "cpu"], help="Override the device")
+    parser.add_argument("--compute-type", help="Override the compute type")
+    parser.add_argument("--formats", nargs="+", help="Override the output formats (e.g. srt txt)")
+    parser.add_argument("--option", action="append", metavar="KEY=VALUE",
+                        help="Set any option (value parsed as JSON if possible); repeatable")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    args = parse_args(argv)
+    options = build_options(args)
+    
+    entries = [{"input": f} for f in collect_inputs(args.inputs)]
+    if args.manifest:
+        try:
+            entries.extend(load_manifest(args.manifest))
+        except (OSError, ValueError) as e:
+            emit("error", message=f"Cannot read manifest: {e}")
+            return EXIT_USAGE
+    if not entries:
+        emit("error", message="No media files to process")
+        return EXIT_USAGE
+    
+    # Validate each distinct set of options once
+    file_options = {}
+    for entry in entries:
+        file_options[entry["input"]] = dict(options, **entry["options"]) if entry.get("options") else options
+    for entry_options in {id(o): o for o in file_options.values()}.values():
+        is_valid, error_msg = validate_options(entry_options)
+        if not is_valid:
+            emit("error", message=f"Invalid options: {error_msg}")
+            return EXIT_USAGE
+    
+    skipped = {}
+    if not args.no_skip:
+        skipped = find_previous_results(file_options)
+    
+    queue = ProcessingQueue(ORDER_CHOICES[args.order])
+    if queue.policy == SchedulingPolicy.SHORTEST_FIRST:
+        from file_info_extractor import probe_files
+        durations = {path: (info or {}).get("duration") for path, info in probe_files(list(file_options)).items()}
+    else:
+        durations = {}
+    
+    for entry in entries:
+        input_file = entry["input"]
+        output_dir = entry.get("output_dir") or args.output
+        if input_file in skipped:
+            outputs = reuse_outputs(skipped[input_file], input_file, output_dir)
+            if outputs:
+                emit("skipped", input=input_file, outputs=outputs,
+                     reason="Already transcribed with identical settings")
+                continue
+        if output_dir != "source":
+            Path(output_dir).mkdir(parents=True, exist_ok=True)
+        job = queue.add_job(
+            [input_file], output_dir, file_options[input_file],
+            priority=int(entry.get("priority", 0)),
+            duration=durations.get(input_file),
+            retry_policy=RetryPolicy(max_attempts=max(0, args.retries) + 1)
+        )
+        emit("queued", job_id=job.job_id, input=input_file, output_dir=output_dir)
+    
+    runner = ProcessRunner(args.jobs)
+    batch = BatchRunner(queue, runner, args.exe, ThroughputHistory())
+    return batch.run(skipped=len(entries) - len(queue.jobs))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
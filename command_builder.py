@@ -3,12 +3,26 @@ Command builder for Faster Whisper GUI.
 Converts GUI selections to command-line arguments for faster-whisper-xxl.exe
 """
 
+import glob
 import os
 import shlex
 import sys
 from pathlib import Path
 
 
+# File extension written for each output format
+OUTPUT_FORMAT_EXTENSIONS = {
+    "srt": ".srt",
+    "vtt": ".vtt",
+    "txt": ".txt",
+    "text": ".text",
+    "json": ".json",
+    "lrc": ".lrc",
+    "tsv": ".tsv",
+}
+DEFAULT_OUTPUT_FORMAT = "srt"  # Used by faster-whisper-xxl when no format is given
+
+
 def get_script_dir():
     """Get the directory where bundled files are located (for finding faster-whisper-xxl.exe, etc.)."""
     if getattr(sys, 'frozen', False):
@@ -37,7 +51,7 @@ def get_user_data_dir():
         return Path(__file__).parent
 
 
-def build_command(input_files, output_dir, options):
+def build_command(input_files, output_dir, options, exe_path=None):
     """
     Build command-line arguments for faster-whisper-xxl.exe
     
@@ -45,19 +59,24 @@ def build_command(input_files, output_dir, options):
         input_files: List of input file paths
         output_dir: Output directory path
         options: Dictionary of option values from GUI
+        exe_path: Executable to run (default: faster-whisper-xxl.exe in the user data directory)
     
     Returns:
         Tuple of (executable_path, args_list) for subprocess
     """
     # Find executable in user data directory (extracted files)
     user_data_dir = get_user_data_dir()
-    exe_path = user_data_dir / "faster-whisper-xxl.exe"
-    
-    if not exe_path.exists():
-        raise FileNotFoundError(
-            f"faster-whisper-xxl.exe not found in {user_data_dir}. "
-            "Please run the application once to extract required files."
-        )
+    if exe_path:
+        exe_path = Path(exe_path)
+        if not exe_path.exists():
+            raise FileNotFoundError(f"Executable not found: {exe_path}")
+    else:
+        exe_path = user_data_dir / "faster-whisper-xxl.exe"
+        if not exe_path.exists():
+            raise FileNotFoundError(
+                f"faster-whisper-xxl.exe not found in {user_data_dir}. "
+                "Please run the application once to extract required files."
+            )
     
     args = []
     
@@ -266,6 +285,80 @@ def build_command(input_files, output_dir, options):
     return str(exe_path), args
 
 
+def get_output_dir_for_input(input_file, output_dir):
+    """Get the directory faster-whisper-xxl writes an input file's outputs to."""
+    if not output_dir or output_dir == "source" or Path(output_dir).name.lower() == "source":
+        return Path(input_file).parent
+    return Path(output_dir)
+
+
+def get_expected_output_files(input_file, output_dir, options):
+    """
+    Get the output file paths a run will write for an input file.
+    
+    Args:
+        input_file: Input file path
+        output_dir: Output directory path ("source" for the input file's folder)
+        options: Dictionary of option values from GUI
+    
+    Returns:
+        List of Path objects, one per output format
+    """
+    formats = options.get("output_formats") or [DEFAULT_OUTPUT_FORMAT]
+    if not isinstance(formats, list):
+        formats = [formats]
+    if "all" in formats:
+        formats = list(OUTPUT_FORMAT_EXTENSIONS)
+    
+    target_dir = get_output_dir_for_input(input_file, output_dir)
+    stem = Path(input_file).stem
+    expected = []
+    for output_format in formats:
+        extension = OUTPUT_FORMAT_EXTENSIONS.get(str(output_format).lower())
+        if extension:
+            path = target_dir / f"{stem}{extension}"
+            if path not in expected:
+                expected.append(path)
+    return expected
+
+
+def find_output_files(input_file, output_dir, options, since=None):
+    """
+    Find the output files a finished run wrote for an input file.
+    
+    The expected output paths are checked first. If none of them exists (the executable
+    named its outputs differently), files named after the input are searched for in the
+    output directory.
+    
+    Args:
+        input_file: Input file path
+        output_dir: Output directory path ("source" for the input file's folder)
+        options: Dictionary of option values the run used
+        since: Time the run started; older files are left out
+    
+    Returns:
+        List of Path objects
+    """
+    since = since - 2 if since else 0  # File systems with coarse timestamps (FAT: 2 seconds)
+    
+    def is_new(path):
+        try:
+            return path.stat().st_mtime >= since
+        except OSError:
+            return False
+    
+    found = [path for path in get_expected_output_files(input_file, output_dir, options) if is_new(path)]
+    if found:
+        return found
+    
+    search_dir = get_output_dir_for_input(input_file, output_dir)
+    if search_dir.exists():
+        stem = glob.escape(Path(input_file).stem)
+        for ext in ['.txt', '.srt', '.vtt', '.json']:
+            found.extend(path for path in search_dir.glob(f"{stem}*{ext}") if is_new(path))
+    return found
+
+
 def validate_options(options):
     """
     Validate options dictionary for common issues.
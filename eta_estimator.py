@@ -0,0 +1,153 @@
+"""
+Time remaining estimation for Faster Whisper GUI.
+Combines probed file durations with real-time factors measured for each combination
+of model, device, compute type and diarization, remembered across sessions.
+"""
+
+import json
+import threading
+from pathlib import Path
+
+from file_info_extractor import get_user_data_dir
+
+
+HISTORY_FILENAME = "throughput_history.json"
+HISTORY_WEIGHT = 0.3  # Weight of the newest measurement in the moving average
+MIN_MEASURED_SECONDS = 10.0  # Shorter runs are dominated by startup time and are not recorded
+
+
+def get_profile_key(options, device=None):
+    """
+    Get the throughput profile of a set of options.
+    
+    Args:
+        options: Options dictionary
+        device: Resolved device (overrides options["device"], e.g. when it is "auto")
+    
+    Returns:
+        String key "model|device|compute_type|diarize"
+    """
+    return "|".join((
+        str(options.get("model") or "unknown"),
+        str(device or options.get("device") or "auto"),
+        str(options.get("compute_type") or "auto"),
+        "diarize" if options.get("diarize_enable") else "plain",
+    ))
+
+
+class ThroughputHistory:
+    """Moving average of measured real-time factors per throughput profile, stored as JSON."""
+    
+    def __init__(self, path=None):
+        """
+        Initialize the history.
+        
+        Args:
+            path: JSON file (default: user data directory)
+        """
+        self.path = Path(path) if path else get_user_data_dir() / HISTORY_FILENAME
+        self._lock = threading.Lock()
+        self._profiles = {}  # Profile key -> {"rtf": float, "samples": int}
+        try:
+            if self.path.exists():
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._profiles = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading throughput history: {e}")
+            self._profiles = {}
+    
+    def get_rtf(self, profile):
+        """Get the average real-time factor for a profile (None if never measured)."""
+        entry = self._profiles.get(profile)
+        return entry["rtf"] if entry else None
+    
+    def record(self, profile, audio_seconds, wall_seconds):
+        """Record a finished file: audio_seconds were transcribed in wall_seconds."""
+        if not audio_seconds or wall_seconds < MIN_MEASURED_SECONDS:
+            return
+        rtf = audio_seconds / wall_seconds
+        with self._lock:
+            entry = self._profiles.get(profile)
+            if entry:
+                entry["rtf"] = (1 - HISTORY_WEIGHT) * entry["rtf"] + HISTORY_WEIGHT * rtf
+                entry["samples"] += 1
+            else:
+                self._profiles[profile] = {"rtf": rtf, "samples": 1}
+            try:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(self._profiles, f, indent=2)
+            except OSError as e:
+                print(f"Error saving throughput history: {e}")
+
+
+class EtaEstimator:
+    """Estimates the wall time remaining for running and pending files."""
+    
+    def __init__(self, history=None):
+        """
+        Initialize the estimator.
+        
+        Args:
+            history: ThroughputHistory to use (default: the one in the user data directory)
+        """
+        self.history = history or ThroughputHistory()
+    
+    def get_rtf(self, profile, live_rtfs):
+        """Real-time factor for a profile: measured in this run if possible, otherwise from history."""
+        rates = live_rtfs.get(profile)
+        if rates:
+            return sum(rates) / len(rates)
+        return self.history.get_rtf(profile)
+    
+    def estimate(self, running, pending, workers=1):
+        """
+        Estimate the wall seconds until all files are done.
+        
+        Args:
+            running: List of (ProgressTracker, profile) for files being processed
+            pending: Dictionary profile -> (seconds of known durations, files of known duration,
+                files of unknown duration) for files not started (see ProcessingQueue.get_waiting_totals())
+            workers: Number of files processed in parallel
+        
+        Returns:
+            Seconds remaining, or None if there is no speed measurement to base it on
+        """
+        # Speeds observed on the running files reflect the current machine load best
+        live_rtfs = {}
+        for tracker, profile in running:
+            if tracker.rtf and tracker.fraction:
+                live_rtfs.setdefault(profile, []).append(tracker.rtf)
+        
+        running_remaining = []
+        for tracker, profile in running:
+            remaining = tracker.eta()
+            if remaining is None:
+                rtf = self.get_rtf(profile, live_rtfs)
+                if rtf is None or not tracker.duration:
+                    return None
+                if tracker.fraction:
+                    remaining = tracker.duration * (1.0 - tracker.fraction) / rtf
+                else:
+                    # Not started transcribing yet - expected total time minus the time already spent
+                    remaining = max(0.0, tracker.duration / rtf - tracker.elapsed)
+            running_remaining.append(remaining)
+        
+        # Files of unknown duration count as the average known one
+        known_seconds = sum(seconds for seconds, _, _ in pending.values())
+        known_files = sum(files for _, files, _ in pending.values())
+        average_duration = known_seconds / known_files if known_files else None
+        pending_seconds = 0.0
+        for profile, (seconds, _, unknown_files) in pending.items():
+            rtf = self.get_rtf(profile, live_rtfs)
+            if unknown_files:
+                if not average_duration:
+                    return None
+                seconds += unknown_files * average_duration
+            if rtf is None:
+                return None
+            pending_seconds += seconds / rtf
+        
+        # Pending files are spread over the workers; the slowest running file bounds the total
+        workers = max(1, workers)
+        longest_running = max(running_remaining, default=0.0)
+        return max(longest_running, (sum(running_remaining) + pending_seconds) / workers)
@@ -0,0 +1,141 @@
+"""
+Stand-in for faster-whisper-xxl.exe, for trying out the queue, the headless runner
+and the job daemon on machines without the real executable or a GPU.
+
+Accepts the same command line as built by command_builder.build_command, prints
+output in the real executable's format (duration line, -pp progress lines and
+segments) and writes small placeholder output files in the requested formats.
+
+Behavior can be changed with environment variables:
+    FAKE_WHISPER_SECONDS: Audio seconds reported per file (default: 30)
+    FAKE_WHISPER_DELAY: Wall seconds spent per file (default: 1)
+    FAKE_WHISPER_FAIL: Fail instead of writing outputs - "oom", "locked", "crash" or "error"
+    FAKE_WHISPER_FAIL_MATCH: Only fail for input files whose name contains this text
+
+Usage:
+    python cli_runner.py INPUT --exe fake_faster_whisper.py
+    python job_daemon.py --exe fake_faster_whisper.py
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from command_builder import OUTPUT_FORMAT_EXTENSIONS, DEFAULT_OUTPUT_FORMAT, get_output_dir_for_input
+
+
+# Options that take no value (see command_builder.build_command)
+FLAGS = {"--sentence", "--batch_recursive", "--check_files", "-pp"}
+
+# Output printed and exit code used for each simulated failure
+FAILURES = {
+    "oom": ("RuntimeError: CUDA failed with error out of memory", 1),
+    "locked": ("PermissionError: [Errno 13] Permission denied", 1),
+    "crash": ("Segmentation fault", 3221225477),
+    "error": ("ValueError: something went wrong", 1),
+}
+
+
+def parse_command_line(argv):
+    """
+    Split a faster-whisper-xxl command line into input files and options.
+    
+    Returns:
+        Tuple (list of input files, dictionary option name -> list of values)
+    """
+    inputs = []
+    options = {}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if not arg.startswith("-"):
+            inputs.append(arg)
+            i += 1
+            continue
+        values = []
+        i += 1
+        if arg not in FLAGS:
+            while i < len(argv) and not argv[i].startswith("-"):
+                values.append(argv[i])
+                i += 1
+                if arg != "-f":
+                    break  # Only the format list takes several values
+        options[arg] = values
+    return inputs, options
+
+
+def format_timestamp(seconds):
+    """Format seconds as MM:SS.mmm."""
+    minutes, seconds = divmod(seconds, 60)
+    return f"{int(minutes):02d}:{seconds:06.3f}"
+
+
+def write_outputs(input_file, output_dir, formats, audio_seconds):
+    """Write placeholder output files for an input."""
+    target_dir = get_output_dir_for_input(input_file, output_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    stem = Path(input_file).stem
+    text = f"Placeholder transcript of {Path(input_file).name}"
+    end = format_timestamp(audio_seconds)
+    for output_format in formats:
+        extension = OUTPUT_FORMAT_EXTENSIONS.get(output_format)
+        if not extension:
+            continue
+        if output_format == "srt":
+            content = f"1\n00:00:00,000 --> 00:{end.replace('.', ',')}\n{text}\n"
+        elif output_format == "vtt":
+            content = f"WEBVTT\n\n00:00.000 --> {end}\n{text}\n"
+        elif output_format == "json":
+            content = json.dumps({"segments": [{"start": 0.0, "end": audio_seconds, "text": text}]})
+        else:
+            content = f"[00:00.000 --> {end}] {text}\n"
+        with open(target_dir / f"{stem}{extension}", "w", encoding="utf-8") as f:
+            f.write(content)
+        print(f"Subtitles are written to '{target_dir}' directory.", flush=True)
+
+
+def main(argv=None):
+    """Simulate a transcription run."""
+    inputs, options = parse_command_line(sys.argv[1:] if argv is None else argv)
+    if not inputs:
+        print("error: no input files", flush=True)
+        return 2
+    
+    audio_seconds = float(os.getenv("FAKE_WHISPER_SECONDS", "30"))
+    delay = float(os.getenv("FAKE_WHISPER_DELAY", "1"))
+    failure = os.getenv("FAKE_WHISPER_FAIL")
+    fail_match = os.getenv("FAKE_WHISPER_FAIL_MATCH")
+    formats = options.get("-f") or [DEFAULT_OUTPUT_FORMAT]
+    if "all" in formats:
+        formats = list(OUTPUT_FORMAT_EXTENSIONS)
+    output_dir = (options.get("-o") or ["source"])[0]
+    
+    print(f"Standalone Faster-Whisper-XXL (fake) running on: {(options.get('--device') or ['CPU'])[0].upper()}", flush=True)
+    for input_file in inputs:
+        if not Path(input_file).is_file():
+            print(f"File not found: {input_file}", flush=True)
+            continue
+        print(f"\nStarting transcription on: {input_file}", flush=True)
+        if failure in FAILURES and (not fail_match or fail_match in Path(input_file).name):
+            message, exit_code = FAILURES[failure]
+            print(message, flush=True)
+            return exit_code
+        
+        print(f"Processing audio with duration {format_timestamp(audio_seconds)}", flush=True)
+        steps = 4
+        for step in range(1, steps + 1):
+            time.sleep(delay / steps)
+            position = audio_seconds * step / steps
+            print(f"[{format_timestamp(position - audio_seconds / steps)} --> {format_timestamp(position)}] "
+                  f"Placeholder segment {step}", flush=True)
+            print(f"{100 * step // steps:3d}% |{'#' * step * 2:<8}| {position:.1f}/{audio_seconds:.1f} "
+                  f"[00:00<00:00]", flush=True)
+        write_outputs(input_file, output_dir, formats, audio_seconds)
+    print("Operation finished", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
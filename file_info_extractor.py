@@ -3,6 +3,7 @@ Extract file information for display in the GUI.
 Uses ffprobe if available, otherwise provides basic info.
 """
 
+import json
 import os
 from pathlib import Path
 import subprocess
@@ -36,6 +37,8 @@ def get_file_info(file_path):
     - duration_formatted: Human-readable duration (if available)
     - codec: Audio/video codec (if available)
     - bitrate: Bitrate (if available)
+    - sample_rate: Sample rate in Hz (if available)
+    - channels: Audio channel count (if available)
     - has_info: Whether detailed info is available
     """
     info = {
@@ -46,6 +49,8 @@ def get_file_info(file_path):
         "duration_formatted": "Unknown",
         "codec": "Unknown",
         "bitrate": "Unknown",
+        "sample_rate": None,
+        "channels": None,
         "has_info": False
     }
     
@@ -59,10 +64,10 @@ def get_file_info(file_path):
         info["size_formatted"] = format_size(info["size"])
         info["format"] = path.suffix.upper().lstrip('.') or "Unknown"
         
-        # Try to get detailed info using ffprobe
-        ffprobe_path = find_ffprobe()
-        if ffprobe_path:
-            detailed_info = get_ffprobe_info(ffprobe_path, file_path)
+        # Try to get detailed info using ffprobe (cached for unchanged files)
+        metadata = get_media_metadata(file_path)
+        if metadata:
+            detailed_info = format_metadata(metadata)
             if detailed_info:
                 info.update(detailed_info)
                 info["has_info"] = True
@@ -86,19 +91,28 @@ def get_user_data_dir():
         return Path(__file__).parent
 
 
+_ffprobe_path = None
+
+
 def find_ffprobe():
     """Find ffprobe executable."""
+    global _ffprobe_path
+    if _ffprobe_path:
+        return _ffprobe_path
+    
     # Check in user data directory first (extracted files)
     user_data_dir = get_user_data_dir()
     ffprobe = user_data_dir / "ffprobe.exe"
     if ffprobe.exists():
-        return str(ffprobe)
+        _ffprobe_path = str(ffprobe)
+        return _ffprobe_path
     
     # Check in same directory as script/executable (for non-frozen or legacy)
     script_dir = get_script_dir()
     ffprobe = script_dir / "ffprobe.exe"
     if ffprobe.exists():
-        return str(ffprobe)
+        _ffprobe_path = str(ffprobe)
+        return _ffprobe_path
     
     # Check if ffprobe is in PATH
     try:
@@ -106,22 +120,90 @@ def find_ffprobe():
                               capture_output=True, 
                               creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0)
         if result.returncode == 0:
-            return "ffprobe"
+            _ffprobe_path = "ffprobe"
+            return _ffprobe_path
     except:
         pass
     
     return None
 
 
-def get_ffprobe_info(ffprobe_path, file_path):
-    """Get detailed file info using ffprobe."""
+def get_media_metadata(file_path, use_cache=True):
+    """
+    Get raw media metadata for a file, using the persistent cache when possible.
+    
+    Returns a dictionary with duration (seconds), codec, bit_rate (bps),
+    sample_rate (Hz) and channels (any may be None), or None if the file
+    could not be probed.
+    """
+    cache = None
+    if use_cache:
+        from metadata_cache import get_metadata_cache
+        cache = get_metadata_cache()
+        metadata = cache.get(file_path)
+        if metadata is not None:
+            return metadata
+    
+    ffprobe_path = find_ffprobe()
+    if not ffprobe_path:
+        return None
+    
+    metadata = probe_metadata(ffprobe_path, file_path)
+    if metadata is not None and cache is not None:
+        cache.put(file_path, metadata)
+    return metadata
+
+
+def probe_files(file_paths, max_workers=None, callback=None, is_cancelled=None):
+    """
+    Get metadata for many files in parallel using a bounded thread pool.
+    
+    Args:
+        file_paths: List of file paths to probe
+        max_workers: Maximum concurrent ffprobe processes (default: based on CPU count)
+        callback: Optional function called with (file_path, metadata) as each file completes
+        is_cancelled: Optional function returning True to stop submitting work
+    
+    Returns:
+        Dictionary of file path -> metadata (None for files that could not be probed)
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    if max_workers is None:
+        max_workers = min(8, (os.cpu_count() or 1) + 2)
+    
+    results = {}
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {executor.submit(get_media_metadata, f): f for f in file_paths}
+        for future in as_completed(futures):
+            if is_cancelled and is_cancelled():
+                break
+            file_path = futures[future]
+            try:
+                metadata = future.result()
+            except Exception as e:
+                print(f"Error probing {file_path}: {e}")
+                metadata = None
+            results[file_path] = metadata
+            if callback:
+                callback(file_path, metadata)
+    finally:
+        # Drop queued probes if we stopped early
+        executor.shutdown(wait=True, cancel_futures=True)
+    
+    return results
+
+
+def probe_metadata(ffprobe_path, file_path, timeout=5):
+    """Run ffprobe on a file and return raw metadata (see get_media_metadata)."""
     try:
         cmd = [
             ffprobe_path,
             "-v", "error",
-            "-show_entries", "format=duration,bit_rate,format_name",
-            "-show_entries", "stream=codec_name,codec_type",
-            "-of", "default=noprint_wrappers=1",
+            "-show_entries", "format=duration,bit_rate",
+            "-show_entries", "stream=codec_name,codec_type,sample_rate,channels,bit_rate",
+            "-of", "json",
             str(file_path)
         ]
         
@@ -130,43 +212,77 @@ def get_ffprobe_info(ffprobe_path, file_path):
             capture_output=True,
             text=True,
             creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0,
-            timeout=5
+            timeout=timeout
         )
         
         if result.returncode != 0:
             return None
         
-        info = {}
-        lines = result.stdout.split('\n')
-        
-        for line in lines:
-            if '=' in line:
-                key, value = line.split('=', 1)
-                if key == 'duration' and value:
-                    try:
-                        duration = float(value)
-                        info["duration"] = duration
-                        info["duration_formatted"] = format_duration(duration)
-                    except:
-                        pass
-                elif key == 'bit_rate' and value:
-                    try:
-                        bitrate = int(value)
-                        info["bitrate"] = format_bitrate(bitrate)
-                    except:
-                        pass
-                elif key == 'codec_name' and 'codec_type' in line:
-                    # This is simplified - real parsing would be more complex
-                    if 'audio' in line.lower() or not info.get("codec"):
-                        info["codec"] = value
-        
-        return info if info else None
+        return parse_ffprobe_json(result.stdout)
         
     except Exception as e:
         print(f"Error running ffprobe: {e}")
         return None
 
 
+def parse_ffprobe_json(output):
+    """Parse ffprobe JSON output into a raw metadata dictionary."""
+    def to_number(value, cast):
+        try:
+            return cast(value)
+        except (TypeError, ValueError):
+            return None
+    
+    try:
+        data = json.loads(output or "{}")
+    except ValueError:
+        return None
+    
+    fmt = data.get("format", {})
+    streams = data.get("streams", [])
+    
+    # Prefer the first audio stream (video files also contain a video stream)
+    audio = next((st for st in streams if st.get("codec_type") == "audio"), None)
+    stream = audio or (streams[0] if streams else {})
+    
+    metadata = {
+        "duration": to_number(fmt.get("duration"), float),
+        "codec": stream.get("codec_name"),
+        "bit_rate": to_number(fmt.get("bit_rate") or stream.get("bit_rate"), int),
+        "sample_rate": to_number(stream.get("sample_rate"), int) if audio else None,
+        "channels": to_number(stream.get("channels"), int) if audio else None,
+    }
+    if all(value is None for value in metadata.values()):
+        return None
+    return metadata
+
+
+def format_metadata(metadata):
+    """Convert raw metadata into the display fields used by get_file_info."""
+    info = {}
+    if metadata.get("duration") is not None:
+        info["duration"] = metadata["duration"]
+        info["duration_formatted"] = format_duration(metadata["duration"])
+    if metadata.get("bit_rate"):
+        info["bitrate"] = format_bitrate(metadata["bit_rate"])
+    if metadata.get("codec"):
+        info["codec"] = metadata["codec"]
+    if metadata.get("sample_rate"):
+        info["sample_rate"] = metadata["sample_rate"]
+    if metadata.get("channels"):
+        info["channels"] = metadata["channels"]
+    return info
+
+
+def get_ffprobe_info(ffprobe_path, file_path):
+    """Get detailed file info using ffprobe (bypasses the metadata cache)."""
+    metadata = probe_metadata(ffprobe_path, file_path)
+    if not metadata:
+        return None
+    info = format_metadata(metadata)
+    return info if info else None
+
+
 def format_size(size_bytes):
     """Format file size in human-readable format."""
     for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
@@ -6,7 +6,9 @@ Provides a user-friendly interface for faster-whisper-xxl.exe
 import sys
 import os
 import time
+import multiprocessing
 import subprocess
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timedelta
 from PyQt6.QtWidgets import (
@@ -18,7 +20,11 @@ from PyQt6.QtWidgets import (
     QMenuBar, QMenu
 )
 from PyQt6.QtCore import Qt, QThread, QTimer, QMimeData, QEvent
-from PyQt6.QtGui import QIcon, QFont, QKeySequence, QShortcut, QDragEnterEvent, QDropEvent, QWheelEvent
+from PyQt6.QtGui import QIcon, QFont, QKeySequence, QShortcut, QDragEnterEvent, QDropEvent, QWheelEvent, QTextCursor
+
+
+MAX_OUTPUT_LINES = 5000  # Lines kept in the output area (the full output is in the log files)
+OUTPUT_PAGE_LINES = 2000  # Older lines loaded back from the log per "Load Older Output" click
 
 
 class NoWheelComboBox(QComboBox):
@@ -27,7 +33,7 @@ class NoWheelComboBox(QComboBox):
         """Ignore wheel events to prevent accidental value changes."""
         event.ignore()  # Don't process the wheel event
 
-from command_builder import build_command, validate_options
+from command_builder import build_command, validate_options, get_expected_output_files, find_output_files
 from process_manager import ProcessManager
 from presets import get_preset, get_preset_names
 from help_texts import get_tooltip, get_detailed_help
@@ -39,7 +45,19 @@ from speaker_replacement_dialog import SpeakerReplacementDialog
 from timestamp_removal_dialog import TimestampRemovalDialog
 from queue_settings_dialog import QueueSettingsDialog
 from queue_window import QueueWindow
-from audio_analyzer import analyze_audio_quality
+from audio_analysis_dialog import AudioAnalysisDialog
+from bulk_probe import BulkProbeWorker
+from output_log import RotatingLog, get_log_dir, make_log_name, cleanup_old_logs
+from progress_parser import ProgressTracker, parse_file_start
+from eta_estimator import EtaEstimator, get_profile_key
+from queue_journal import QueueJournal
+from result_index import find_previous_results, reuse_outputs, record_result
+from output_watcher import OutputWatcher
+from warm_backend import WARM_BACKEND_AVAILABLE, get_exe_only_features, get_model_key
+from model_pool import get_model_pool, DEFAULT_MEMORY_BUDGET_MB
+from retry_policy import (
+    RetryPolicy, classify_failure, get_fallback_options, FAILURE_DESCRIPTIONS, OUT_OF_MEMORY, OUTPUT_TAIL_LINES
+)
 
 
 def check_gpu_available():
@@ -130,7 +148,7 @@ class BestPracticesDialog(QDialog):
 • Set exact speaker count - This dramatically improves accuracy
 • Use pyannote_v3.1 method (latest and most accurate)
 • Enable "Diarize After Filters" for better results when using audio filters"""
-        
+
         content_text.setPlainText(tips)
         layout.addWidget(content_text)
         
@@ -336,7 +354,7 @@ NEED MORE HELP?
 --------------------------------------------------
 Click the '?' buttons throughout the interface for detailed help on specific options.
 For technical documentation, visit: https://github.com/Purfview/whisper-standalone-win"""
-        
+
         help_text.setPlainText(help_content)
         help_text.setFont(QFont("Arial", 10))
         layout.addWidget(help_text)
@@ -357,7 +375,13 @@ class FasterWhisperGUI(QMainWindow):
         self.input_files = []
         self.output_dir = ""
         self.process_manager = ProcessManager()
-        self.queue = ProcessingQueue()
+        # Queue changes are journaled so an interrupted queue can be resumed after a restart
+        self.queue_journal = QueueJournal()
+        self.queue = ProcessingQueue(journal=self.queue_journal)
+        # Jobs using a model that is already loaded run before jobs that need another one
+        self.queue.set_grouping(lambda job: get_model_key(job.options))
+        # Durations of waiting jobs are totaled per throughput profile for the time remaining
+        self.queue.set_profiling(lambda job: get_profile_key(job.options, self.get_job_device(job)))
         self.processing_start_time = None
         self.current_file_index = 0
         self.total_files = 0
@@ -365,6 +389,22 @@ class FasterWhisperGUI(QMainWindow):
         self.output_files_generated = []
         self.queue_window = None
         self.current_queue_file_index = 0
+        self.file_durations = {}  # Input file path -> duration in seconds (from probing)
+        self.probe_worker = None
+        self.analysis_dialog = None
+        self.file_option_overrides = {}  # Input file path -> options suggested by audio analysis
+        self.single_run_options = None  # Options of the running single-file transcription
+        # Everything shown in the output area is also streamed to disk so it can be paged back in
+        cleanup_old_logs()
+        self.console_log = RotatingLog(make_log_name("console"))
+        self.job_logs = {}  # Job key -> RotatingLog with that job's own output
+        self.progress_trackers = {}  # Job key -> ProgressTracker parsing that job's output
+        self.job_output_tails = {}  # Job id -> last output lines (to classify failures)
+        self.expected_outputs = {}  # Job key -> output files its command will write
+        self.batched_job_ids = set()  # Queue jobs running as part of a batched invocation
+        self.output_watcher = OutputWatcher(self)
+        self.output_watcher.file_ready.connect(self.on_output_file_ready)
+        self.eta_estimator = EtaEstimator()
         
         # Enable drag and drop
         self.setAcceptDrops(True)
@@ -375,6 +415,8 @@ class FasterWhisperGUI(QMainWindow):
         self.load_defaults()
         # Update reminders after loading defaults
         self.update_reminders()
+        # Offer to resume once the window is shown
+        QTimer.singleShot(0, self.offer_queue_resume)
     
     def init_ui(self):
         """Initialize the user interface."""
@@ -981,6 +1023,87 @@ class FasterWhisperGUI(QMainWindow):
         batch_layout.addStretch()
         advanced_layout.addLayout(batch_layout)
         
+        # Parallel queue jobs
+        parallel_layout = QHBoxLayout()
+        parallel_layout.addWidget(QLabel("Parallel Jobs:"))
+        self.parallel_jobs_spin = QSpinBox()
+        self.parallel_jobs_spin.setMinimum(1)
+        self.parallel_jobs_spin.setMaximum(max(1, os.cpu_count() or 1))
+        self.parallel_jobs_spin.setValue(1)  # Sequential by default
+        self.add_tooltip(self.parallel_jobs_spin, "parallel_jobs")
+        parallel_layout.addWidget(self.parallel_jobs_spin)
+        parallel_layout.addStretch()
+        self.add_help_button(parallel_layout, "parallel_jobs")
+        advanced_layout.addLayout(parallel_layout)
+        
+        # Batched invocations (several queued files per process)
+        files_per_process_layout = QHBoxLayout()
+        files_per_process_layout.addWidget(QLabel("Files per Process:"))
+        self.files_per_process_spin = QSpinBox()
+        self.files_per_process_spin.setMinimum(1)
+        self.files_per_process_spin.setMaximum(100)
+        self.files_per_process_spin.setValue(1)  # One file per process by default
+        self.add_tooltip(self.files_per_process_spin, "files_per_process")
+        files_per_process_layout.addWidget(self.files_per_process_spin)
+        files_per_process_layout.addWidget(QLabel("Max Minutes per Process:"))
+        self.max_batch_minutes_spin = QSpinBox()
+        self.max_batch_minutes_spin.setMinimum(0)
+        self.max_batch_minutes_spin.setMaximum(1440)
+        self.max_batch_minutes_spin.setValue(0)
+        self.max_batch_minutes_spin.setSpecialValueText("No limit")
+        files_per_process_layout.addWidget(self.max_batch_minutes_spin)
+        files_per_process_layout.addStretch()
+        self.add_help_button(files_per_process_layout, "files_per_process")
+        advanced_layout.addLayout(files_per_process_layout)
+        
+        # Reuse results of unchanged files transcribed with the same settings
+        skip_transcribed_layout = QHBoxLayout()
+        self.skip_transcribed_check = QCheckBox("Skip Files Already Transcribed with Identical Settings")
+        self.skip_transcribed_check.setChecked(True)
+        self.add_tooltip(self.skip_transcribed_check, "skip_transcribed")
+        skip_transcribed_layout.addWidget(self.skip_transcribed_check)
+        skip_transcribed_layout.addStretch()
+        self.add_help_button(skip_transcribed_layout, "skip_transcribed")
+        advanced_layout.addLayout(skip_transcribed_layout)
+        
+        # Automatic retry of queued files after temporary failures
+        retry_layout = QHBoxLayout()
+        retry_layout.addWidget(QLabel("Retry Failed Files:"))
+        self.retry_attempts_spin = QSpinBox()
+        self.retry_attempts_spin.setMinimum(0)
+        self.retry_attempts_spin.setMaximum(10)
+        self.retry_attempts_spin.setValue(RetryPolicy.max_attempts - 1)
+        self.retry_attempts_spin.setSpecialValueText("Never")
+        self.retry_attempts_spin.setSuffix(" time(s)")
+        self.add_tooltip(self.retry_attempts_spin, "retry_failed")
+        retry_layout.addWidget(self.retry_attempts_spin)
+        retry_layout.addStretch()
+        self.add_help_button(retry_layout, "retry_failed")
+        advanced_layout.addLayout(retry_layout)
+        
+        # Keep models loaded between files (faster_whisper Python package)
+        warm_backend_layout = QHBoxLayout()
+        self.warm_backend_check = QCheckBox("Keep Model Loaded Between Files")
+        self.warm_backend_check.setChecked(False)
+        self.add_tooltip(self.warm_backend_check, "warm_backend")
+        if not WARM_BACKEND_AVAILABLE:
+            self.warm_backend_check.setEnabled(False)
+            self.warm_backend_check.setText("Keep Model Loaded Between Files (requires the faster-whisper Python package)")
+        warm_backend_layout.addWidget(self.warm_backend_check)
+        warm_backend_layout.addWidget(QLabel("Memory Limit:"))
+        self.model_memory_spin = QSpinBox()
+        self.model_memory_spin.setMinimum(0)
+        self.model_memory_spin.setMaximum(512)
+        self.model_memory_spin.setValue(DEFAULT_MEMORY_BUDGET_MB // 1024)
+        self.model_memory_spin.setSpecialValueText("One model")
+        self.model_memory_spin.setSuffix(" GB")
+        self.model_memory_spin.setEnabled(WARM_BACKEND_AVAILABLE)
+        self.add_tooltip(self.model_memory_spin, "model_memory_limit")
+        warm_backend_layout.addWidget(self.model_memory_spin)
+        warm_backend_layout.addStretch()
+        self.add_help_button(warm_backend_layout, "warm_backend")
+        advanced_layout.addLayout(warm_backend_layout)
+        
         self.advanced_group.setLayout(advanced_layout)
         scroll_layout.addWidget(self.advanced_group)
         
@@ -1029,8 +1152,25 @@ class FasterWhisperGUI(QMainWindow):
         self.output_text = QTextEdit()
         self.output_text.setReadOnly(True)
         self.output_text.setFont(QFont("Consolas", 9))
+        # Keep only the most recent lines - older ones are dropped as new output arrives
+        self.output_text.document().setMaximumBlockCount(MAX_OUTPUT_LINES)
         output_layout.addWidget(self.output_text)
         
+        output_buttons_layout = QHBoxLayout()
+        self.load_older_btn = QPushButton("Load Older Output")
+        self.load_older_btn.setToolTip(
+            f"Only the last {MAX_OUTPUT_LINES} lines are kept in the output area. "
+            f"Click to load the previous {OUTPUT_PAGE_LINES} lines from the log file."
+        )
+        self.load_older_btn.clicked.connect(self.load_older_output)
+        output_buttons_layout.addWidget(self.load_older_btn)
+        open_logs_btn = QPushButton("Open Logs Folder")
+        open_logs_btn.setToolTip("Open the folder with the full output log of each job")
+        open_logs_btn.clicked.connect(self.open_logs_folder)
+        output_buttons_layout.addWidget(open_logs_btn)
+        output_buttons_layout.addStretch()
+        output_layout.addLayout(output_buttons_layout)
+        
         status_layout = QHBoxLayout()
         self.status_label = QLabel("Ready")
         status_layout.addWidget(self.status_label)
@@ -1575,7 +1715,12 @@ class FasterWhisperGUI(QMainWindow):
         
         # Build command
         try:
-            exe_path, args = build_command(self.input_files, output_dir, options)
+            if len(self.input_files) == 1:
+                # Apply audio analysis suggestions for this file
+                single_options = self.get_file_options_with_suggestions(self.input_files[0], options)
+            else:
+                single_options = options
+            exe_path, args = build_command(self.input_files, output_dir, single_options)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to build command: {str(e)}")
             return
@@ -1584,37 +1729,125 @@ class FasterWhisperGUI(QMainWindow):
         if len(self.input_files) == 1:
             # Single file - process immediately
             # Show command preview dialog
+            if self.skip_transcribed_check.isChecked() and self.reuse_single_result(output_dir, single_options):
+                return
+            
             preview_dialog = CommandPreviewDialog(exe_path, args, self)
             if preview_dialog.exec() != QDialog.DialogCode.Accepted:
                 return  # User cancelled
             
             # Process immediately
+            self.single_run_options = single_options
             self.process_single_file(exe_path, args, output_dir)
         else:
             # Multiple files - show queue settings dialog
             # Show queue settings dialog (defaults to "same settings" mode)
-            queue_dialog = QueueSettingsDialog(self.input_files, options, True, self)
+            # Per-file suggestions from audio analysis are applied on top of the shared settings
+            self.collect_analysis_overrides()
+            file_overrides = {f: self.file_option_overrides[f] for f in self.input_files
+                              if f in self.file_option_overrides}
+            queue_dialog = QueueSettingsDialog(self.input_files, options, True, self, file_overrides)
             if queue_dialog.exec() != QDialog.DialogCode.Accepted:
                 return  # User cancelled
             
             # Get file options from dialog
             file_options = queue_dialog.get_file_options()
+            file_priorities = queue_dialog.get_file_priorities()
+            
+            # Files already transcribed with identical settings are not queued again
+            reused = {}
+            if self.skip_transcribed_check.isChecked():
+                reused = self.reuse_previous_results(
+                    {f: file_options.get(f, options) for f in self.input_files}, output_dir
+                )
             
             # Create queue window
             self.queue_window = QueueWindow(self)
             self.queue_window.setup_queue(self.input_files, file_options)
+            for file_path, outputs in reused.items():
+                self.queue_window.update_file_status(
+                    self.queue_window.get_file_index(file_path), "Completed",
+                    f"Reused previous result ({len(outputs)} file(s))"
+                )
             self.queue_window.show()
             
-            # Add all files to queue
+            # Add remaining files to queue
             self.queue.clear_all()
+            self.queue.set_policy(queue_dialog.get_scheduling_policy())
+            max_attempts = self.retry_attempts_spin.value() + 1
             for file_path in self.input_files:
+                if file_path in reused:
+                    continue
                 file_opts = file_options.get(file_path, options)
-                self.queue.add_job([file_path], output_dir, file_opts)
+                self.queue.add_job(
+                    [file_path], output_dir, file_opts,
+                    priority=file_priorities.get(file_path, 0),
+                    duration=self.file_durations.get(file_path),
+                    retry_policy=RetryPolicy(max_attempts=max_attempts)
+                )
             
             # Start processing queue
-            self.current_queue_file_index = 0
+            self.current_queue_file_index = len(reused)
+            self.reset_output_paging()
+            if reused:
+                self.append_output(f"Skipped {len(reused)} file(s) already transcribed with identical settings\n")
+            self.configure_worker_pool()
             self.process_next_in_queue()
     
+    def reuse_previous_results(self, file_options, output_dir):
+        """
+        Reuse the outputs of inputs already transcribed with identical settings.
+        
+        Args:
+            file_options: Dictionary input file path -> options it would be processed with
+            output_dir: Output directory ("source" for each input file's folder)
+        
+        Returns:
+            Dictionary input file path -> reused output files
+        """
+        self.status_label.setText(f"Checking {len(file_options)} file(s) for previous results...")
+        QApplication.processEvents()
+        reused = {}
+        for file_path, previous in find_previous_results(file_options).items():
+            outputs = reuse_outputs(previous, file_path, output_dir)
+            if outputs:
+                reused[file_path] = outputs
+        self.status_label.setText("Ready")
+        return reused
+    
+    def reuse_single_result(self, output_dir, options):
+        """
+        Offer to reuse a previous result for the single selected file.
+        
+        Returns:
+            True if the previous result was reused (nothing to process)
+        """
+        file_path = self.input_files[0]
+        previous = find_previous_results({file_path: options}).get(file_path)
+        if not previous:
+            return False
+        
+        reply = QMessageBox.question(
+            self,
+            "Already Transcribed",
+            f"{Path(file_path).name} was already transcribed with identical settings.\n\n"
+            f"Reuse the previous result instead of transcribing it again?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return False
+        
+        outputs = reuse_outputs(previous, file_path, output_dir)
+        if not outputs:
+            return False
+        self.last_output_dir = output_dir
+        self.output_files_generated = [Path(f) for f in outputs]
+        self.append_output(f"Reused previous result: {', '.join(Path(f).name for f in outputs)}\n")
+        self.status_label.setText("Completed (reused previous result)")
+        self.status_label.setStyleSheet("color: green;")
+        self.open_output_btn.setVisible(True)
+        return True
+    
     def process_single_file(self, exe_path, args, output_dir):
         """Process a single file immediately."""
         self.last_output_dir = output_dir
@@ -1628,10 +1861,22 @@ class FasterWhisperGUI(QMainWindow):
         self.current_file_index = 0
         self.total_files = len(self.input_files)
         
+        # Per-file overrides (if any) are the options the run actually uses
+        options = self.single_run_options or self.get_options_dict()
+        self.expect_outputs("single", self.input_files, output_dir, options)
+        
         # Show command in output
         cmd_preview = f"{exe_path} {' '.join(args)}"
-        self.output_text.append(f"Command: {cmd_preview}\n")
-        self.output_text.append("-" * 80 + "\n")
+        self.reset_output_paging()
+        self.open_job_log("single", Path(self.input_files[0]).name)
+        self.progress_trackers = {
+            "single": ProgressTracker(
+                self.get_file_duration(self.input_files[0]), self.input_files[0],
+                get_profile_key(options, self.resolve_device(options))
+            )
+        }
+        self.append_output(f"Command: {cmd_preview}\n")
+        self.append_output("-" * 80 + "\n")
         
         # Update UI
         self.start_btn.setEnabled(False)
@@ -1649,10 +1894,11 @@ class FasterWhisperGUI(QMainWindow):
         self.process_manager.start_process(
             exe_path,
             args,
-            self.on_output_received,
-            self.on_error_received,
+            self.on_single_output,
+            self.on_single_error_output,
             self.on_process_finished,
-            self.on_error_occurred
+            self.on_error_occurred,
+            warm_job=self.get_warm_job(self.input_files, output_dir, self.single_run_options or options)
         )
         
         # Start progress timer
@@ -1660,49 +1906,106 @@ class FasterWhisperGUI(QMainWindow):
         self.progress_timer.timeout.connect(self.update_progress)
         self.progress_timer.start(1000)  # Update every second
     
-    def on_output_received(self, line):
-        """Handle output from process."""
-        self.output_text.append(line)
+    def on_single_output(self, lines):
+        """Handle a batch of output lines from a single-file run."""
+        self.write_job_log("single", lines)
+        self.feed_progress("single", lines)
+        self.on_output_received(lines)
+    
+    def on_single_error_output(self, lines):
+        """Handle a batch of error output lines from a single-file run."""
+        self.write_job_log("single", [f"ERROR: {line}" for line in lines])
+        self.feed_progress("single", lines)  # Progress bars are written to stderr
+        self.on_error_received(lines)
+    
+    def on_output_received(self, lines):
+        """Handle a batch of output lines from process."""
+        # One append per batch instead of per line keeps the GUI responsive
+        self.append_output(lines)
         # Auto-scroll to bottom
         scrollbar = self.output_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
-        
-        # Try to extract progress information
-        if "Processing file" in line or "file" in line.lower():
-            # Update current file if we can parse it
-            pass
     
-    def on_error_received(self, line):
-        """Handle error output from process."""
-        self.output_text.append(f"ERROR: {line}")
+    def on_error_received(self, lines):
+        """Handle a batch of error output lines from process."""
+        self.append_output([f"ERROR: {line}" for line in lines])
+    
+    def append_output(self, text):
+        """
+        Append text to the output area and the console log.
+        
+        Args:
+            text: A string (may contain newlines) or a list of lines
+        """
+        lines = text if isinstance(text, list) else text.split("\n")
+        self.console_log.write_lines(lines)
+        self.output_text.append("\n".join(lines))
+    
+    def load_older_output(self):
+        """Page older output lines that were dropped from the output area back in from the console log."""
+        document = self.output_text.document()
+        # Lines before the first one shown are only in the log
+        end = max(0, self.console_log.line_count - document.blockCount())
+        start = max(0, end - OUTPUT_PAGE_LINES)
+        lines = self.console_log.read_lines(start, end) if end > 0 else []
+        if not lines:
+            self.load_older_btn.setEnabled(False)
+            self.load_older_btn.setText("No Older Output")
+            return
+        
+        # Make room for the loaded page so it isn't trimmed again immediately
+        document.setMaximumBlockCount(document.blockCount() + len(lines))
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.Start)
+        cursor.insertText("\n".join(lines) + "\n")
+        self.output_text.verticalScrollBar().setValue(0)
+    
+    def reset_output_paging(self):
+        """Drop paged-in output and limit the output area to MAX_OUTPUT_LINES again."""
+        self.output_text.document().setMaximumBlockCount(MAX_OUTPUT_LINES)
+        self.load_older_btn.setEnabled(True)
+        self.load_older_btn.setText("Load Older Output")
+    
+    def open_job_log(self, key, label):
+        """Start a log file for one job's output."""
+        self.close_job_log(key)
+        self.job_logs[key] = RotatingLog(make_log_name(label))
+    
+    def write_job_log(self, key, lines):
+        """Write lines to a job's log file (if it has one)."""
+        job_log = self.job_logs.get(key)
+        if job_log:
+            job_log.write_lines(lines)
+    
+    def close_job_log(self, key):
+        """Close a job's log file."""
+        job_log = self.job_logs.pop(key, None)
+        if job_log:
+            job_log.close()
+    
+    def open_logs_folder(self):
+        """Open the folder containing the output logs in file explorer."""
+        log_dir = get_log_dir()
+        if sys.platform == 'win32':
+            subprocess.Popen(['explorer', str(log_dir)])
+        elif sys.platform == 'darwin':
+            subprocess.Popen(['open', str(log_dir)])
+        else:
+            subprocess.Popen(['xdg-open', str(log_dir)])
     
     def on_process_finished(self, exit_code):
         """Handle process completion."""
         if hasattr(self, 'progress_timer'):
             self.progress_timer.stop()
+        self.finish_progress("single")
+        self.close_job_log("single")
         
         # Always try to collect output files first (even if exit_code != 0)
         # This handles cases where faster-whisper-xxl.exe completes successfully
         # but returns a non-zero exit code (e.g., Windows exception code)
         self.output_files_generated = []
-        if self.last_output_dir:
-            # Handle "source" output directory
-            if self.last_output_dir == "source" and self.input_files:
-                # Files are in the source directory (same as input file)
-                source_dir = Path(self.input_files[0]).parent
-                if source_dir.exists():
-                    # Find generated files matching input file name pattern
-                    input_stem = Path(self.input_files[0]).stem
-                    for ext in ['.txt', '.srt', '.vtt', '.json']:
-                        # Look for files that start with the input file name
-                        pattern = f"{input_stem}*{ext}"
-                        self.output_files_generated.extend(list(source_dir.glob(pattern)))
-            else:
-                output_path = Path(self.last_output_dir)
-                if output_path.exists():
-                    # Find generated files
-                    for ext in ['.txt', '.srt', '.vtt', '.json']:
-                        self.output_files_generated.extend(list(output_path.glob(f"*{ext}")))
+        for files in self.finish_outputs("single").values():
+            self.output_files_generated.extend(files)
         
         options = self.get_options_dict()
         
@@ -1711,6 +2014,9 @@ class FasterWhisperGUI(QMainWindow):
         is_effective_success = (exit_code == 0) or (len(self.output_files_generated) > 0)
         
         if is_effective_success:
+            if self.input_files and self.single_run_options is not None:
+                record_result(self.input_files[0], self.single_run_options, self.output_files_generated)
+            
             # Show warning if exit code is non-zero but files were created
             if exit_code != 0:
                 self.status_label.setText(f"Completed (with warning exit code {exit_code})")
@@ -1767,15 +2073,25 @@ class FasterWhisperGUI(QMainWindow):
     def on_error_occurred(self, error_msg):
         """Handle process errors."""
         self.status_label.setText(f"Error: {error_msg}")
-        self.output_text.append(f"ERROR: {error_msg}\n")
+        self.append_output(f"ERROR: {error_msg}\n")
+        self.progress_trackers.pop("single", None)
+        self.close_job_log("single")
         QMessageBox.critical(self, "Error", error_msg)
         self.start_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
     
     def cancel_processing(self):
-        """Cancel the running process."""
-        self.process_manager.stop_process()
-        self.status_label.setText("Cancelling...")
+        """Cancel the running process (processes are stopped in the background)."""
+        self.cancel_started_at = time.monotonic()
+        self.status_label.setText("Cancelling... (stopping processes)")
+        self.process_manager.stop_process(stopped_callback=self.on_processes_stopped)
+    
+    def on_processes_stopped(self):
+        """Report that cancelled processes and the processes they started have exited."""
+        elapsed = time.monotonic() - getattr(self, "cancel_started_at", time.monotonic())
+        self.append_output(f"\nAll cancelled processes stopped ({elapsed:.1f} s)\n")
+        if self.process_manager.active_count() == 0:
+            self.status_label.setText("Cancelled")
     
     def clear_form(self):
         """Clear the form and reset to defaults."""
@@ -1790,6 +2106,7 @@ class FasterWhisperGUI(QMainWindow):
             self.input_files = []
             self.input_files_label.setText("No files selected")
             self.output_text.clear()
+            self.reset_output_paging()
             self.status_label.setText("Ready")
     
     def load_defaults(self):
@@ -1852,48 +2169,36 @@ class FasterWhisperGUI(QMainWindow):
                         json.dump({"show_best_practices": False}, f)
     
     def analyze_audio_quality(self):
-        """Analyze audio quality of selected files and show suggestions."""
+        """Analyze audio quality of all selected files in the background and show suggestions."""
         if not self.input_files:
             QMessageBox.warning(self, "No Files", "Please select audio files first.")
             return
         
-        # Analyze first file (or all files)
-        file_to_analyze = self.input_files[0]
-        
-        # Show progress
-        QMessageBox.information(
-            self,
-            "Analyzing Audio",
-            f"Analyzing audio quality of: {Path(file_to_analyze).name}\n\n"
-            "This may take a moment..."
-        )
+        # Keep suggestions from a previous analysis dialog before replacing it
+        self.collect_analysis_overrides()
         
-        try:
-            analysis = analyze_audio_quality(file_to_analyze)
-            
-            # Build message
-            msg = f"Audio Quality Analysis: {Path(file_to_analyze).name}\n\n"
-            msg += f"Quality Score: {analysis['quality_score']}/100\n\n"
-            
-            if analysis['analysis_available']:
-                msg += f"Noise Level: {analysis['noise_level'].title()}\n"
-                msg += f"Volume Level: {analysis['volume_level'].title()}\n\n"
-            
-            if analysis['suggestions']:
-                msg += "Suggestions:\n"
-                for suggestion in analysis['suggestions']:
-                    msg += f"• {suggestion}\n"
-            else:
-                msg += "No specific suggestions - audio quality appears good!"
-            
-            QMessageBox.information(self, "Audio Quality Analysis", msg)
-        except Exception as e:
-            QMessageBox.warning(
-                self,
-                "Analysis Failed",
-                f"Could not analyze audio file:\n{str(e)}\n\n"
-                "Default suggestion: Clean audio detected - using minimal filters for best accuracy"
-            )
+        self.analysis_dialog = AudioAnalysisDialog(self.input_files, self)
+        self.analysis_dialog.finished.connect(lambda result: self.collect_analysis_overrides())
+        self.analysis_dialog.show()  # Non-modal - analysis continues in the background
+    
+    def collect_analysis_overrides(self):
+        """Store per-file option suggestions from the audio analysis dialog."""
+        if getattr(self, 'analysis_dialog', None) is None:
+            return
+        # Replace suggestions for the analyzed files (unchecking "apply" clears them)
+        for file_path in self.analysis_dialog.file_list:
+            self.file_option_overrides.pop(file_path, None)
+        self.file_option_overrides.update(self.analysis_dialog.get_file_option_overrides())
+    
+    def get_file_options_with_suggestions(self, file_path, options):
+        """Get options for a file with audio analysis suggestions applied."""
+        self.collect_analysis_overrides()
+        overrides = self.file_option_overrides.get(file_path)
+        if not overrides:
+            return options
+        file_opts = options.copy()
+        file_opts.update(overrides)
+        return file_opts
     
     def update_reminders(self):
         """Update visibility of reminder labels based on current settings."""
@@ -2035,6 +2340,9 @@ class FasterWhisperGUI(QMainWindow):
         """Update file display and show file information."""
         from file_info_extractor import format_size
         
+        self.stop_bulk_probe()
+        self.file_durations = {}
+        
         if not self.input_files:
             self.input_files_label.setText("No files selected (drag & drop files or folders here)")
             self.file_info_label.setVisible(False)
@@ -2050,6 +2358,8 @@ class FasterWhisperGUI(QMainWindow):
             
             # Get file info
             info = get_file_info(file_path)
+            if info['duration'] is not None:
+                self.file_durations[file_path] = info['duration']
             info_text = f"Size: {info['size_formatted']} | Format: {info['format']}"
             if info['duration_formatted'] != "Unknown":
                 info_text += f" | Duration: {info['duration_formatted']}"
@@ -2061,8 +2371,69 @@ class FasterWhisperGUI(QMainWindow):
         else:
             self.input_files_label.setText(f"Selected: {len(self.input_files)} files")
             total_size = sum(Path(f).stat().st_size for f in self.input_files if Path(f).exists())
-            self.file_info_label.setText(f"Total: {len(self.input_files)} files | Total size: {format_size(total_size)}")
+            self._selection_summary = f"Total: {len(self.input_files)} files | Total size: {format_size(total_size)}"
+            self.file_info_label.setText(self._selection_summary)
             self.file_info_label.setVisible(True)
+            
+            # Probe durations in the background and show the running total
+            self.start_bulk_probe()
+    
+    def start_bulk_probe(self):
+        """Start probing all selected files in the background."""
+        self.stop_bulk_probe()
+        self.file_durations = {}
+        self._probe_done_count = 0
+        
+        self.probe_worker = BulkProbeWorker(self.input_files)
+        self.probe_worker.file_probed.connect(self.on_file_probed)
+        self.probe_worker.finished.connect(self.on_bulk_probe_finished)
+        self.probe_worker.start()
+    
+    def stop_bulk_probe(self):
+        """Cancel a running bulk probe (e.g. when the selection changes)."""
+        if getattr(self, 'probe_worker', None) and self.probe_worker.isRunning():
+            self.probe_worker.file_probed.disconnect()
+            self.probe_worker.finished.disconnect()
+            self.probe_worker.cancel()
+            # Keep a reference until the thread exits
+            self._stale_probe_workers = [w for w in getattr(self, '_stale_probe_workers', []) if w.isRunning()]
+            self._stale_probe_workers.append(self.probe_worker)
+        self.probe_worker = None
+    
+    def on_file_probed(self, file_path, metadata):
+        """Handle metadata for one file from the bulk probe."""
+        self._probe_done_count += 1
+        if metadata and metadata.get("duration"):
+            self.file_durations[file_path] = metadata["duration"]
+        
+        # Refresh the label periodically rather than for every file
+        total = len(self.input_files)
+        if self._probe_done_count % 25 == 0 or self._probe_done_count == total:
+            self.update_probe_summary(final=False)
+    
+    def on_bulk_probe_finished(self, results):
+        """Handle completion of the bulk probe."""
+        self.update_probe_summary(final=True)
+        # A queue started before probing finished can now schedule by duration
+        for job in self.queue.jobs:
+            if job.duration is None and job.status in (JobStatus.PENDING, JobStatus.RETRYING):
+                duration = self.file_durations.get(job.input_files[0])
+                if duration:
+                    self.queue.set_job_duration(job, duration)
+    
+    def update_probe_summary(self, final):
+        """Show total audio duration of the selection."""
+        from file_info_extractor import format_duration
+        
+        total_duration = sum(self.file_durations.values())
+        text = f"{self._selection_summary} | Total duration: {format_duration(total_duration)}"
+        if not final:
+            text += f" (probing {self._probe_done_count} of {len(self.input_files)}...)"
+        else:
+            unknown = len(self.input_files) - len(self.file_durations)
+            if unknown:
+                text += f" ({unknown} file(s) unknown)"
+        self.file_info_label.setText(text)
     
     
     def check_model_updates(self):
@@ -2272,12 +2643,64 @@ class FasterWhisperGUI(QMainWindow):
             return False, "Output folder creation cancelled"
     
     
+    def offer_queue_resume(self):
+        """Offer to resume a queue that did not finish in a previous session."""
+        policy_name, saved_jobs = self.queue_journal.load()
+        incomplete = sum(1 for job in saved_jobs
+                         if job.get("status") in ("PENDING", "PROCESSING", "PAUSED", "RETRYING"))
+        if not incomplete:
+            self.queue_journal.clear()
+            return
+        
+        completed = sum(1 for job in saved_jobs if job.get("status") == "COMPLETED")
+        reply = QMessageBox.question(
+            self,
+            "Resume Queue",
+            f"The processing queue from a previous session did not finish.\n\n"
+            f"{incomplete} file(s) still to process, {completed} already completed.\n\n"
+            f"Resume the remaining files now? (Completed files are skipped.)",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.resume_saved_queue(policy_name, saved_jobs)
+        else:
+            self.queue_journal.clear()
+    
+    def resume_saved_queue(self, policy_name, saved_jobs):
+        """Restore a journaled queue and continue processing its remaining jobs."""
+        self.queue.restore(saved_jobs, policy_name)
+        jobs = self.queue.jobs
+        if not jobs:
+            return
+        
+        self.input_files = [job.input_files[0] for job in jobs]
+        self.update_file_display()
+        self.last_output_dir = jobs[0].output_dir
+        self.output_files_generated = []
+        
+        self.queue_window = QueueWindow(self)
+        self.queue_window.setup_queue(self.input_files, {job.input_files[0]: job.options for job in jobs})
+        for index, job in enumerate(jobs):
+            if job.status == JobStatus.COMPLETED:
+                self.queue_window.update_file_status(index, "Completed", "Completed in a previous session")
+            elif job.status == JobStatus.FAILED:
+                self.queue_window.update_file_status(index, "Failed", job.error_message or "")
+        self.queue_window.show()
+        
+        self.current_queue_file_index = len(jobs) - self.queue.get_pending_count()
+        self.reset_output_paging()
+        self.append_output(f"Resuming queue: {self.queue.get_pending_count()} file(s) remaining\n")
+        self.configure_worker_pool()
+        self.process_next_in_queue()
+    
     def process_next_in_queue(self):
-        """Process the next job in the queue."""
+        """Start pending jobs in the queue while worker slots are free."""
         if not self.queue.has_pending_jobs() or self.queue.is_paused:
             if self.queue_window:
                 # All done or paused
-                if not self.queue.has_pending_jobs():
+                if (not self.queue.has_pending_jobs() and self.process_manager.active_count() == 0
+                        and self.queue.get_status_count(JobStatus.RETRYING) == 0):
+                    self.queue_journal.clear()  # Nothing left to resume
                     QMessageBox.information(
                         self.queue_window,
                         "Queue Complete",
@@ -2285,24 +2708,88 @@ class FasterWhisperGUI(QMainWindow):
                     )
             return
         
-        if self.process_manager.is_running():
-            return  # Already processing
-        
-        job = self.queue.get_next_job()
-        if not job:
-            return
-        
-        self.queue.mark_job_processing(job)
+        # With loaded models, finish the files using them before loading another model
+        prefer_groups = get_model_pool().loaded_keys() if self.warm_backend_check.isChecked() else None
         
-        # Update queue window
-        if self.queue_window:
-            file_path = job.input_files[0]
-            file_index = self.queue_window.get_file_index(file_path)
-            if file_index >= 0:
-                self.queue_window.update_file_status(file_index, "Processing", "Starting...")
-        
-        # Process this job
-        self.process_job(job)
+        while self.queue.has_pending_jobs() and not self.queue.is_paused:
+            job = self.queue.get_next_job(prefer_groups)
+            if not job:
+                return
+            
+            device = self.get_job_device(job)
+            if not self.process_manager.can_start(device):
+                return  # No free worker slot - wait for a running job to finish
+            
+            # Group the next jobs (in scheduling order) with identical settings into one invocation
+            max_minutes = self.max_batch_minutes_spin.value()
+            if max_minutes:
+                jobs = self.queue.get_next_batch(
+                    self.files_per_process_spin.value(), max_minutes * 60, self.get_file_duration, prefer_groups
+                )
+            else:
+                jobs = self.queue.get_next_batch(self.files_per_process_spin.value(), prefer_groups=prefer_groups)
+            
+            for batch_job in jobs:
+                self.queue.mark_job_processing(batch_job)
+                
+                # Update queue window
+                if self.queue_window:
+                    file_path = batch_job.input_files[0]
+                    file_index = self.queue_window.get_file_index(file_path)
+                    if file_index >= 0:
+                        self.queue_window.update_file_status(file_index, "Processing", "Starting...")
+            
+            # Process this job (or group of jobs)
+            if len(jobs) > 1:
+                self.process_batch(jobs)
+            else:
+                self.process_job(job)
+    
+    def get_file_duration(self, file_path):
+        """Get the duration of an input file in seconds (None if unknown)."""
+        if file_path in self.file_durations:
+            return self.file_durations[file_path]
+        return get_file_info(file_path).get("duration")
+    
+    def configure_worker_pool(self):
+        """Apply the Parallel Jobs setting to the process manager."""
+        self._gpu_available = check_gpu_available()
+        gpu_count = get_gpu_info()["count"] if self._gpu_available else 0
+        # Keep GPU jobs to one per device; CPU jobs are only bounded by the pool size
+        self.process_manager.set_max_workers(
+            self.parallel_jobs_spin.value(),
+            {"cuda": max(1, gpu_count)}
+        )
+    
+    def get_warm_job(self, input_files, output_dir, options):
+        """
+        Get the warm backend job for a run, if "Keep Model Loaded Between Files" is enabled.
+        
+        Returns:
+            Dict for ProcessManager.start_process's warm_job, or None to run the executable
+        """
+        if not self.warm_backend_check.isChecked():
+            return None
+        get_model_pool().set_memory_budget(self.model_memory_spin.value() * 1024)
+        features = get_exe_only_features(options)
+        if features:
+            self.append_output(f"Running faster-whisper-xxl.exe (loaded models don't support {', '.join(features)})\n")
+            return None
+        self.append_output("Running on a loaded model (faster-whisper Python package)\n")
+        return {"input_files": list(input_files), "output_dir": output_dir, "options": options}
+    
+    def get_job_device(self, job: QueueJob):
+        """Resolve the device a queue job will run on (for worker slot accounting)."""
+        return self.resolve_device(job.options)
+    
+    def resolve_device(self, options):
+        """Resolve the device a set of options will run on ("auto" becomes cuda or cpu)."""
+        device = options.get("device") or "auto"
+        if device == "auto":
+            if not hasattr(self, "_gpu_available"):
+                self._gpu_available = check_gpu_available()
+            return "cuda" if self._gpu_available else "cpu"
+        return device
     
     def process_job(self, job: QueueJob):
         """Process a single queue job."""
@@ -2319,6 +2806,8 @@ class FasterWhisperGUI(QMainWindow):
             self.process_next_in_queue()
             return
         
+        self.expect_outputs(job.job_id, job.input_files, job.output_dir, job.options)
+        
         # For queue processing, skip command preview (already reviewed in queue settings)
         # Start processing directly
         self.processing_start_time = time.time()
@@ -2328,24 +2817,119 @@ class FasterWhisperGUI(QMainWindow):
         # Update main UI
         self.start_btn.setEnabled(False)
         self.cancel_btn.setEnabled(True)
-        self.status_label.setText(f"Processing file {self.current_queue_file_index + 1} of {len(self.input_files)}")
+        running = self.process_manager.active_count() + 1
+        if running > 1:
+            self.status_label.setText(
+                f"Processing {running} files in parallel "
+                f"({self.current_queue_file_index} of {len(self.input_files)} done)"
+            )
+        else:
+            self.status_label.setText(f"Processing file {self.current_queue_file_index + 1} of {len(self.input_files)}")
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate
         
         # Show command in output
         cmd_preview = f"{exe_path} {' '.join(args)}"
-        self.output_text.append(f"\n{'='*80}\n")
-        self.output_text.append(f"Processing: {Path(job.input_files[0]).name}\n")
-        self.output_text.append(f"Command: {cmd_preview}\n")
-        self.output_text.append("-" * 80 + "\n")
+        self.open_job_log(job.job_id, Path(job.input_files[0]).name)
+        self.write_job_log(job.job_id, [f"Command: {cmd_preview}", "-" * 80])
+        self.progress_trackers[job.job_id] = ProgressTracker(
+            self.get_file_duration(job.input_files[0]), job.input_files[0],
+            get_profile_key(job.options, self.get_job_device(job))
+        )
+        self.job_output_tails[job.job_id] = deque(maxlen=OUTPUT_TAIL_LINES)
+        self.append_output(f"\n{'='*80}\n")
+        self.append_output(f"Processing: {Path(job.input_files[0]).name}\n")
+        self.append_output(f"Command: {cmd_preview}\n")
+        self.append_output("-" * 80 + "\n")
         
         self.process_manager.start_process(
             exe_path,
             args,
-            self.on_output_received,
-            self.on_error_received,
+            lambda lines: self.on_job_output(job, lines),
+            lambda lines: self.on_job_output(job, lines, is_error=True),
             lambda code: self.on_job_finished(job, code),
-            lambda msg: self.on_job_error(job, msg)
+            lambda msg: self.on_job_error(job, msg),
+            key=job.job_id,
+            device=self.get_job_device(job),
+            warm_job=self.get_warm_job(job.input_files, job.output_dir, job.options)
+        )
+        
+        # Start progress timer
+        if not hasattr(self, 'progress_timer') or not self.progress_timer.isActive():
+            self.progress_timer = QTimer()
+            self.progress_timer.timeout.connect(self.update_progress)
+            self.progress_timer.start(1000)
+    
+    def process_batch(self, jobs):
+        """Process several queue jobs with identical settings in one invocation."""
+        first = jobs[0]
+        input_files = [f for job in jobs for f in job.input_files]
+        
+        # Build command
+        try:
+            exe_path, args = build_command(input_files, first.output_dir, first.options)
+        except Exception as e:
+            for job in jobs:
+                self.queue.mark_job_failed(job, f"Failed to build command: {str(e)}")
+                if self.queue_window:
+                    file_index = self.queue_window.get_file_index(job.input_files[0])
+                    if file_index >= 0:
+                        self.queue_window.update_file_status(file_index, "Failed", str(e))
+            self.process_next_in_queue()
+            return
+        
+        for job in jobs:
+            self.expect_outputs(job.job_id, job.input_files, first.output_dir, first.options)
+            self.batched_job_ids.add(job.job_id)
+        
+        self.processing_start_time = time.time()
+        self.current_file_index = 0
+        self.total_files = len(input_files)
+        
+        # Update main UI
+        self.start_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(True)
+        self.status_label.setText(
+            f"Processing {len(jobs)} files in one batch "
+            f"({self.current_queue_file_index} of {len(self.input_files)} done)"
+        )
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)  # Indeterminate
+        
+        # Show command in output
+        cmd_preview = f"{exe_path} {' '.join(args)}"
+        for job in jobs:
+            self.open_job_log(job.job_id, Path(job.input_files[0]).name)
+            self.write_job_log(job.job_id, [f"Command (batch of {len(jobs)} files): {cmd_preview}", "-" * 80])
+            self.progress_trackers[job.job_id] = ProgressTracker(
+                self.get_file_duration(job.input_files[0]), job.input_files[0],
+                get_profile_key(job.options, self.get_job_device(job))
+            )
+            self.job_output_tails[job.job_id] = deque(maxlen=OUTPUT_TAIL_LINES)
+        self.append_output(f"\n{'='*80}\n")
+        self.append_output(f"Processing batch of {len(jobs)} files: "
+                           f"{', '.join(Path(f).name for f in input_files)}\n")
+        self.append_output(f"Command: {cmd_preview}\n")
+        self.append_output("-" * 80 + "\n")
+        
+        # Track which file of the batch the executable is working on
+        # Jobs by normalized input path, longest first, for matching the executable's per-file start lines
+        batch_state = {
+            "current": first,
+            "jobs_by_path": sorted(((self.normalize_batch_path(job.input_files[0]), job) for job in jobs),
+                                   key=lambda item: len(item[0]), reverse=True),
+        }
+        
+        self.process_manager.start_process(
+            exe_path,
+            args,
+            lambda lines: self.on_batch_output(jobs, batch_state, lines),
+            lambda lines: self.on_batch_output(jobs, batch_state, lines, is_error=True),
+            lambda code: self.on_batch_finished(jobs, code),
+            lambda msg: self.on_batch_error(jobs, msg),
+            key=first.job_id,
+            device=self.get_job_device(first),
+            warm_job=self.get_warm_job(input_files, first.output_dir, first.options)
         )
         
         # Start progress timer
@@ -2354,34 +2938,184 @@ class FasterWhisperGUI(QMainWindow):
             self.progress_timer.timeout.connect(self.update_progress)
             self.progress_timer.start(1000)
     
+    def on_batch_output(self, jobs, batch_state, lines, is_error=False):
+        """Route output lines from a batched invocation to the jobs they belong to."""
+        job_lines = []
+        for line in lines:
+            # The executable prints a start line naming each input file as it starts on it
+            started_path = parse_file_start(line)
+            job = self.match_batch_job(batch_state, started_path) if started_path else None
+            if job is not None and job is not batch_state["current"]:
+                # Flush lines belonging to the previous file first
+                if job_lines:
+                    self.on_job_output(batch_state["current"], job_lines, is_error)
+                    job_lines = []
+                batch_state["current"] = job
+                # Time each file of the batch from when the executable starts on it
+                tracker = self.progress_trackers.get(job.job_id)
+                if tracker:
+                    tracker.restart()
+                if self.queue_window:
+                    file_index = self.queue_window.get_file_index(job.input_files[0])
+                    if file_index >= 0:
+                        self.queue_window.update_file_status(file_index, "Processing", "Transcribing...")
+            job_lines.append(line)
+        if job_lines:
+            self.on_job_output(batch_state["current"], job_lines, is_error)
+    
+    @staticmethod
+    def normalize_batch_path(path):
+        """Normalize a file path for comparing it with paths printed by the executable."""
+        return os.path.normcase(str(Path(path).resolve()))
+    
+    def match_batch_job(self, batch_state, started_path):
+        """
+        Find the job of a batch whose input file a start line names.
+        
+        The full path must match exactly. If the executable printed a different form
+        of the path (e.g. relative), the file name must match exactly; longer paths
+        are checked first.
+        
+        Returns:
+            QueueJob, or None if no job of the batch matches
+        """
+        printed = self.normalize_batch_path(started_path)
+        for path, job in batch_state["jobs_by_path"]:
+            if path == printed:
+                return job
+        printed_name = os.path.normcase(Path(started_path).name)
+        for path, job in batch_state["jobs_by_path"]:
+            if os.path.basename(path) == printed_name:
+                return job
+        return None
+    
+    def on_batch_finished(self, jobs, exit_code):
+        """Handle completion of a batched invocation, splitting results per file."""
+        # Files the run never reached are classified by the output of the file that stopped it
+        last_tail = []
+        for job in jobs:
+            if self.job_output_tails.get(job.job_id):
+                last_tail = list(self.job_output_tails[job.job_id])
+        
+        finished = 0
+        for job in jobs:
+            self.batched_job_ids.discard(job.job_id)
+            job_output_files = [f for files in self.finish_outputs(job.job_id).values() for f in files]
+            if not self.job_output_tails.get(job.job_id):
+                self.job_output_tails[job.job_id] = last_tail
+            # A batch can exit 0 after skipping a file it couldn't read, so each file needs its own outputs
+            if self.finish_queue_job(job, exit_code, job_output_files, require_outputs=True):
+                finished += 1
+        self.on_queue_jobs_done(finished)
+    
+    def on_batch_error(self, jobs, error_msg):
+        """Handle an error for a batched invocation."""
+        for job in jobs:
+            self.on_job_error(job, error_msg, start_next=False)
+        self.process_next_in_queue()
+    
+    def expect_outputs(self, key, input_files, output_dir, options):
+        """Start watching for the output files a run's command will write."""
+        expected = {
+            "since": time.time(),
+            "output_dir": output_dir,
+            "options": options,
+            "files": {f: get_expected_output_files(f, output_dir, options) for f in input_files},
+        }
+        self.expected_outputs[key] = expected
+        self.output_watcher.watch(key, [p for paths in expected["files"].values() for p in paths], expected["since"])
+    
+    def finish_outputs(self, key):
+        """
+        Get the output files a run wrote, once its process has exited.
+        
+        Files reported by the output watcher are used. If none of an input's expected
+        files was written (the executable named its outputs differently), files named
+        after the input are searched for in the output directory instead.
+        
+        Args:
+            key: Job key the outputs were expected under (see expect_outputs)
+        
+        Returns:
+            Dictionary input file path -> list of output Path objects
+        """
+        expected = self.expected_outputs.pop(key, None)
+        ready = {str(path) for path in self.output_watcher.finish(key)}
+        if not expected:
+            return {}
+        
+        outputs = {}
+        for input_file, paths in expected["files"].items():
+            found = [path for path in paths if str(path) in ready]
+            if not found:
+                found = find_output_files(input_file, expected["output_dir"], expected["options"], expected["since"])
+            outputs[input_file] = found
+        return outputs
+    
+    def on_output_file_ready(self, key, path):
+        """Handle an output file that has been fully written while its run is still going."""
+        self.write_job_log(key, [f"Output ready: {path}"])
+        self.append_output(f"Output ready: {Path(path).name}\n")
+        
+        # A file of a batched run is done once all its outputs are written - no need to wait for the whole batch
+        if key in self.batched_job_ids and self.output_watcher.is_complete(key):
+            job = self.queue.get_job(key)
+            self.batched_job_ids.discard(key)
+            if job is not None and job.status == JobStatus.PROCESSING:
+                job_output_files = [f for files in self.finish_outputs(key).values() for f in files]
+                if self.finish_queue_job(job, 0, job_output_files):
+                    self.on_queue_jobs_done(1)
+    
+    def on_job_output(self, job, lines, is_error=False):
+        """Route a batch of output lines from a queue job's worker to its log and the output area."""
+        self.write_job_log(job.job_id, [f"ERROR: {line}" for line in lines] if is_error else lines)
+        self.feed_progress(job.job_id, lines)
+        tail = self.job_output_tails.get(job.job_id)
+        if tail is not None:
+            tail.extend(lines)
+        if self.process_manager.max_workers > 1:
+            # Interleaved output from parallel workers - tag each line with its file
+            name = Path(job.input_files[0]).name
+            lines = [f"[{name}] {line}" for line in lines]
+        if is_error:
+            self.on_error_received(lines)
+        else:
+            self.on_output_received(lines)
+    
     def on_job_finished(self, job, exit_code):
         """Handle job completion."""
-        file_path = job.input_files[0]
-        file_index = self.queue_window.get_file_index(file_path) if self.queue_window else -1
-        
         # Always try to collect output files first (even if exit_code != 0)
         # This handles cases where faster-whisper-xxl.exe completes successfully
         # but returns a non-zero exit code (e.g., Windows exception code)
-        job_output_files = []
-        
-        # Check output directory
-        output_path = Path(job.output_dir)
-        if output_path.exists():
-            for ext in ['.txt', '.srt', '.vtt', '.json']:
-                job_output_files.extend(list(output_path.glob(f"*{ext}")))
-        
-        # Also check source directory if output_dir was "source"
-        if not job_output_files and job.input_files:
-            first_input = Path(job.input_files[0])
-            if first_input.exists():
-                source_dir = first_input.parent
-                input_stem = first_input.stem
-                for ext in ['.txt', '.srt', '.vtt', '.json']:
-                    pattern = f"{input_stem}*{ext}"
-                    job_output_files.extend(list(source_dir.glob(pattern)))
+        job_output_files = [f for files in self.finish_outputs(job.job_id).values() for f in files]
+        
+        finished = self.finish_queue_job(job, exit_code, job_output_files)
+        self.on_queue_jobs_done(1 if finished else 0)
+    
+    def finish_queue_job(self, job, exit_code, job_output_files, require_outputs=False):
+        """
+        Mark a queue job completed, failed or waiting to retry based on exit code and its output files.
+        
+        Args:
+            job: Finished queue job
+            exit_code: Process exit code
+            job_output_files: Output files found for the job
+            require_outputs: Treat the job as failed without output files even if the exit code is 0
+                (for jobs that shared an invocation)
+        
+        Returns:
+            True if the job is done (completed or failed for good)
+        """
+        if job.status != JobStatus.PROCESSING:
+            return False  # Already handled by on_job_error
+        
+        self.finish_progress(job.job_id, job.options)
+        self.close_job_log(job.job_id)
+        file_path = job.input_files[0]
+        file_index = self.queue_window.get_file_index(file_path) if self.queue_window else -1
         
         # Treat as success if exit_code==0 OR if outputs were produced
-        is_effective_success = (exit_code == 0) or (len(job_output_files) > 0)
+        is_effective_success = (exit_code == 0 and not require_outputs) or (len(job_output_files) > 0)
         
         if is_effective_success:
             # Mark as completed
@@ -2390,9 +3124,10 @@ class FasterWhisperGUI(QMainWindow):
             else:
                 output_msg = f"Completed - Output saved to {job.output_dir}"
             
-            self.queue.mark_job_completed(job)
+            self.queue.mark_job_completed(job, [str(f) for f in job_output_files])
             if file_index >= 0:
                 self.queue_window.update_file_status(file_index, "Completed", output_msg)
+            record_result(file_path, job.options, job_output_files)
             
             # Check if diarization was used and open speaker replacement dialog
             if job.options.get("diarize_enable") and job_output_files:
@@ -2409,17 +3144,84 @@ class FasterWhisperGUI(QMainWindow):
                 if diarization_file:
                     dialog = SpeakerReplacementDialog(diarization_file, self)
                     dialog.exec()
-        else:
-            error_msg = f"Process exited with code {exit_code}"
-            self.queue.mark_job_failed(job, error_msg)
+            self.job_output_tails.pop(job.job_id, None)
+            return True
+        
+        if exit_code == 0:
+            return self.handle_job_failure(job, "No output files were written for this file", exit_code)
+        return self.handle_job_failure(job, f"Process exited with code {exit_code}", exit_code)
+    
+    def handle_job_failure(self, job, error_msg, exit_code=None):
+        """
+        Classify why a queue job failed and either schedule a retry or mark it failed.
+        
+        Args:
+            job: Failed queue job
+            error_msg: Error message of the failure
+            exit_code: Process exit code if the process ran
+        
+        Returns:
+            True if the job failed for good, False if a retry was scheduled
+        """
+        tail = list(self.job_output_tails.pop(job.job_id, ()))
+        cause = classify_failure(tail + [error_msg], exit_code)
+        description = FAILURE_DESCRIPTIONS[cause]
+        job.attempts += 1
+        file_index = self.queue_window.get_file_index(job.input_files[0]) if self.queue_window else -1
+        
+        if job.retry_policy.should_retry(cause, job.attempts):
+            fallback_note = ""
+            if cause == OUT_OF_MEMORY:
+                fallback = get_fallback_options(job.options, self.get_job_device(job))
+                if fallback:
+                    self.queue.set_job_options(job, fallback)
+                    fallback_note = f", compute type {fallback.get('compute_type')}"
+            delay = job.retry_policy.get_delay(job.attempts)
+            message = (f"{description} - retry {job.attempts} of {job.retry_policy.max_attempts - 1} "
+                       f"in {int(delay)}s{fallback_note}")
+            self.queue.mark_job_retrying(job, message)
             if file_index >= 0:
-                self.queue_window.update_file_status(file_index, "Failed", error_msg)
+                self.queue_window.update_file_status(file_index, "Retrying", message)
+            self.append_output(f"{Path(job.input_files[0]).name}: {message}\n")
+            QTimer.singleShot(int(delay * 1000), lambda: self.retry_job(job))
+            return False
         
-        self.current_queue_file_index += 1
+        if job.attempts > 1:
+            error_msg = f"{error_msg} (after {job.attempts} attempts)"
+        error_msg = f"{description}: {error_msg}"
+        self.queue.mark_job_failed(job, error_msg)
+        if file_index >= 0:
+            self.queue_window.update_file_status(file_index, "Failed", error_msg)
+        return True
+    
+    def retry_job(self, job):
+        """Put a job waiting to retry back in the queue and start it when a worker is free."""
+        if job.status != JobStatus.RETRYING or self.queue.get_job(job.job_id) is not job:
+            return  # Queue was cleared or restarted in the meantime
+        self.queue.requeue_job(job)
+        if self.queue_window:
+            file_index = self.queue_window.get_file_index(job.input_files[0])
+            if file_index >= 0:
+                self.queue_window.update_file_status(file_index, "Pending", "Waiting for a free worker to retry...")
+        self.process_next_in_queue()
+    
+    def on_queue_jobs_done(self, job_count):
+        """Update queue progress after jobs finish and start the next ones."""
+        self.current_queue_file_index += job_count
         
         # Update main UI status
         if self.queue.has_pending_jobs():
             self.status_label.setText(f"Completed file {self.current_queue_file_index} of {len(self.input_files)}. Processing next...")
+        elif self.process_manager.active_count() > 0:
+            self.status_label.setText(
+                f"Completed file {self.current_queue_file_index} of {len(self.input_files)}. "
+                f"Waiting for {self.process_manager.active_count()} running file(s)..."
+            )
+        elif self.queue.get_status_count(JobStatus.RETRYING):
+            self.status_label.setText(
+                f"Completed file {self.current_queue_file_index} of {len(self.input_files)}. "
+                f"Waiting to retry {self.queue.get_status_count(JobStatus.RETRYING)} file(s)..."
+            )
         else:
             self.status_label.setText("All files completed!")
             self.reset_progress_display()
@@ -2429,17 +3231,18 @@ class FasterWhisperGUI(QMainWindow):
         # Process next job
         self.process_next_in_queue()
     
-    def on_job_error(self, job, error_msg):
+    def on_job_error(self, job, error_msg, start_next=True):
         """Handle job error."""
-        file_path = job.input_files[0]
-        file_index = self.queue_window.get_file_index(file_path) if self.queue_window else -1
-        
-        self.queue.mark_job_failed(job, error_msg)
-        if file_index >= 0:
-            self.queue_window.update_file_status(file_index, "Failed", error_msg)
+        if job.status != JobStatus.PROCESSING:
+            return
         
-        self.current_queue_file_index += 1
-        self.process_next_in_queue()
+        self.write_job_log(job.job_id, [f"ERROR: {error_msg}"])
+        self.progress_trackers.pop(job.job_id, None)
+        self.close_job_log(job.job_id)
+        if self.handle_job_failure(job, error_msg):
+            self.current_queue_file_index += 1
+        if start_next:
+            self.process_next_in_queue()
     
     def reset_progress_display(self):
         """Reset progress display."""
@@ -2483,43 +3286,28 @@ class FasterWhisperGUI(QMainWindow):
         else:
             QMessageBox.information(self, "No Output", "No output folder available yet.")
     
+    def find_expected_outputs(self, input_file, output_dir):
+        """Get the existing output files for an input file transcribed with the last used settings."""
+        options = self.single_run_options or self.get_options_dict()
+        return [path for path in get_expected_output_files(input_file, output_dir, options) if path.exists()]
+    
     def open_speaker_replacement(self):
         """Open speaker replacement dialog (manual trigger)."""
         self._open_speaker_replacement_dialog()
     
     def open_speaker_replacement_auto(self):
         """Automatically open speaker replacement dialog after processing."""
-        # Small delay to ensure files are written
-        QTimer.singleShot(500, self._open_speaker_replacement_dialog)
+        # The output files are complete (collected once the process exited); open after the current event
+        QTimer.singleShot(0, self._open_speaker_replacement_dialog)
     
     def _open_speaker_replacement_dialog(self):
         """Internal method to open speaker replacement dialog."""
         # Try to find files in output directory
         diarization_file = None
         
-        # First, check if we have collected output files
-        if not self.output_files_generated and self.last_output_dir:
-            output_path = Path(self.last_output_dir)
-            if output_path.exists():
-                for ext in ['.txt', '.srt', '.vtt']:
-                    files = list(output_path.glob(f"*{ext}"))
-                    if files:
-                        self.output_files_generated.extend(files)
-                        break
-        
-        # Also check source directory if output_dir was "source"
-        if not self.output_files_generated and self.input_files:
-            # Check the directory of the first input file
-            first_input = Path(self.input_files[0])
-            if first_input.exists():
-                source_dir = first_input.parent
-                for ext in ['.txt', '.srt', '.vtt']:
-                    # Look for files with same stem as input file
-                    pattern = f"{first_input.stem}*{ext}"
-                    files = list(source_dir.glob(pattern))
-                    if files:
-                        self.output_files_generated.extend(files)
-                        break
+        # If no output files were collected, check the ones the first input file should have
+        if not self.output_files_generated and self.last_output_dir and self.input_files:
+            self.output_files_generated = self.find_expected_outputs(self.input_files[0], self.last_output_dir)
         
         # Find first diarization output file (prefer .txt, then .srt, then .vtt)
         for ext in ['.txt', '.srt', '.vtt']:
@@ -2549,8 +3337,8 @@ class FasterWhisperGUI(QMainWindow):
     
     def open_timestamp_removal_auto(self):
         """Automatically open timestamp removal dialog after processing."""
-        # Small delay to ensure files are written
-        QTimer.singleShot(500, self._open_timestamp_removal_dialog)
+        # The output files are complete (collected once the process exited); open after the current event
+        QTimer.singleShot(0, self._open_timestamp_removal_dialog)
     
     def _open_timestamp_removal_dialog(self):
         """Internal method to open timestamp removal dialog."""
@@ -2568,16 +3356,13 @@ class FasterWhisperGUI(QMainWindow):
                 if output_file:
                     break
         
-        # If not found, try to find in last_output_dir
-        if not output_file and hasattr(self, 'last_output_dir') and self.last_output_dir:
-            output_path = Path(self.last_output_dir)
-            if output_path.exists():
-                # Look for output files
-                for ext in ['.txt', '.srt', '.vtt']:
-                    files = list(output_path.glob(f"*{ext}"))
-                    if files:
-                        output_file = files[0]
-                        break
+        # If not found, check the outputs the first input file should have
+        if not output_file and self.last_output_dir and self.input_files:
+            existing = self.find_expected_outputs(self.input_files[0], self.last_output_dir)
+            for ext in ['.txt', '.srt', '.vtt']:
+                output_file = next((f for f in existing if f.suffix.lower() == ext), None)
+                if output_file:
+                    break
         
         if not output_file:
             QMessageBox.warning(
@@ -2600,26 +3385,81 @@ class FasterWhisperGUI(QMainWindow):
             size_bytes /= 1024.0
         return f"{size_bytes:.2f} TB"
     
+    def feed_progress(self, key, lines):
+        """Parse a job's output lines for progress."""
+        tracker = self.progress_trackers.get(key)
+        if tracker:
+            tracker.feed(lines)
+    
+    def finish_progress(self, key, options=None):
+        """Stop tracking a job's progress and report its throughput."""
+        tracker = self.progress_trackers.pop(key, None)
+        if tracker and tracker.fraction is not None and tracker.fraction >= 0.95:
+            # Remember the speed of completed files for future time estimates
+            self.eta_estimator.history.record(
+                tracker.profile, tracker.duration or tracker.position, tracker.elapsed
+            )
+        summary = tracker.summary() if tracker else None
+        if summary:
+            options = options or self.get_options_dict()
+            # Tag with the settings that determine speed so throughput can be compared
+            summary += (f" [model: {options.get('model', 'unknown')}, "
+                        f"device: {options.get('device') or 'auto'}, "
+                        f"compute type: {options.get('compute_type') or 'auto'}]")
+            self.write_job_log(key, [summary])
+            self.append_output(summary)
+    
     def update_progress(self):
-        """Update progress display with time remaining."""
+        """Update progress bar and time remaining from the parsed progress of running jobs."""
         if not self.processing_start_time:
             return
         
         elapsed = time.time() - self.processing_start_time
+        trackers = list(self.progress_trackers.values())
+        elapsed_str = f"Elapsed time: {str(timedelta(seconds=int(elapsed)))}"
+        
+        if "single" in self.progress_trackers:
+            overall = trackers[0].fraction
+        elif self.input_files:
+            # Queue: finished files plus the parsed fraction of the running ones
+            running_fraction = sum(t.fraction or 0.0 for t in trackers)
+            overall = min(1.0, (self.current_queue_file_index + running_fraction) / len(self.input_files))
+        else:
+            overall = None
+        
+        if overall is not None:
+            self.progress_bar.setRange(0, 1000)
+            self.progress_bar.setValue(int(overall * 1000))
         
-        # Estimate time remaining (rough estimate)
-        if self.current_file_index > 0 and self.total_files > 0:
-            avg_time_per_file = elapsed / self.current_file_index
-            remaining_files = self.total_files - self.current_file_index
-            estimated_remaining = avg_time_per_file * remaining_files
-            time_str = str(timedelta(seconds=int(estimated_remaining)))
-            self.time_remaining_label.setText(f"Estimated time remaining: {time_str}")
+        if self.queue_window:
+            for tracker in trackers:
+                if tracker.fraction is not None:
+                    file_index = self.queue_window.get_file_index(tracker.file_path)
+                    if file_index >= 0:
+                        self.queue_window.update_file_progress(file_index, tracker.fraction)
+        
+        # Time remaining from file durations and measured speeds
+        running = [(t, t.profile) for t in trackers]
+        pending = {}
+        if "single" not in self.progress_trackers:
+            pending = self.queue.get_waiting_totals()
+        remaining = self.eta_estimator.estimate(running, pending, self.process_manager.max_workers)
+        if remaining is not None:
+            text = f"Estimated time remaining: {str(timedelta(seconds=int(remaining)))}"
+            rtfs = [t.rtf for t in trackers if t.rtf is not None and t.fraction]
+            if rtfs:
+                text += f" ({sum(rtfs):.1f}x real time)"
+            self.time_remaining_label.setText(f"{text} | {elapsed_str}")
         else:
-            self.time_remaining_label.setText(f"Elapsed time: {str(timedelta(seconds=int(elapsed)))}")
+            self.time_remaining_label.setText(elapsed_str)
+        self.time_remaining_label.setVisible(True)
 
 
 def main():
     """Main entry point."""
+    # Required for audio analysis worker processes in the frozen executable
+    multiprocessing.freeze_support()
+    
     app = QApplication(sys.argv)
     app.setStyle("Fusion")  # Modern look
     
@@ -42,6 +42,12 @@ TOOLTIPS = {
     "sentence_mode": "Split subtitles at sentence boundaries. Auto-enabled with diarization. Click ? for details.",
     "batch_recursive": "Process files recursively in subdirectories. Click ? for details.",
     "check_files": "Verify input files before processing. Click ? for details.",
+    "parallel_jobs": "Number of queued files to process at the same time. Click ? for details.",
+    "files_per_process": "Process several queued files with identical settings in one run, loading the model once. Click ? for details.",
+    "skip_transcribed": "Reuse the results of files already transcribed with identical settings instead of transcribing them again. Click ? for details.",
+    "retry_failed": "Automatically retry files that fail for a temporary reason, such as running out of memory. Click ? for details.",
+    "model_memory_limit": "Memory loaded models may use (RAM and GPU memory each); least recently used models are unloaded beyond it.",
+    "warm_backend": "Keep the model loaded in a background process so each file starts transcribing immediately. Click ? for details.",
 }
 
 # Detailed explanations for question mark buttons
@@ -915,6 +921,123 @@ Note: This adds a small amount of time before processing starts, but can save si
 Recommendation: Enable when processing multiple files or when file quality is uncertain. Especially useful with Batch Recursive."""
     },
     
+    "parallel_jobs": {
+        "title": "Parallel Jobs",
+        "content": """Number of files from the processing queue that run at the same time.
+
+What it does:
+• Starts up to this many faster-whisper-xxl processes in parallel
+• Each file still runs as its own job with its own settings
+• Output lines are tagged with the file name when more than one job runs
+
+GPU jobs:
+• Jobs that run on the GPU (Device 'cuda', or 'auto' when a GPU is detected) are limited to one per GPU
+• Extra parallel slots are used by CPU jobs
+
+When to use:
+• CPU-only machines with many cores
+• Large batches of short files
+
+Note: Each process loads its own copy of the model, so memory use grows with the number of parallel jobs. Large models on CPU need several GB of RAM per job.
+
+Recommendation: Leave at 1 for GPU processing. On CPU, start with 2-4 and increase while memory allows."""
+    },
+    
+    "files_per_process": {
+        "title": "Files per Process",
+        "content": """Number of queued files passed to a single faster-whisper-xxl run.
+
+What it does:
+• Groups consecutive queued files that use exactly the same settings
+• Runs the whole group in one process, so the model is loaded only once
+• Results are still reported per file in the Processing Queue window
+
+Max Minutes per Process:
+• Limits the total audio length of one group
+• A file longer than the limit still runs on its own
+• "No limit" groups by file count only
+
+When to use:
+• Large batches of short files, where model loading takes longer than transcription
+• Large models (large-v2, large-v3) that take several seconds to load
+
+Note: Files with different settings (edited in the queue settings dialog) are never grouped together. If a grouped run fails, every file in the group without output files is retried or marked as failed (see Retry Failed Files).
+
+Recommendation: 10-20 files per process for short clips. Leave at 1 for long recordings."""
+    },
+    
+    "skip_transcribed": {
+        "title": "Skip Already Transcribed Files",
+        "content": """Avoids transcribing the same audio twice with the same settings.
+
+How it works:
+• Every successful transcription is recorded with a fingerprint of the input file (its size plus the first and last megabyte) and of the settings that affect the transcript
+• Before processing, each input is checked against these records
+• If a match is found and its output files still exist, they are reused:
+  - Outputs already in the output folder are kept as they are
+  - Otherwise they are copied to the output folder and renamed after the input file
+
+What counts as the same settings:
+• All transcription, filter, diarization and formatting options
+• Options that only change speed or console output (progress display, verbosity, diarization threads) are ignored
+
+Renamed or moved files are still recognized because the fingerprint is based on content.
+Uncheck this to force files to be transcribed again."""
+    },
+    
+    "retry_failed": {
+        "title": "Retry Failed Files",
+        "content": """Number of times a queued file is run again after a failure that is likely temporary.
+
+How failures are classified (from the last lines of the file's output):
+• Out of memory (CUDA or system memory) - retried
+• File locked or access denied (e.g. the output file is open in another program) - retried
+• Network error while downloading a model - retried
+• Process crash (Windows exception exit code) - retried
+• Invalid or unreadable input file - not retried
+• Unknown errors and cancelled files - not retried
+
+Backoff:
+• The first retry starts after 10 seconds, each further one waits twice as long (at most 5 minutes)
+• Other files keep processing in the meantime
+• Waiting files show "Retrying" in the Processing Queue window
+
+Out of memory fallback:
+• Each retry uses a cheaper compute type: float32 → float16 → int8_float16 → int8 on GPU, int8 on CPU
+• Diarization runs with half as many threads
+• The settings used are shown in the output and kept for the file's result
+
+Set to 0 to mark files as failed on the first error."""
+    },
+    
+    "warm_backend": {
+        "title": "Keep Model Loaded Between Files",
+        "content": """Runs files on a model kept loaded in a background process (faster-whisper Python package) instead of starting faster-whisper-xxl.exe for every file.
+
+Why:
+• faster-whisper-xxl.exe loads the model from disk each time it starts - several seconds per file, more for large models
+• With a loaded model, only the first file waits for loading; short clips then take only their transcription time
+
+How it works:
+• One background process per model, device and compute type
+• Several models can stay loaded when files use different models; the least recently used ones are unloaded when the measured memory use exceeds the Memory Limit (applied to RAM and GPU memory separately). "One model" keeps only the model in use
+• Queued files using an already loaded model run before files needing another model (unless a file needing another model has a higher priority), so models are not reloaded back and forth
+• Models already downloaded to the _models folder are used, others are downloaded by the Python package
+• Cancelling stops the current file but keeps the model loaded
+
+Not supported (these files still run with faster-whisper-xxl.exe):
+• Speaker diarization
+• Audio filters (speechnorm, loudnorm, lowhighpass, tempo, denoise)
+• Highlighted words
+• Check Files
+• Speaker labels and embeddings
+• VAD methods other than silero_v4_fw / silero_v5_fw
+
+Subtitle formatting (Standard preset, sentence mode, line width and count, max comma percentage) is approximated: cues are split at sentence ends and commas and wrapped to the line width, but the output can differ slightly from faster-whisper-xxl.exe.
+
+Requires the faster-whisper Python package (pip install faster-whisper)."""
+    },
+    
     "vad_enable": {
         "title": "Voice Activity Detection (VAD)",
         "content": """Voice Activity Detection identifies parts of audio that contain speech and filters out silence and background noise.
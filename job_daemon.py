@@ -0,0 +1,398 @@
+"""
+Local job-submission daemon for Faster Whisper GUI.
+A long-running service that owns one processing queue and accepts transcription jobs
+from other tools over HTTP on the local machine, so many clients can share one node's
+capacity without each starting a GUI. Does not import PyQt6.
+
+Usage:
+    python job_daemon.py --port 8765 --jobs 2 --preset Standard
+    python job_daemon.py --exe fake_faster_whisper.py   # Try it without the real executable
+
+Endpoints (JSON in and out):
+    POST   /jobs                Submit {"input": path or "inputs": [paths], "output_dir", "preset",
+                                "options", "priority", "force"} -> 201 {"jobs": [job, ...]}
+                                ("force": transcribe even if already done with identical settings)
+    GET    /jobs                List all jobs
+    GET    /jobs/<id>           Job status and progress
+    POST   /jobs/<id>/cancel    Cancel a pending or running job (also DELETE /jobs/<id>)
+    GET    /jobs/<id>/result    Output files of a completed job; ?format=srt returns that file's text
+    GET    /health              Queue counts and worker capacity
+"""
+
+import argparse
+import json
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+from cli_runner import BatchRunner, collect_inputs, emit, ORDER_CHOICES
+from command_builder import validate_options
+from eta_estimator import ThroughputHistory
+from file_info_extractor import get_user_data_dir
+from presets import get_preset, get_preset_names
+from process_runner import ProcessRunner
+from processing_queue import ProcessingQueue, JobStatus
+from queue_journal import QueueJournal
+from result_index import find_previous_results, reuse_outputs
+from retry_policy import RetryPolicy
+
+
+DEFAULT_PORT = 8765
+JOURNAL_FILENAME = "daemon_journal.jsonl"  # Separate from the GUI's queue journal
+MAX_REQUEST_BYTES = 1024 * 1024
+
+_JOB_PATH = re.compile(r"^/jobs/(\d+)(/cancel|/result)?/?$")
+
+
+class ServiceError(Exception):
+    """Request error reported to the client with an HTTP status code."""
+    
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class JobService:
+    """
+    Owns the processing queue and runs its jobs on a scheduler thread.
+    
+    All queue access happens under one lock, shared by the request handler
+    threads and the scheduler thread.
+    """
+    
+    def __init__(self, runner, exe_path=None, preset="Standard", retries=RetryPolicy.max_attempts - 1,
+                 journal=None):
+        """
+        Initialize the service.
+        
+        Args:
+            runner: ProcessRunner to run the jobs with
+            exe_path: Executable to run (default: the extracted faster-whisper-xxl.exe)
+            preset: Preset used for jobs submitted without one
+            retries: Retries after temporary failures
+            journal: QueueJournal to persist the queue in (None: not persisted)
+        """
+        self.runner = runner
+        self.preset = preset
+        self.retries = retries
+        self.lock = threading.Lock()
+        self.queue = ProcessingQueue(journal=journal)
+        self.batch = BatchRunner(self.queue, runner, exe_path, ThroughputHistory())
+        self._stop = threading.Event()
+        self._thread = None
+        
+        if journal is not None:
+            # Jobs that were pending or running when the daemon stopped run again
+            policy_name, saved_jobs = journal.load()
+            self.queue.restore(saved_jobs, policy_name)
+            if self.queue.get_pending_count():
+                emit("restored", pending=self.queue.get_pending_count())
+    
+    def start(self):
+        """Start the scheduler thread."""
+        self._thread = threading.Thread(target=self._schedule, daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout=10.0):
+        """
+        Stop the scheduler and the running processes.
+        
+        Running jobs are left as processing in the journal, so they start again
+        the next time the daemon starts.
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+        self.runner.cancel()
+        if self.queue.journal is not None:
+            self.queue.journal.close()
+    
+    def _schedule(self):
+        """Start jobs and handle process events until stopped (runs on its own thread)."""
+        while not self._stop.is_set():
+            with self.lock:
+                self.batch.requeue_due_retries()
+                self.batch.start_jobs()
+            event = self.runner.get_event(timeout=0.5)
+            if event and not self._stop.is_set():
+                with self.lock:
+                    self.batch.handle_event(*event)
+    
+    def submit(self, request):
+        """
+        Queue the files of a submit request.
+        
+        Returns:
+            List of job dictionaries (see describe())
+        """
+        inputs = request.get("inputs") or ([request["input"]] if request.get("input") else [])
+        if not isinstance(inputs, list) or not inputs:
+            raise ServiceError(400, "Request needs \"input\" or \"inputs\"")
+        files = collect_inputs([str(path) for path in inputs])
+        if not files:
+            raise ServiceError(400, "No media files found for the given input(s)")
+        
+        preset = request.get("preset") or self.preset
+        if preset not in get_preset_names():
+            raise ServiceError(400, f"Unknown preset: {preset}")
+        options = get_preset(preset)
+        overrides = request.get("options") or {}
+        if not isinstance(overrides, dict):
+            raise ServiceError(400, "\"options\" must be an object")
+        options.update(overrides)
+        options.setdefault("print_progress", True)
+        is_valid, error_msg = validate_options(options)
+        if not is_valid:
+            raise ServiceError(400, f"Invalid options: {error_msg}")
+        
+        output_dir = str(request.get("output_dir") or "source")
+        if output_dir != "source":
+            try:
+                Path(output_dir).mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                raise ServiceError(400, f"Cannot create output folder: {e}")
+        try:
+            priority = int(request.get("priority", 0))
+        except (TypeError, ValueError):
+            raise ServiceError(400, "\"priority\" must be an integer")
+        
+        # Files already transcribed with identical settings complete immediately
+        previous = {} if request.get("force") else find_previous_results({f: options for f in files})
+        
+        jobs = []
+        with self.lock:
+            for input_file in files:
+                job = self.queue.add_job(
+                    [input_file], output_dir, options, priority=priority,
+                    retry_policy=RetryPolicy(max_attempts=self.retries + 1)
+                )
+                reused = reuse_outputs(previous[input_file], input_file, output_dir) if input_file in previous else []
+                if reused:
+                    self.queue.mark_job_completed(job, reused)
+                    emit("skipped", job_id=job.job_id, input=input_file, outputs=reused,
+                         reason="Already transcribed with identical settings")
+                else:
+                    emit("queued", job_id=job.job_id, input=input_file, output_dir=output_dir)
+                jobs.append(self.describe(job))
+        return jobs
+    
+    def describe(self, job):
+        """Get the client-facing description of a job (call with the lock held)."""
+        info = {
+            "job_id": job.job_id,
+            "input": job.input_files[0],
+            "output_dir": job.output_dir,
+            "status": job.status.name.lower(),
+            "priority": job.priority,
+            "attempts": job.attempts,
+            "error": job.error_message,
+            "output_files": [str(f) for f in job.output_files],
+        }
+        tracker = self.batch.trackers.get(job.job_id)
+        if tracker is not None:
+            eta = tracker.eta()
+            info["progress"] = {
+                "fraction": tracker.fraction,
+                "position": tracker.position,
+                "duration": tracker.duration,
+                "eta_seconds": round(eta, 1) if eta is not None else None,
+            }
+        return info
+    
+    def get_job(self, job_id):
+        """Get a job or raise a 404 error."""
+        job = self.queue.get_job(job_id)
+        if job is None:
+            raise ServiceError(404, f"No job {job_id}")
+        return job
+    
+    def status(self, job_id):
+        """Get a job's description."""
+        with self.lock:
+            return self.describe(self.get_job(job_id))
+    
+    def list_jobs(self):
+        """Get the descriptions of all jobs."""
+        with self.lock:
+            return [self.describe(job) for job in self.queue.jobs]
+    
+    def cancel(self, job_id):
+        """Cancel a job that is pending, waiting to retry or running."""
+        with self.lock:
+            job = self.get_job(job_id)
+            if not self.batch.cancel_job(job):
+                raise ServiceError(409, f"Job {job_id} is already {job.status.name.lower()}")
+            return self.describe(job)
+    
+    def result(self, job_id, output_format=None):
+        """
+        Get the output files of a completed job.
+        
+        Returns:
+            Job description, or (file path, text) of one output if output_format is given
+        """
+        with self.lock:
+            job = self.get_job(job_id)
+            if job.status != JobStatus.COMPLETED:
+                raise ServiceError(409, f"Job {job_id} is {job.status.name.lower()}, not completed")
+            info = self.describe(job)
+        if not output_format:
+            return info
+        extension = "." + output_format.lower().lstrip(".")
+        for output_file in info["output_files"]:
+            if output_file.lower().endswith(extension):
+                try:
+                    with open(output_file, "r", encoding="utf-8") as f:
+                        return output_file, f.read()
+                except OSError as e:
+                    raise ServiceError(410, f"Cannot read {output_file}: {e}")
+        raise ServiceError(404, f"Job {job_id} has no {output_format} output")
+    
+    def health(self):
+        """Get queue counts and worker capacity."""
+        with self.lock:
+            counts = {status.name.lower(): self.queue.get_status_count(status) for status in JobStatus}
+        return {
+            "status": "ok",
+            "workers": self.runner.max_workers,
+            "running": self.runner.active_count(),
+            "jobs": counts,
+        }
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end of the JobService set on the server."""
+    
+    server_version = "FasterWhisperJobDaemon/1.0"
+    
+    @property
+    def service(self):
+        return self.server.service
+    
+    def do_GET(self):
+        self._dispatch("GET")
+    
+    def do_POST(self):
+        self._dispatch("POST")
+    
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+    
+    def _dispatch(self, method):
+        """Route a request and send its JSON response."""
+        try:
+            token = self.server.token
+            if token and self.headers.get("Authorization") != f"Bearer {token}":
+                raise ServiceError(401, "Missing or wrong bearer token")
+            
+            url = urlparse(self.path)
+            match = _JOB_PATH.match(url.path)
+            if url.path == "/health" and method == "GET":
+                self._send_json(200, self.service.health())
+            elif url.path.rstrip("/") == "/jobs" and method == "GET":
+                self._send_json(200, {"jobs": self.service.list_jobs()})
+            elif url.path.rstrip("/") == "/jobs" and method == "POST":
+                self._send_json(201, {"jobs": self.service.submit(self._read_json())})
+            elif match and method == "GET" and not match.group(2):
+                self._send_json(200, self.service.status(int(match.group(1))))
+            elif match and ((method == "POST" and match.group(2) == "/cancel")
+                            or (method == "DELETE" and not match.group(2))):
+                self._send_json(200, self.service.cancel(int(match.group(1))))
+            elif match and method == "GET" and match.group(2) == "/result":
+                output_format = parse_qs(url.query).get("format", [None])[0]
+                result = self.service.result(int(match.group(1)), output_format)
+                if output_format:
+                    path, text = result
+                    self._send_json(200, {"path": path, "content": text})
+                else:
+                    self._send_json(200, result)
+            else:
+                raise ServiceError(404, f"No endpoint {method} {url.path}")
+        except ServiceError as e:
+            self._send_json(e.status, {"error": str(e)})
+        except Exception as e:
+            self._send_json(500, {"error": f"Internal error: {e}"})
+    
+    def _read_json(self):
+        """Read the request body as a JSON object."""
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_REQUEST_BYTES:
+            raise ServiceError(413, "Request body too large")
+        try:
+            data = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as e:
+            raise ServiceError(400, f"Invalid JSON: {e}")
+        if not isinstance(data, dict):
+            raise ServiceError(400, "Request body must be a JSON object")
+        return data
+    
+    def _send_json(self, status, data):
+        """Send a JSON response."""
+        body = json.dumps(data, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        """Log requests to stderr (stdout carries the job events)."""
+        sys.stderr.write(f"{self.address_string()} - {format % args}\n")
+
+
+def make_server(service, host="127.0.0.1", port=DEFAULT_PORT, token=None):
+    """Create the HTTP server for a service (port 0 picks a free port)."""
+    server = ThreadingHTTPServer((host, port), JobRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.token = token
+    return server
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Serve a local transcription queue over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1 - this machine only)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default: {DEFAULT_PORT})")
+    parser.add_argument("--token", help="Require \"Authorization: Bearer TOKEN\" on every request")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Files processed in parallel (default: 1)")
+    parser.add_argument("--order", choices=list(ORDER_CHOICES), default="priority",
+                        help="Processing order (default: priority - highest \"priority\" first, then in order submitted)")
+    parser.add_argument("--preset", default="Standard", choices=get_preset_names(),
+                        help="Preset for jobs submitted without one (default: Standard)")
+    parser.add_argument("--retries", type=int, default=RetryPolicy.max_attempts - 1,
+                        help=f"Retries after temporary failures (default: {RetryPolicy.max_attempts - 1})")
+    parser.add_argument("--exe", help="faster-whisper-xxl executable, or fake_faster_whisper.py for testing")
+    parser.add_argument("--no-journal", action="store_true", help="Don't persist the queue across restarts")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    args = parse_args(argv)
+    journal = None if args.no_journal else QueueJournal(get_user_data_dir() / JOURNAL_FILENAME)
+    service = JobService(ProcessRunner(args.jobs), args.exe, args.preset, max(0, args.retries), journal)
+    service.queue.set_policy(ORDER_CHOICES[args.order])
+    try:
+        server = make_server(service, args.host, args.port, args.token)
+    except OSError as e:
+        emit("error", message=f"Cannot listen on {args.host}:{args.port}: {e}")
+        return 1
+    
+    service.start()
+    emit("listening", host=args.host, port=server.server_address[1], workers=args.jobs)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
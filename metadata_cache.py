@@ -0,0 +1,250 @@
+"""
+Persistent media metadata cache for Faster Whisper GUI.
+Stores ffprobe results in an SQLite database so unchanged files are not probed again.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from file_info_extractor import get_user_data_dir
+
+
+CACHE_FILENAME = "metadata_cache.db"
+DEFAULT_MAX_ENTRIES = 20000  # Least recently used entries are evicted beyond this
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    duration REAL,
+    codec TEXT,
+    bit_rate INTEGER,
+    sample_rate INTEGER,
+    channels INTEGER,
+    last_access REAL NOT NULL
+)
+"""
+
+_ANALYSIS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis (
+    path TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (path, kind)
+)
+"""
+
+_FIELDS = ("duration", "codec", "bit_rate", "sample_rate", "channels")
+
+
+class MetadataCache:
+    """
+    SQLite cache of probed media metadata.
+    
+    Entries are keyed by absolute path and are only returned while the file's
+    size and modification time (ns) still match, so edited files are re-probed.
+    """
+    
+    def __init__(self, db_path=None, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache.
+        
+        Args:
+            db_path: Path to the SQLite database (default: user data directory)
+            max_entries: Maximum number of cached files before LRU eviction
+        """
+        self.db_path = Path(db_path) if db_path else get_user_data_dir() / CACHE_FILENAME
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = None
+        self._puts_since_evict = 0
+        try:
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            # Lookups touch last_access on every hit - avoid a full sync per commit
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.execute(_ANALYSIS_SCHEMA)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON metadata(last_access)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_analysis_last_access ON analysis(last_access)")
+            self._conn.commit()
+        except sqlite3.Error as e:
+            # Cache is an optimization only - run without it if the database is unusable
+            print(f"Metadata cache disabled: {e}")
+            self._conn = None
+    
+    @staticmethod
+    def _file_key(file_path):
+        """Get (absolute path, size, mtime_ns) for a file, or None if it cannot be read."""
+        try:
+            path = Path(file_path).absolute()
+            stat = path.stat()
+            return str(path), stat.st_size, stat.st_mtime_ns
+        except OSError:
+            return None
+    
+    def get(self, file_path):
+        """
+        Get cached metadata for a file.
+        
+        Returns:
+            Dictionary with duration, codec, bit_rate, sample_rate and channels,
+            or None if the file is not cached or has changed since it was cached.
+        """
+        if self._conn is None:
+            return None
+        key = self._file_key(file_path)
+        if key is None:
+            return None
+        path, size, mtime_ns = key
+        
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT size, mtime_ns, duration, codec, bit_rate, sample_rate, channels "
+                    "FROM metadata WHERE path = ?",
+                    (path,)
+                ).fetchone()
+                if row is None or row[0] != size or row[1] != mtime_ns:
+                    return None
+                self._conn.execute(
+                    "UPDATE metadata SET last_access = ? WHERE path = ?",
+                    (time.time(), path)
+                )
+                self._conn.commit()
+            except sqlite3.Error:
+                return None
+        
+        return dict(zip(_FIELDS, row[2:]))
+    
+    def put(self, file_path, metadata):
+        """Store metadata for a file (keys as returned by get())."""
+        if self._conn is None:
+            return
+        key = self._file_key(file_path)
+        if key is None:
+            return
+        path, size, mtime_ns = key
+        
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO metadata "
+                    "(path, size, mtime_ns, duration, codec, bit_rate, sample_rate, channels, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (path, size, mtime_ns) + tuple(metadata.get(f) for f in _FIELDS) + (time.time(),)
+                )
+                self._puts_since_evict += 1
+                # Evict in bulk rather than on every insert
+                if self._puts_since_evict >= 100:
+                    self._evict()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"Error writing metadata cache: {e}")
+    
+    def get_analysis(self, file_path, kind):
+        """
+        Get a cached analysis result for a file.
+        
+        Args:
+            file_path: Media file path
+            kind: Analysis variant (results of different analysis modes are kept apart)
+        
+        Returns:
+            The stored result dictionary, or None if missing or the file has changed.
+        """
+        if self._conn is None:
+            return None
+        key = self._file_key(file_path)
+        if key is None:
+            return None
+        path, size, mtime_ns = key
+        
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT size, mtime_ns, result FROM analysis WHERE path = ? AND kind = ?",
+                    (path, kind)
+                ).fetchone()
+                if row is None or row[0] != size or row[1] != mtime_ns:
+                    return None
+                self._conn.execute(
+                    "UPDATE analysis SET last_access = ? WHERE path = ? AND kind = ?",
+                    (time.time(), path, kind)
+                )
+                self._conn.commit()
+            except sqlite3.Error:
+                return None
+        
+        try:
+            return json.loads(row[2])
+        except ValueError:
+            return None
+    
+    def put_analysis(self, file_path, kind, result):
+        """Store an analysis result (must be JSON serializable) for a file."""
+        if self._conn is None:
+            return
+        key = self._file_key(file_path)
+        if key is None:
+            return
+        path, size, mtime_ns = key
+        
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO analysis (path, kind, size, mtime_ns, result, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (path, kind, size, mtime_ns, json.dumps(result), time.time())
+                )
+                self._puts_since_evict += 1
+                if self._puts_since_evict >= 100:
+                    self._evict()
+                self._conn.commit()
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                print(f"Error writing analysis cache: {e}")
+    
+    def _evict(self):
+        """Remove least recently used entries beyond max_entries (caller holds the lock)."""
+        self._puts_since_evict = 0
+        for table in ("metadata", "analysis"):
+            count = self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            excess = count - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE rowid IN "
+                    f"(SELECT rowid FROM {table} ORDER BY last_access ASC LIMIT ?)",
+                    (excess,)
+                )
+    
+    def clear(self):
+        """Remove all cached entries."""
+        if self._conn is None:
+            return
+        with self._lock:
+            try:
+                self._conn.execute("DELETE FROM metadata")
+                self._conn.execute("DELETE FROM analysis")
+                self._conn.commit()
+            except sqlite3.Error:
+                pass
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_metadata_cache():
+    """Get the shared metadata cache instance."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = MetadataCache()
+        return _cache
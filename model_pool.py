@@ -0,0 +1,245 @@
+"""
+Model pool for the warm transcription backend of Faster Whisper GUI.
+Keeps the warm model servers of several (model, device, compute type) combinations
+loaded and unloads the least recently used ones when their measured memory use
+exceeds a budget.
+"""
+
+import atexit
+import ctypes
+import subprocess
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from warm_backend import WarmModelServer, get_model_key
+
+
+MB = 1024 * 1024
+DEFAULT_MEMORY_BUDGET_MB = 8192
+MEMORY_KINDS = ("ram", "gpu")
+
+
+def get_process_memory_mb(pid):
+    """
+    Get the resident memory (RAM) of a process.
+    
+    Returns:
+        Megabytes, or None if it can't be measured
+    """
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss / MB
+        except psutil.Error:
+            return None
+    
+    if sys.platform == 'win32':
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", ctypes.c_ulong),
+                ("PageFaultCount", ctypes.c_ulong),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+        
+        kernel32 = ctypes.windll.kernel32
+        kernel32.OpenProcess.restype = ctypes.c_void_p
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return None
+        try:
+            counters = ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            if not kernel32.K32GetProcessMemoryInfo(ctypes.c_void_p(handle), ctypes.byref(counters), counters.cb):
+                return None
+            return counters.WorkingSetSize / MB
+        finally:
+            kernel32.CloseHandle(ctypes.c_void_p(handle))
+    
+    try:
+        with open(Path("/proc") / str(pid) / "status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024  # Reported in kB
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def get_gpu_process_memory_mb():
+    """
+    Get the GPU memory used by each process (from nvidia-smi).
+    
+    Returns:
+        Dictionary process id -> megabytes (empty if nvidia-smi is unavailable)
+    """
+    try:
+        result = subprocess.run(
+            ["nvidia-smi", "--query-compute-apps=pid,used_memory", "--format=csv,noheader,nounits"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+        )
+    except (OSError, subprocess.SubprocessError):
+        return {}
+    if result.returncode != 0:
+        return {}
+    
+    usage = {}
+    for line in result.stdout.splitlines():
+        parts = [part.strip() for part in line.split(",")]
+        if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
+            usage[int(parts[0])] = usage.get(int(parts[0]), 0.0) + float(parts[1])
+    return usage
+
+
+class ModelPool:
+    """
+    Least recently used pool of warm model servers with a memory budget.
+    
+    The memory of each loaded model is measured from its worker process (resident
+    memory, plus GPU memory from nvidia-smi for models not on the CPU) and the budget
+    applies to RAM and GPU memory separately. Servers running a transcription are
+    never unloaded. Before a model is loaded, room is made for the memory it used
+    the last time it was loaded; after loading, the budget is enforced on the
+    measured usage.
+    """
+    
+    def __init__(self, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB):
+        """
+        Initialize the pool.
+        
+        Args:
+            memory_budget_mb: Memory loaded models may use; 0 keeps only one model loaded
+        """
+        self.memory_budget_mb = memory_budget_mb
+        self._servers = OrderedDict()  # Model key -> WarmModelServer, least recently used first
+        self._footprints = {}  # Model key -> memory measured when last loaded ({"ram": MB, "gpu": MB})
+        self._lock = threading.Lock()
+    
+    def set_memory_budget(self, memory_budget_mb):
+        """Change the memory budget (applied the next time a model is loaded or used)."""
+        self.memory_budget_mb = max(0, memory_budget_mb)
+    
+    def get_server(self, options):
+        """
+        Get the server for an options dict's model, device and compute type, marking it most recently used.
+        
+        Returns:
+            WarmModelServer
+        """
+        key = get_model_key(options)
+        with self._lock:
+            server = self._servers.get(key)
+            if server is None:
+                server = WarmModelServer(*key)
+                server.pool = self
+                self._servers[key] = server
+            self._servers.move_to_end(key)
+            return server
+    
+    def loaded_keys(self):
+        """Get the (model, device, compute_type) keys of models loaded or loading."""
+        with self._lock:
+            return {key for key, server in self._servers.items() if server.is_alive()}
+    
+    def memory_usage(self):
+        """
+        Measure the memory used by each loaded model.
+        
+        Returns:
+            Dictionary model key -> {"ram": MB, "gpu": MB}
+        """
+        with self._lock:
+            servers = [(key, server) for key, server in self._servers.items() if server.is_alive()]
+        gpu_usage = get_gpu_process_memory_mb() if any(key[1] != "cpu" for key, _ in servers) else {}
+        usage = {}
+        for key, server in servers:
+            pid = server.pid
+            if pid is None:
+                continue
+            usage[key] = {"ram": get_process_memory_mb(pid) or 0.0, "gpu": gpu_usage.get(pid, 0.0)}
+            if server.is_loaded():
+                self._footprints[key] = usage[key]
+        return usage
+    
+    def make_room(self, server, report=None):
+        """Unload least recently used models so the one about to load fits in the budget (as last measured)."""
+        self._unload_until_within_budget(server, self._footprints.get(server.key), report)
+    
+    def enforce_budget(self, server, report=None):
+        """Unload least recently used models (other than the given server's) while over the budget."""
+        self._unload_until_within_budget(server, None, report)
+    
+    def _unload_until_within_budget(self, keep, extra, report):
+        """
+        Unload idle models, least recently used first, until the budget is met.
+        
+        Args:
+            keep: Server that stays loaded
+            extra: Memory ({"ram": MB, "gpu": MB}) to reserve on top of the current usage, or None
+            report: Optional function called with a list of output lines per unloaded model
+        """
+        usage = self.memory_usage()
+        totals = {kind: sum(u[kind] for u in usage.values()) + (extra or {}).get(kind, 0.0)
+                  for kind in MEMORY_KINDS}
+        with self._lock:
+            candidates = [(key, server) for key, server in self._servers.items()
+                          if server is not keep and key in usage]
+        
+        for key, server in candidates:
+            within_budget = all(totals[kind] <= self.memory_budget_mb for kind in MEMORY_KINDS)
+            if self.memory_budget_mb > 0 and within_budget:
+                break
+            if not server.try_close():
+                continue  # Busy with a transcription
+            for kind in MEMORY_KINDS:
+                totals[kind] -= usage[key][kind]
+            if report:
+                report([f"Unloaded model {server.description} to stay within the memory limit "
+                        f"({usage[key]['ram']:.0f} MB RAM, {usage[key]['gpu']:.0f} MB GPU freed)"])
+    
+    def shutdown(self):
+        """Stop all worker processes."""
+        with self._lock:
+            servers = list(self._servers.values())
+            self._servers.clear()
+        for server in servers:
+            server.close()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_model_pool():
+    """Get the model pool shared by all warm workers."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ModelPool()
+        return _pool
+
+
+def shutdown_model_pool():
+    """Stop all warm model worker processes (at exit)."""
+    with _pool_lock:
+        pool = _pool
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_model_pool)
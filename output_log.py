@@ -0,0 +1,160 @@
+"""
+On-disk output logs for Faster Whisper GUI.
+The output area only keeps the most recent lines in memory; the full output is streamed to
+rotating log files so older lines can be paged back in and each job's output can be reviewed later.
+"""
+
+import re
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+
+from file_info_extractor import get_user_data_dir
+
+
+LOG_DIR_NAME = "logs"
+MAX_LOG_BYTES = 10 * 1024 * 1024  # Size of one log part before rotating to the next
+MAX_LOG_PARTS = 10  # Oldest parts of a log are deleted beyond this
+MAX_LOG_FILES = 500  # Oldest log files in the log directory are deleted beyond this
+
+
+def get_log_dir():
+    """Get (and create) the directory output logs are written to."""
+    log_dir = get_user_data_dir() / LOG_DIR_NAME
+    log_dir.mkdir(parents=True, exist_ok=True)
+    return log_dir
+
+
+def make_log_name(label):
+    """Build a unique, filesystem-safe log name from a label (e.g. an input file name)."""
+    safe_label = re.sub(r"[^\w.-]+", "_", label).strip("_")[:80] or "log"
+    return f"{datetime.now():%Y%m%d_%H%M%S}_{safe_label}"
+
+
+def cleanup_old_logs(log_dir=None, max_files=MAX_LOG_FILES):
+    """Delete the oldest log files beyond max_files."""
+    try:
+        log_dir = Path(log_dir) if log_dir else get_log_dir()
+        log_files = sorted(log_dir.glob("*.log"), key=lambda p: p.stat().st_mtime)
+        for log_file in log_files[:max(0, len(log_files) - max_files)]:
+            log_file.unlink()
+    except OSError as e:
+        print(f"Error cleaning up logs: {e}")
+
+
+class RotatingLog:
+    """
+    Append-only line log split into size-limited part files.
+    
+    Lines are numbered from 0 in the order they were written. When a part reaches
+    max_bytes a new part is started, and the oldest parts are deleted beyond max_parts,
+    so read_lines() can only return lines from parts that still exist.
+    """
+    
+    def __init__(self, name, log_dir=None, max_bytes=MAX_LOG_BYTES, max_parts=MAX_LOG_PARTS):
+        """
+        Initialize a log. Files are only created once the first line is written.
+        
+        Args:
+            name: Base file name (without extension), see make_log_name()
+            log_dir: Directory for the log files (default: user data log directory)
+            max_bytes: Maximum size of one part file
+            max_parts: Maximum number of part files kept
+        """
+        self.name = name
+        self.log_dir = Path(log_dir) if log_dir else None
+        self.max_bytes = max_bytes
+        self.max_parts = max_parts
+        self.line_count = 0
+        self.parts = []  # [path, first line number, line count] per existing part
+        self._file = None
+        self._part_bytes = 0
+        self._part_number = 0
+        self._failed = False
+    
+    @property
+    def path(self):
+        """Path of the first part still on disk (None if nothing was written)."""
+        return self.parts[0][0] if self.parts else None
+    
+    def _open_part(self):
+        """Start a new part file, deleting the oldest part if there are too many."""
+        if self._file:
+            self._file.close()
+        log_dir = self.log_dir or get_log_dir()
+        self._part_number += 1
+        suffix = f".{self._part_number}" if self._part_number > 1 else ""
+        path = log_dir / f"{self.name}{suffix}.log"
+        if self._part_number == 1:
+            # Two jobs for files with the same name may start within the same second
+            copy = 1
+            while path.exists():
+                copy += 1
+                path = log_dir / f"{self.name}_{copy}.log"
+            self.name = path.stem
+        # Only "\n" ends a line so "\r" progress output keeps line numbers in step with the output area
+        self._file = open(path, "w", encoding="utf-8", errors="replace", newline="\n")
+        self._part_bytes = 0
+        self.parts.append([path, self.line_count, 0])
+        
+        while len(self.parts) > self.max_parts:
+            old_path = self.parts.pop(0)[0]
+            try:
+                old_path.unlink()
+            except OSError:
+                pass
+    
+    def write_lines(self, lines):
+        """Append lines to the log."""
+        if self._failed or not lines:
+            return
+        try:
+            if self._file is None or self._part_bytes >= self.max_bytes:
+                self._open_part()
+            text = "\n".join(lines) + "\n"
+            self._file.write(text)
+            self._part_bytes += len(text)
+            self.parts[-1][2] += len(lines)
+            self.line_count += len(lines)
+        except OSError as e:
+            # Logging must never interrupt processing - keep the output area working without it
+            print(f"Error writing log {self.name}: {e}")
+            self._failed = True
+    
+    def read_lines(self, start, end):
+        """
+        Read previously written lines.
+        
+        Args:
+            start: First line number (inclusive)
+            end: Last line number (exclusive)
+        
+        Returns:
+            List of lines without line endings (lines in deleted parts are skipped)
+        """
+        if self._file:
+            self._file.flush()
+        lines = []
+        for path, first_line, count in self.parts:
+            part_start = max(start, first_line)
+            part_end = min(end, first_line + count)
+            if part_start >= part_end:
+                continue
+            try:
+                with open(path, "r", encoding="utf-8", errors="replace", newline="\n") as f:
+                    lines.extend(
+                        line.rstrip("\n")
+                        for line in islice(f, part_start - first_line, part_end - first_line)
+                    )
+            except OSError as e:
+                print(f"Error reading log {path}: {e}")
+        return lines
+    
+    def close(self):
+        """Close the current part file."""
+        if self._file:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
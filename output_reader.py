@@ -0,0 +1,89 @@
+"""
+Chunked output reader for Faster Whisper GUI.
+Reads a subprocess's output pipe in binary chunks, decodes it incrementally and
+splits it into lines at "\\n", "\\r\\n" and "\\r" (progress bars redraw with "\\r").
+"""
+
+import codecs
+import os
+import re
+
+
+CHUNK_SIZE = 65536  # os.read returns as soon as any output is available, up to this many bytes
+OUTPUT_ENCODING = "utf-8"
+
+_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+
+class LineSplitter:
+    """
+    Incremental decoder turning chunks of bytes into complete lines.
+    
+    Multi-byte characters and "\\r\\n" pairs split across chunks are handled; the
+    unfinished last line is kept until its line break arrives (or flush()).
+    """
+    
+    def __init__(self, encoding=OUTPUT_ENCODING):
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._partial = ""
+        self._after_cr = False  # Last chunk ended with "\r" (a "\n" may follow in the next one)
+    
+    def feed(self, data):
+        """
+        Decode a chunk of bytes.
+        
+        Returns:
+            List of the lines completed by this chunk (without line breaks)
+        """
+        text = self._decoder.decode(data)
+        if not text:
+            return []  # Only part of a multi-byte character
+        if self._after_cr and text[0] == "\n":
+            text = text[1:]  # Second half of a "\r\n" split across chunks
+        self._after_cr = text.endswith("\r")
+        lines = _LINE_BREAK.split(self._partial + text)
+        self._partial = lines.pop()
+        return lines
+    
+    def flush(self):
+        """
+        Finish decoding at the end of the output.
+        
+        Returns:
+            List with the unfinished last line, if any
+        """
+        text = self._partial + self._decoder.decode(b"", final=True)
+        self._partial = ""
+        return [text] if text else []
+
+
+def get_output_environment():
+    """Environment for a child process, asking Python-based executables to write output in OUTPUT_ENCODING."""
+    return dict(os.environ, PYTHONIOENCODING=OUTPUT_ENCODING)
+
+
+def read_lines(stream, on_lines, cancel_event=None, encoding=OUTPUT_ENCODING):
+    """
+    Read a binary pipe until it closes, passing on complete lines chunk by chunk.
+    
+    Args:
+        stream: Binary file object of the pipe (e.g. Popen.stdout without text mode)
+        on_lines: Function called with each non-empty list of lines
+        cancel_event: Optional threading.Event; reading stops once it is set
+        encoding: Output encoding (invalid bytes are replaced)
+    """
+    fd = stream.fileno()
+    splitter = LineSplitter(encoding)
+    try:
+        while cancel_event is None or not cancel_event.is_set():
+            data = os.read(fd, CHUNK_SIZE)
+            if not data:
+                break  # Pipe closed - the process exited
+            lines = splitter.feed(data)
+            if lines:
+                on_lines(lines)
+    except (OSError, ValueError):
+        pass  # Stream closed
+    lines = splitter.flush()
+    if lines:
+        on_lines(lines)
@@ -0,0 +1,172 @@
+"""
+Output file watcher for Faster Whisper GUI.
+Watches the output directories of running jobs and reports each expected output
+file as soon as it has been fully written.
+"""
+
+import time
+from pathlib import Path
+
+from PyQt6.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+
+SETTLE_MS = 500  # A file is complete once it has not changed for this long
+MTIME_TOLERANCE = 2.0  # Seconds (file systems with coarse timestamps, e.g. FAT)
+
+
+class OutputWatcher(QObject):
+    """
+    Reports expected output files of running jobs as they are written.
+    
+    Directories are watched for new files and the expected files themselves for
+    writes. A file is reported once its size has stayed the same for SETTLE_MS,
+    or immediately when its job's process has exited (see finish()). Files last
+    written before the job started are never reported.
+    """
+    
+    file_ready = pyqtSignal(object, str)  # Emitted per output file (job key, path)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._jobs = {}  # Job key -> {"since": start time, "pending": set of paths, "ready": list of paths}
+        self._owners = {}  # Expected path -> job key
+        self._dir_refs = {}  # Watched directory -> number of pending expected files in it
+        self._settle_timers = {}  # Path -> QTimer
+        self._sizes = {}  # Path -> size when it last changed
+    
+    def watch(self, key, paths, since=None):
+        """
+        Start watching for a job's output files.
+        
+        Args:
+            key: Job key reported with each file
+            paths: Expected output file paths
+            since: Time the job started (default: now)
+        """
+        self.unwatch(key)
+        pending = {str(Path(p)) for p in paths}
+        self._jobs[key] = {"since": (since or time.time()) - MTIME_TOLERANCE, "pending": pending, "ready": []}
+        for path in pending:
+            self._owners[path] = key
+            directory = str(Path(path).parent)
+            if directory not in self._dir_refs:
+                self._dir_refs[directory] = 0
+                if Path(directory).is_dir():
+                    self._watcher.addPath(directory)
+            self._dir_refs[directory] += 1
+            if Path(path).exists():
+                # Overwriting an existing file doesn't change the directory listing
+                self._watcher.addPath(path)
+    
+    def ready_files(self, key):
+        """Get the output files reported so far for a job."""
+        job = self._jobs.get(key)
+        return [Path(p) for p in job["ready"]] if job else []
+    
+    def is_complete(self, key):
+        """Check if all expected output files of a watched job have been reported."""
+        job = self._jobs.get(key)
+        return bool(job) and not job["pending"]
+    
+    def finish(self, key):
+        """
+        Report the remaining output files of a job whose process has exited.
+        
+        Returns:
+            All output files written by the job
+        """
+        job = self._jobs.get(key)
+        if not job:
+            return []
+        for path in sorted(job["pending"]):
+            if self._is_new(path, job["since"]):
+                self._report(path)
+        ready = self.ready_files(key)
+        self.unwatch(key)
+        return ready
+    
+    def unwatch(self, key):
+        """Stop watching a job's output files."""
+        job = self._jobs.pop(key, None)
+        if not job:
+            return
+        for path in job["pending"]:
+            self._release(path)
+    
+    def _is_new(self, path, since):
+        """Check if a file exists and was written after the given time."""
+        try:
+            return Path(path).stat().st_mtime >= since
+        except OSError:
+            return False
+    
+    def _on_directory_changed(self, directory):
+        """Check the pending files of a directory whose listing changed."""
+        for path, key in list(self._owners.items()):
+            if str(Path(path).parent) == directory and self._is_new(path, self._jobs[key]["since"]):
+                if path not in self._watcher.files():
+                    self._watcher.addPath(path)
+                self._on_file_changed(path)
+    
+    def _on_file_changed(self, path):
+        """Restart the settle timer of a file that was written to."""
+        if path not in self._owners:
+            return
+        try:
+            self._sizes[path] = Path(path).stat().st_size
+        except OSError:
+            return  # Deleted or replaced - a new directory change follows
+        timer = self._settle_timers.get(path)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda p=path: self._on_settled(p))
+            self._settle_timers[path] = timer
+        timer.start(SETTLE_MS)
+    
+    def _on_settled(self, path):
+        """Report a file that has stopped changing."""
+        key = self._owners.get(path)
+        if key is None:
+            return
+        try:
+            size = Path(path).stat().st_size
+        except OSError:
+            return
+        if size != self._sizes.get(path):
+            self._on_file_changed(path)  # Written to without a change notification
+        elif size > 0 and self._is_new(path, self._jobs[key]["since"]):
+            self._report(path)
+        # Empty files are reported by the next write or by finish()
+    
+    def _report(self, path):
+        """Mark a file ready and emit it."""
+        key = self._owners.get(path)
+        job = self._jobs.get(key)
+        if job is None or path not in job["pending"]:
+            return
+        job["pending"].discard(path)
+        job["ready"].append(path)
+        self._release(path)
+        self.file_ready.emit(key, path)
+    
+    def _release(self, path):
+        """Stop watching an expected file (and its directory when no other file needs it)."""
+        self._owners.pop(path, None)
+        self._sizes.pop(path, None)
+        timer = self._settle_timers.pop(path, None)
+        if timer is not None:
+            timer.stop()
+            timer.deleteLater()
+        if path in self._watcher.files():
+            self._watcher.removePath(path)
+        directory = str(Path(path).parent)
+        if directory in self._dir_refs:
+            self._dir_refs[directory] -= 1
+            if self._dir_refs[directory] <= 0:
+                del self._dir_refs[directory]
+                if directory in self._watcher.directories():
+                    self._watcher.removePath(directory)
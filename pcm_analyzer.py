@@ -0,0 +1,242 @@
+"""
+Streaming PCM audio analysis for Faster Whisper GUI.
+Decodes audio to 16 kHz mono float32 with ffmpeg and measures it with NumPy in constant memory.
+"""
+
+import subprocess
+import sys
+import threading
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+SAMPLE_RATE = 16000  # Whisper's native rate
+FRAME_SIZE = 512  # Samples per analysis frame (32 ms)
+CHUNK_FRAMES = 625  # Frames per read from ffmpeg (~20 s of audio, ~1.3 MB)
+SILENCE_FLOOR_DB = -120.0
+
+# Histogram of per-frame levels used for percentiles in constant memory
+LEVEL_BIN_DB = 0.5
+LEVEL_BINS = int(-SILENCE_FLOOR_DB / LEVEL_BIN_DB)
+
+SPEECH_ABOVE_FLOOR_DB = 15.0  # Frames this far above the noise floor count as speech
+BANDWIDTH_ENERGY_SHARE = 0.95  # Spectral rolloff point used as the bandwidth
+
+
+def is_available():
+    """Check if NumPy is installed for streaming analysis."""
+    return np is not None
+
+
+class StreamingAudioStats:
+    """Accumulates level, noise and spectrum statistics over a stream of samples."""
+    
+    def __init__(self):
+        self.sample_count = 0
+        self.sum_squares = 0.0
+        self.peak = 0.0
+        self.level_histogram = np.zeros(LEVEL_BINS, dtype=np.int64)
+        self.spectrum_sum = np.zeros(FRAME_SIZE // 2 + 1, dtype=np.float64)
+        self.window = np.hanning(FRAME_SIZE).astype(np.float32)
+        self._remainder = np.zeros(0, dtype=np.float32)
+    
+    def add_samples(self, samples):
+        """Add a block of float32 samples (any length)."""
+        if self._remainder.size:
+            samples = np.concatenate((self._remainder, samples))
+        frame_count = samples.size // FRAME_SIZE
+        used = frame_count * FRAME_SIZE
+        self._remainder = samples[used:].copy()
+        if frame_count == 0:
+            return
+        
+        frames = samples[:used].reshape(frame_count, FRAME_SIZE)
+        
+        # Overall level and peak
+        squares = np.square(frames, dtype=np.float64)
+        self.sum_squares += float(squares.sum())
+        self.sample_count += used
+        self.peak = max(self.peak, float(np.abs(frames).max()))
+        
+        # Per-frame RMS level histogram (for noise floor and speech ratio)
+        frame_rms = np.sqrt(squares.mean(axis=1))
+        frame_db = 20.0 * np.log10(np.maximum(frame_rms, 1e-6))
+        bins = ((frame_db - SILENCE_FLOOR_DB) / LEVEL_BIN_DB).astype(np.int64)
+        self.level_histogram += np.bincount(np.clip(bins, 0, LEVEL_BINS - 1), minlength=LEVEL_BINS)
+        
+        # Average power spectrum (for bandwidth)
+        spectrum = np.abs(np.fft.rfft(frames * self.window, axis=1)) ** 2
+        self.spectrum_sum += spectrum.sum(axis=0)
+    
+    def level_percentile(self, percent):
+        """Get the per-frame level (dB) at the given percentile."""
+        total = int(self.level_histogram.sum())
+        if total == 0:
+            return None
+        cumulative = np.cumsum(self.level_histogram)
+        index = int(np.searchsorted(cumulative, total * percent / 100.0))
+        return SILENCE_FLOOR_DB + (index + 0.5) * LEVEL_BIN_DB
+    
+    def get_metrics(self):
+        """
+        Get the measured metrics.
+        
+        Returns a dictionary with:
+        - duration: Seconds of audio analyzed
+        - rms_level, peak_level: Overall levels in dBFS
+        - noise_floor: 10th percentile frame level in dBFS
+        - speech_level: 95th percentile frame level in dBFS
+        - snr: speech_level - noise_floor in dB
+        - speech_ratio: Fraction of frames well above the noise floor (0-1)
+        - bandwidth: Frequency (Hz) below which 95% of the energy lies
+        """
+        if self.sample_count == 0:
+            return None
+        
+        rms = np.sqrt(self.sum_squares / self.sample_count)
+        noise_floor = self.level_percentile(10)
+        speech_level = self.level_percentile(95)
+        
+        # Frames clearly above the noise floor are treated as speech
+        speech_bin = int((noise_floor + SPEECH_ABOVE_FLOOR_DB - SILENCE_FLOOR_DB) / LEVEL_BIN_DB)
+        speech_bin = min(max(speech_bin, 0), LEVEL_BINS)
+        total_frames = int(self.level_histogram.sum())
+        speech_frames = int(self.level_histogram[speech_bin:].sum())
+        
+        # Spectral rolloff as bandwidth estimate
+        bandwidth = None
+        total_energy = float(self.spectrum_sum.sum())
+        if total_energy > 0:
+            cumulative = np.cumsum(self.spectrum_sum) / total_energy
+            rolloff_bin = int(np.searchsorted(cumulative, BANDWIDTH_ENERGY_SHARE))
+            bandwidth = rolloff_bin * SAMPLE_RATE / FRAME_SIZE
+        
+        return {
+            "duration": self.sample_count / SAMPLE_RATE,
+            "rms_level": float(20.0 * np.log10(max(rms, 1e-6))),
+            "peak_level": float(20.0 * np.log10(max(self.peak, 1e-6))),
+            "noise_floor": noise_floor,
+            "speech_level": speech_level,
+            "snr": speech_level - noise_floor,
+            "speech_ratio": speech_frames / total_frames if total_frames else 0.0,
+            "bandwidth": bandwidth,
+        }
+
+
+def stream_pcm(ffmpeg_path, file_path, stats, deadline=None, start=None, length=None):
+    """
+    Decode a file (or a window of it) to 16 kHz mono float32 and feed it into stats.
+    
+    Args:
+        ffmpeg_path: Path to ffmpeg
+        file_path: Input media file
+        stats: StreamingAudioStats to update
+        deadline: Optional time.monotonic() value after which decoding is aborted
+        start: Optional start offset in seconds (input seeking)
+        length: Optional number of seconds to decode
+    
+    Returns:
+        True if decoding completed, False if ffmpeg failed or the deadline passed
+    """
+    cmd = [str(ffmpeg_path), "-hide_banner", "-nostats", "-v", "error"]
+    if start:
+        cmd += ["-ss", f"{start:.3f}"]  # Before -i: fast input seeking
+    cmd += ["-i", str(file_path)]
+    if length:
+        cmd += ["-t", f"{length:.3f}"]
+    cmd += ["-vn", "-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "f32le", "-"]
+    
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+    )
+    
+    # Kill ffmpeg at the deadline even while a read is blocked on it (the read then returns)
+    expired = threading.Event()
+    timer = None
+    if deadline is not None:
+        def expire():
+            expired.set()
+            process.kill()
+        timer = threading.Timer(max(0.0, deadline - time.monotonic()), expire)
+        timer.daemon = True
+        timer.start()
+    
+    chunk_bytes = CHUNK_FRAMES * FRAME_SIZE * 4
+    pending = b""
+    try:
+        while not expired.is_set():
+            data = process.stdout.read(chunk_bytes)
+            if not data:
+                break
+            data = pending + data
+            usable = len(data) - len(data) % 4
+            pending = data[usable:]
+            stats.add_samples(np.frombuffer(data[:usable], dtype=np.float32))
+        return process.wait() == 0 and not expired.is_set()
+    finally:
+        if timer is not None:
+            timer.cancel()
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+
+
+def analyze_pcm(ffmpeg_path, file_path, timeout=None):
+    """
+    Analyze a whole file from its decoded PCM stream.
+    
+    Returns:
+        Metrics dictionary (see StreamingAudioStats.get_metrics), or None if NumPy
+        is unavailable, decoding failed or the timeout expired.
+    """
+    if np is None:
+        return None
+    
+    stats = StreamingAudioStats()
+    deadline = time.monotonic() + timeout if timeout else None
+    if not stream_pcm(ffmpeg_path, file_path, stats, deadline):
+        return None
+    return stats.get_metrics()
+
+
+def analyze_pcm_windows(ffmpeg_path, file_path, windows, timeout=None):
+    """
+    Analyze only the given windows of a file (sampled mode).
+    
+    Args:
+        ffmpeg_path: Path to ffmpeg
+        file_path: Input media file
+        windows: List of (start, length) tuples in seconds
+        timeout: Optional overall timeout in seconds
+    
+    Returns:
+        Metrics dictionary (see StreamingAudioStats.get_metrics) with an extra
+        window_levels list (RMS dBFS per window), or None on failure.
+    """
+    if np is None:
+        return None
+    
+    stats = StreamingAudioStats()
+    deadline = time.monotonic() + timeout if timeout else None
+    window_levels = []
+    for start, length in windows:
+        sum_squares_before = stats.sum_squares
+        samples_before = stats.sample_count
+        if not stream_pcm(ffmpeg_path, file_path, stats, deadline, start=start, length=length):
+            return None
+        window_samples = stats.sample_count - samples_before
+        if window_samples:
+            mean_square = (stats.sum_squares - sum_squares_before) / window_samples
+            window_levels.append(float(10.0 * np.log10(max(mean_square, 1e-12))))
+    
+    metrics = stats.get_metrics()
+    if metrics is not None:
+        metrics["window_levels"] = window_levels
+    return metrics
@@ -0,0 +1,120 @@
+"""
+Process tree control for Faster Whisper GUI.
+Starts faster-whisper-xxl in its own process group and stops it together with the
+processes it spawned (ffmpeg, diarization workers), escalating from a polite
+termination request to a kill after a deadline.
+"""
+
+import os
+import signal
+import subprocess
+import sys
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+TERMINATE_TIMEOUT = 5.0  # Seconds processes get to exit after a termination request before they are killed
+KILL_TIMEOUT = 5.0  # Seconds to wait for killed processes to disappear
+
+
+def get_process_group_options():
+    """
+    Get subprocess.Popen keyword arguments starting a process in a new process group,
+    so it and its children can be stopped together (see stop_process_tree()).
+    """
+    if sys.platform == 'win32':
+        return {"creationflags": subprocess.CREATE_NO_WINDOW | subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def _get_descendants(pid):
+    """Get the child processes of a process, recursively (empty without psutil)."""
+    if psutil is None:
+        return []
+    try:
+        return psutil.Process(pid).children(recursive=True)
+    except psutil.Error:
+        return []
+
+
+def _signal_tree(process, force):
+    """
+    Ask a process started with get_process_group_options() and its children to exit (or kill them).
+    
+    Returns:
+        False if a termination request could not be delivered (kill instead)
+    """
+    if sys.platform == 'win32':
+        args = ["taskkill", "/T", "/PID", str(process.pid)]
+        if force:
+            args.insert(1, "/F")
+        try:
+            result = subprocess.run(args, capture_output=True, timeout=KILL_TIMEOUT,
+                                    creationflags=subprocess.CREATE_NO_WINDOW)
+            delivered = result.returncode == 0
+        except (OSError, subprocess.SubprocessError):
+            delivered = False
+        if force:
+            try:
+                process.kill()  # In case taskkill is unavailable
+            except OSError:
+                pass
+        # Windowless console processes can only be stopped forcefully
+        return delivered
+    
+    try:
+        os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        pass  # The whole group has exited
+    return True
+
+
+def stop_process_tree(process, timeout=TERMINATE_TIMEOUT):
+    """
+    Stop a process and all processes it started (blocks up to timeout + KILL_TIMEOUT seconds).
+    
+    Termination is requested first; whatever is still running after the timeout is
+    killed. Children that left the process group (or that Windows no longer links
+    to the process once it has exited) are found through psutil, when installed.
+    
+    Args:
+        process: subprocess.Popen started with get_process_group_options()
+        timeout: Seconds to wait for a graceful exit before killing
+    
+    Returns:
+        The process's exit code
+    """
+    descendants = _get_descendants(process.pid)  # Before the parent exits and the links are lost
+    
+    if process.poll() is None:
+        if _signal_tree(process, force=False):
+            try:
+                process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                _signal_tree(process, force=True)
+        else:
+            _signal_tree(process, force=True)
+    
+    if psutil is not None and descendants:
+        for child in descendants:
+            try:
+                child.terminate()
+            except psutil.Error:
+                pass
+        _, alive = psutil.wait_procs(descendants, timeout=timeout)
+        for child in alive:
+            try:
+                child.kill()
+            except psutil.Error:
+                pass
+        psutil.wait_procs(alive, timeout=KILL_TIMEOUT)
+    elif sys.platform != 'win32':
+        _signal_tree(process, force=True)  # Children that ignored SIGTERM
+    
+    try:
+        return process.wait(KILL_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        return None
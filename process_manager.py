@@ -3,17 +3,30 @@ Process manager for Faster Whisper GUI.
 Handles subprocess execution with real-time output capture using QThread.
 """
 
+import queue
 import subprocess
-import sys
+import threading
+import time
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from output_reader import read_lines, get_output_environment
+from process_control import get_process_group_options, stop_process_tree, TERMINATE_TIMEOUT
+from model_pool import get_model_pool
+
+
+_EOF = object()  # Marks the end of process output
+
 
 class ProcessWorker(QThread):
     """Worker thread for running faster-whisper-xxl.exe subprocess."""
     
+    # Output lines are coalesced and emitted at most once per interval,
+    # so chatty progress output doesn't flood the GUI event loop
+    OUTPUT_BATCH_INTERVAL = 0.05  # seconds
+    
     # Signals for communication with main thread
-    output_received = pyqtSignal(str)  # Emitted when output line is received
-    error_received = pyqtSignal(str)  # Emitted when error line is received
+    output_received = pyqtSignal(list)  # Emitted with a batch of output lines
+    error_received = pyqtSignal(list)  # Emitted with a batch of error lines
     finished = pyqtSignal(int)  # Emitted when process finishes (exit code)
     error_occurred = pyqtSignal(str)  # Emitted on process errors
     
@@ -29,7 +42,7 @@ class ProcessWorker(QThread):
         self.exe_path = exe_path
         self.args = args
         self.process = None
-        self._is_cancelled = False
+        self._cancel_event = threading.Event()
     
     def run(self):
         """Execute the subprocess and capture output."""
@@ -37,34 +50,62 @@ class ProcessWorker(QThread):
             # Build full command
             cmd = [self.exe_path] + self.args
             
-            # Start process with real-time output capture
+            # Start process with real-time output capture. The pipe is read in binary
+            # chunks and decoded incrementally (see output_reader) rather than through
+            # a line-buffered text layer.
             self.process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,  # Combine stderr with stdout
-                universal_newlines=True,
-                bufsize=1,  # Line buffered
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+                bufsize=0,  # Unbuffered - os.read gets output as soon as it is written
+                env=get_output_environment(),
+                **get_process_group_options()  # Lets cancel() stop the processes it starts too
             )
             
-            # Read output line by line
-            for line in iter(self.process.stdout.readline, ''):
-                if self._is_cancelled:
-                    self.process.terminate()
+            # Read on a helper thread so batches can be flushed on a timer and
+            # cancellation is noticed even while the process is quiet or mid-line
+            chunks = queue.Queue()
+            reader = threading.Thread(target=self._read_output, args=(self.process.stdout, chunks, self._cancel_event),
+                                      daemon=True)
+            reader.start()
+            
+            batch = []
+            last_flush = time.monotonic()
+            while True:
+                try:
+                    lines = chunks.get(timeout=self.OUTPUT_BATCH_INTERVAL)
+                except queue.Empty:
+                    lines = None
+                
+                if self._cancel_event.is_set():
                     break
                 
-                if line:
-                    # Remove trailing newline and emit signal
-                    line = line.rstrip('\n\r')
-                    self.output_received.emit(line)
+                if lines is _EOF:
+                    break
+                if lines is not None:
+                    batch.extend(lines)
+                
+                now = time.monotonic()
+                if batch and now - last_flush >= self.OUTPUT_BATCH_INTERVAL:
+                    self.output_received.emit(batch)
+                    batch = []
+                    last_flush = now
+            
+            if batch:
+                self.output_received.emit(batch)
             
             # Wait for process to complete
-            if not self._is_cancelled:
+            if not self._cancel_event.is_set():
                 return_code = self.process.wait()
                 self.finished.emit(return_code)
             else:
+                # Stop the process and everything it started, escalating to a kill after
+                # TERMINATE_TIMEOUT; finished is emitted once they are all gone
+                started = time.monotonic()
+                stop_process_tree(self.process, TERMINATE_TIMEOUT)
+                self.output_received.emit([f"Process stopped after {time.monotonic() - started:.1f} s"])
                 self.finished.emit(-1)  # Cancelled
-                
+        
         except FileNotFoundError:
             self.error_occurred.emit(f"Executable not found: {self.exe_path}")
             self.finished.emit(-1)
@@ -72,63 +113,201 @@ class ProcessWorker(QThread):
             self.error_occurred.emit(f"Error running process: {str(e)}")
             self.finished.emit(-1)
     
+    @staticmethod
+    def _read_output(stream, chunks, cancel_event):
+        """Read output into a queue, one list of lines per chunk read (runs on a helper thread)."""
+        read_lines(stream, chunks.put, cancel_event)
+        chunks.put(_EOF)
+    
+    def cancel(self):
+        """
+        Cancel the running process (returns immediately).
+        
+        The worker thread stops the process tree and then emits finished(-1).
+        """
+        self._cancel_event.set()
+
+
+class WarmWorker(QThread):
+    """Worker thread feeding files to a warm model server instead of starting faster-whisper-xxl.exe."""
+    
+    # Same signals as ProcessWorker, so callers don't need to know which backend runs a job
+    output_received = pyqtSignal(list)
+    error_received = pyqtSignal(list)
+    finished = pyqtSignal(int)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, input_files, output_dir, options):
+        """
+        Initialize warm worker.
+        
+        Args:
+            input_files: List of input file paths
+            output_dir: Output directory path
+            options: Dictionary of option values (selects the model server, see model_pool)
+        """
+        super().__init__()
+        self.input_files = input_files
+        self.output_dir = output_dir
+        self.options = options
+        self._is_cancelled = False
+    
+    def run(self):
+        """Transcribe the files with the model server for the options' model."""
+        try:
+            server = get_model_pool().get_server(self.options)
+            exit_code = server.transcribe(
+                self.input_files, self.output_dir, self.options,
+                self.output_received.emit, lambda: self._is_cancelled
+            )
+            self.finished.emit(-1 if self._is_cancelled else exit_code)
+        except Exception as e:
+            self.error_occurred.emit(f"Error running warm backend: {str(e)}")
+            self.finished.emit(-1)
+    
     def cancel(self):
-        """Cancel the running process."""
+        """Cancel the running transcription (the model stays loaded)."""
         self._is_cancelled = True
-        if self.process:
-            try:
-                self.process.terminate()
-            except:
-                pass
 
 
 class ProcessManager:
-    """Manages subprocess execution for Faster Whisper."""
+    """
+    Manages subprocess execution for Faster Whisper.
     
-    def __init__(self):
-        self.worker = None
+    Acts as a small worker pool: up to ``max_workers`` processes may run at
+    the same time, and ``device_slots`` can further limit how many of them
+    share a device (e.g. {"cuda": 1} to keep a single job on the GPU).
+    """
     
-    def start_process(self, exe_path, args, output_callback, error_callback, finished_callback, error_occurred_callback):
+    def __init__(self, max_workers=1, device_slots=None):
+        self.worker = None  # Most recently started worker
+        self.workers = {}  # key -> ProcessWorker for running processes
+        self.worker_devices = {}  # key -> device the worker was started on
+        self.max_workers = max(1, int(max_workers))
+        self.device_slots = dict(device_slots) if device_slots else {}
+        self._retired_workers = []  # Finished workers kept alive until their thread exits
+        self._next_key = 0
+    
+    def set_max_workers(self, max_workers, device_slots=None):
+        """
+        Configure pool concurrency.
+        
+        Args:
+            max_workers: Maximum number of processes running at once
+            device_slots: Optional dict of device name -> maximum concurrent processes
+        """
+        self.max_workers = max(1, int(max_workers))
+        if device_slots is not None:
+            self.device_slots = dict(device_slots)
+    
+    def active_count(self, device=None):
+        """Get number of running processes (optionally only those on a device)."""
+        if device is None:
+            return len(self.workers)
+        return sum(1 for d in self.worker_devices.values() if d == device)
+    
+    def can_start(self, device=None):
+        """Check if a free worker slot is available (for the given device)."""
+        if len(self.workers) >= self.max_workers:
+            return False
+        if device is not None and device in self.device_slots:
+            return self.active_count(device) < self.device_slots[device]
+        return True
+    
+    def start_process(self, exe_path, args, output_callback, error_callback, finished_callback, error_occurred_callback,
+                      key=None, device=None, warm_job=None):
         """
         Start a subprocess with callbacks.
         
         Args:
             exe_path: Path to executable
             args: Command-line arguments
-            output_callback: Function to call with each output line
-            error_callback: Function to call with error lines (can be same as output_callback)
+            output_callback: Function to call with each batch (list) of output lines
+            error_callback: Function to call with batches of error lines (can be same as output_callback)
             finished_callback: Function to call when process finishes (receives exit code)
             error_occurred_callback: Function to call on process errors (receives error message)
+            key: Optional identifier for a pooled worker (e.g. queue job id). When omitted,
+                any running processes are stopped first (single process mode).
+            device: Optional device name the process runs on, used for device slot limits
+            warm_job: Optional dict with "input_files", "output_dir" and "options" to run on a
+                warm model server (see warm_backend) instead of starting the executable
         
         Returns:
-            ProcessWorker instance
+            ProcessWorker (or WarmWorker) instance
         """
-        # Stop any existing process
-        if self.worker and self.worker.isRunning():
-            self.worker.cancel()
-            self.worker.wait()
+        if key is None:
+            # Single process mode - stop any existing process
+            self.stop_process()
+            key = f"_single_{self._next_key}"
+            self._next_key += 1
+        
+        # Drop references to workers whose threads have exited
+        self._retired_workers = [w for w in self._retired_workers if w.isRunning()]
         
         # Create new worker
-        self.worker = ProcessWorker(exe_path, args)
+        if warm_job:
+            worker = WarmWorker(warm_job["input_files"], warm_job["output_dir"], warm_job["options"])
+        else:
+            worker = ProcessWorker(exe_path, args)
+        self.worker = worker
+        self.workers[key] = worker
+        self.worker_devices[key] = device
+        
+        # Release the slot before the caller's finished callback runs, so the
+        # callback can immediately start the next job
+        worker.finished.connect(lambda code, k=key: self._release_worker(k))
         
         # Connect signals
-        self.worker.output_received.connect(output_callback)
-        self.worker.error_received.connect(error_callback)
-        self.worker.finished.connect(finished_callback)
-        self.worker.error_occurred.connect(error_occurred_callback)
+        worker.output_received.connect(output_callback)
+        worker.error_received.connect(error_callback)
+        worker.finished.connect(finished_callback)
+        worker.error_occurred.connect(error_occurred_callback)
         
         # Start worker thread
-        self.worker.start()
+        worker.start()
         
-        return self.worker
+        return worker
     
-    def stop_process(self):
-        """Stop the currently running process."""
-        if self.worker and self.worker.isRunning():
-            self.worker.cancel()
-            self.worker.wait()
+    def _release_worker(self, key):
+        """Free the pool slot held by a finished worker."""
+        worker = self.workers.pop(key, None)
+        self.worker_devices.pop(key, None)
+        if worker is not None:
+            self._retired_workers.append(worker)
+    
+    def stop_process(self, key=None, stopped_callback=None):
+        """
+        Stop a pooled process by key, or all running processes, without waiting.
+        
+        Workers keep their pool slot until their processes have exited (they emit
+        finished with -1), so new processes don't compete with ones still shutting down.
+        
+        Args:
+            key: Worker key, or None for all workers
+            stopped_callback: Optional function called once all stopped workers have finished
+        """
+        if key is not None:
+            keys = [key] if key in self.workers else []
+        else:
+            keys = list(self.workers.keys())
+        running = [self.workers[k] for k in keys if self.workers[k].isRunning()]
+        for k in keys:
+            if not self.workers[k].isRunning():
+                self._release_worker(k)  # Thread already exited
+        
+        remaining = {"count": len(running)}
+        
+        def on_worker_stopped(code):
+            remaining["count"] -= 1
+            if remaining["count"] == 0 and stopped_callback:
+                stopped_callback()
+        
+        for worker in running:
+            worker.finished.connect(on_worker_stopped)
+            worker.cancel()
+        if not running and stopped_callback:
+            stopped_callback()
     
     def is_running(self):
-        """Check if a process is currently running."""
-        return self.worker is not None and self.worker.isRunning()
-
+        """Check if any process is currently running."""
+        return any(worker.isRunning() for worker in self.workers.values())
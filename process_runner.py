@@ -0,0 +1,139 @@
+"""
+Qt-free process runner for headless use of Faster Whisper GUI components.
+Runs several faster-whisper-xxl processes in parallel on plain threads and delivers
+their output and exit codes as events to a single consumer thread.
+"""
+
+import queue
+import subprocess
+import sys
+import threading
+
+from output_reader import read_lines, get_output_environment
+from process_control import get_process_group_options, stop_process_tree
+
+
+# Event kinds
+OUTPUT = "output"  # (OUTPUT, key, list of lines)
+FINISHED = "finished"  # (FINISHED, key, exit code; -1 if cancelled)
+ERROR = "error"  # (ERROR, key, error message) - always followed by FINISHED with -1
+
+
+class ProcessRunner:
+    """
+    Worker pool of subprocesses, each watched by its own thread.
+    
+    Events are put on a queue instead of calling back into the caller, so all
+    queue and job state can be handled on the consuming thread (see get_event()).
+    A process keeps its worker slot until its FINISHED event has been taken from
+    the queue, so active_count() only reaches 0 once every event has been read.
+    """
+    
+    def __init__(self, max_workers=1):
+        """
+        Initialize the runner.
+        
+        Args:
+            max_workers: Maximum number of processes running at the same time
+        """
+        self.max_workers = max(1, max_workers)
+        self.events = queue.Queue()
+        self._processes = {}  # Key -> Popen (None until started and after exiting, until FINISHED is read)
+        self._cancelled = set()
+        self._lock = threading.Lock()
+    
+    def active_count(self):
+        """Get the number of running processes (including exited ones whose FINISHED event is unread)."""
+        with self._lock:
+            return len(self._processes)
+    
+    def can_start(self):
+        """Check if a free worker slot is available."""
+        return self.active_count() < self.max_workers
+    
+    def start(self, key, exe_path, args):
+        """
+        Start a process.
+        
+        Args:
+            key: Identifier reported with the process's events (e.g. queue job id)
+            exe_path: Path to the executable (a .py script is run with the current interpreter)
+            args: Command-line arguments
+        """
+        cmd = [str(exe_path)] + list(args)
+        if str(exe_path).lower().endswith(".py"):
+            cmd.insert(0, sys.executable)  # Stand-in executables, e.g. fake_faster_whisper.py
+        with self._lock:
+            self._processes[key] = None
+            self._cancelled.discard(key)
+        thread = threading.Thread(target=self._run, args=(key, cmd), daemon=True)
+        thread.start()
+    
+    def cancel(self, key=None):
+        """
+        Cancel a process by key, or all running processes (returns immediately).
+        
+        Each process is stopped together with the processes it started, on a helper
+        thread; its FINISHED event follows once they have all exited.
+        """
+        with self._lock:
+            keys = [key] if key is not None else list(self._processes)
+            for k in keys:
+                if k not in self._processes or k in self._cancelled:
+                    continue
+                self._cancelled.add(k)
+                process = self._processes[k]
+                if process is not None:
+                    threading.Thread(target=stop_process_tree, args=(process,), daemon=True).start()
+    
+    def get_event(self, timeout=None):
+        """
+        Get the next event.
+        
+        Returns:
+            Tuple (kind, key, value), or None if no event arrived within the timeout
+        """
+        try:
+            event = self.events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if event[0] == FINISHED:
+            # Release the worker slot only now that all of the process's events have been read
+            with self._lock:
+                self._processes.pop(event[1], None)
+                self._cancelled.discard(event[1])
+        return event
+    
+    def _run(self, key, cmd):
+        """Run one process and report its output (runs on its own thread)."""
+        exit_code = -1
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,  # Combine stderr with stdout
+                bufsize=0,  # Read in binary chunks (see output_reader)
+                env=get_output_environment(),
+                **get_process_group_options()  # Lets cancel() stop the processes it starts too
+            )
+            with self._lock:
+                self._processes[key] = process
+                cancelled = key in self._cancelled
+            if cancelled:
+                stop_process_tree(process)
+            
+            # One event per chunk read - no further coalescing needed, the consumer is not a GUI event loop
+            read_lines(process.stdout, lambda lines: self.events.put((OUTPUT, key, lines)))
+            
+            return_code = process.wait()
+            with self._lock:
+                cancelled = key in self._cancelled
+            exit_code = -1 if cancelled else return_code
+        except FileNotFoundError:
+            self.events.put((ERROR, key, f"Executable not found: {cmd[0]}"))
+        except Exception as e:
+            self.events.put((ERROR, key, f"Error running process: {str(e)}"))
+        finally:
+            with self._lock:
+                self._processes[key] = None  # Exited - nothing left for cancel() to stop
+            self.events.put((FINISHED, key, exit_code))
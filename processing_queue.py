@@ -3,10 +3,14 @@ Processing queue manager for Faster Whisper GUI.
 Manages a queue of transcription jobs with different settings.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+import heapq
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Collection, Dict, Hashable, List, Optional
 from enum import Enum
 
+from retry_policy import RetryPolicy
+
 
 class JobStatus(Enum):
     """Status of a job in the queue."""
@@ -16,6 +20,15 @@ class JobStatus(Enum):
     FAILED = "Failed"
     CANCELLED = "Cancelled"
     PAUSED = "Paused"
+    RETRYING = "Waiting to retry"
+
+
+class SchedulingPolicy(Enum):
+    """Order in which pending jobs are started."""
+    FIFO = "In order added"
+    SHORTEST_FIRST = "Shortest files first"
+    PRIORITY = "Highest priority first"
+    FAIR_SHARE = "Fair share per output folder"
 
 
 @dataclass
@@ -28,69 +41,461 @@ class QueueJob:
     status: JobStatus = JobStatus.PENDING
     error_message: Optional[str] = None
     output_files: List[str] = None
+    priority: int = 0  # Higher runs first with the PRIORITY policy
+    duration: Optional[float] = None  # Audio seconds (used by the SHORTEST_FIRST policy)
+    attempts: int = 0  # Runs that have failed so far
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
     
     def __post_init__(self):
         if self.output_files is None:
             self.output_files = []
+    
+    def to_dict(self) -> dict:
+        """Convert to a JSON serializable dictionary (for the queue journal)."""
+        return {
+            "job_id": self.job_id,
+            "input_files": list(self.input_files),
+            "output_dir": self.output_dir,
+            "options": self.options,
+            "status": self.status.name,
+            "error_message": self.error_message,
+            "output_files": [str(f) for f in self.output_files],
+            "priority": self.priority,
+            "duration": self.duration,
+            "attempts": self.attempts,
+            "max_attempts": self.retry_policy.max_attempts,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "QueueJob":
+        """Create a job from a dictionary made by to_dict()."""
+        return cls(
+            job_id=data["job_id"],
+            input_files=data["input_files"],
+            output_dir=data["output_dir"],
+            options=data["options"],
+            status=JobStatus[data.get("status", "PENDING")],
+            error_message=data.get("error_message"),
+            output_files=data.get("output_files"),
+            priority=data.get("priority", 0),
+            duration=data.get("duration"),
+            attempts=data.get("attempts", 0),
+            retry_policy=RetryPolicy(max_attempts=data.get("max_attempts", RetryPolicy.max_attempts)),
+        )
 
 
 class ProcessingQueue:
-    """Manages a queue of transcription jobs."""
+    """
+    Manages a queue of transcription jobs.
+    
+    Pending jobs are indexed in heaps ordered by the scheduling policy, so picking
+    the next job is O(log n). Heap entries are removed lazily: an entry is skipped
+    once its job is no longer pending (or no longer queued) or its sort key has changed.
     
-    def __init__(self):
-        self.jobs: List[QueueJob] = []
-        self.current_job_index: int = -1
+    Jobs are stored by job_id and per-status counts are kept up to date, so status
+    queries, lookups and removal are O(1). Job status must only be changed through
+    the mark_job_* methods so the counts stay correct.
+    
+    If a journal (see queue_journal.QueueJournal) is given, every change is recorded
+    so the queue can be restored after a crash.
+    
+    With a grouping (see set_grouping()), pending jobs are also indexed per group, so
+    jobs of preferred groups (e.g. using a model that is already loaded) can be picked
+    ahead of the policy's order in O(log n) per group.
+    
+    With a profile function (see set_profiling()), the audio duration of jobs not
+    started yet is totaled per profile as statuses change, for time remaining estimates.
+    """
+    
+    def __init__(self, policy: SchedulingPolicy = SchedulingPolicy.FIFO, journal=None):
+        self._jobs_by_id: Dict[int, QueueJob] = {}  # Insertion ordered
+        self._status_counts = Counter()
+        self.current_job: Optional[QueueJob] = None
         self.is_paused: bool = False
         self.next_job_id: int = 1
+        self.policy: SchedulingPolicy = policy
+        # Heap of (sort key, job_id, job) per output directory for FAIR_SHARE, else one heap under None
+        self._ready = {}
+        self._running_by_dir = {}  # Output directory -> jobs processing (FAIR_SHARE)
+        self._started_by_dir = {}  # Output directory -> jobs started (FAIR_SHARE tie-break)
+        self.group_of: Optional[Callable[[QueueJob], Hashable]] = None
+        self._groups = {}  # Group -> heap of (sort key, job_id, job), see set_grouping()
+        self.profile_of: Optional[Callable[[QueueJob], Hashable]] = None
+        self._waiting_totals = {}  # Profile -> [known seconds, jobs of known duration, jobs of unknown duration]
+        self.journal = journal
+    
+    def _record(self, record: dict, sync: bool = False):
+        """Write a record to the journal, compacting it when it has grown too long."""
+        if self.journal is None:
+            return
+        if self.journal.needs_compaction(len(self._jobs_by_id)):
+            # The snapshot already contains this change
+            self.journal.rewrite(self.policy.name, [job.to_dict() for job in self._jobs_by_id.values()])
+        else:
+            self.journal.append(record, sync)
+    
+    def restore(self, saved_jobs: List[dict], policy_name: Optional[str] = None):
+        """
+        Replace the queue with jobs loaded from the journal.
+        
+        Jobs that were processing or waiting to retry when the previous session ended
+        become pending again; completed and failed jobs keep their status and are not run again.
+        """
+        journal, self.journal = self.journal, None  # Don't journal the rebuild itself
+        self.clear_all()
+        if policy_name in SchedulingPolicy.__members__:
+            self.policy = SchedulingPolicy[policy_name]
+        for data in saved_jobs:
+            try:
+                job = QueueJob.from_dict(data)
+            except (KeyError, TypeError, ValueError):
+                continue
+            if job.status in (JobStatus.PROCESSING, JobStatus.PAUSED, JobStatus.RETRYING):
+                job.status = JobStatus.PENDING
+            self._jobs_by_id[job.job_id] = job
+            self._status_counts[job.status] += 1
+            self.next_job_id = max(self.next_job_id, job.job_id + 1)
+            self._push(job)
+        self._rebuild_waiting_totals()
+        self.journal = journal
+        if self.journal is not None:
+            self.journal.rewrite(self.policy.name, [job.to_dict() for job in self._jobs_by_id.values()])
     
-    def add_job(self, input_files: List[str], output_dir: str, options: dict) -> QueueJob:
+    def add_job(self, input_files: List[str], output_dir: str, options: dict,
+                priority: int = 0, duration: Optional[float] = None,
+                retry_policy: Optional[RetryPolicy] = None) -> QueueJob:
         """Add a new job to the queue."""
         job = QueueJob(
             job_id=self.next_job_id,
             input_files=input_files,
             output_dir=output_dir,
-            options=options
+            options=options,
+            priority=priority,
+            duration=duration,
+            retry_policy=retry_policy or RetryPolicy()
         )
-        self.jobs.append(job)
+        self._jobs_by_id[job.job_id] = job
+        self._status_counts[job.status] += 1
+        self._count_waiting(job, 1)
         self.next_job_id += 1
+        self._push(job)
+        # Not synced: the next status change forces everything before it to disk
+        self._record({"op": "add", "job": job.to_dict()})
         return job
     
-    def get_next_job(self) -> Optional[QueueJob]:
-        """Get the next pending job."""
+    @property
+    def jobs(self) -> List[QueueJob]:
+        """All jobs in the order they were added."""
+        return list(self._jobs_by_id.values())
+    
+    def get_job(self, job_id: int) -> Optional[QueueJob]:
+        """Get a job by its id."""
+        return self._jobs_by_id.get(job_id)
+    
+    def set_policy(self, policy: SchedulingPolicy):
+        """Change the scheduling policy and re-index the pending jobs."""
+        self.policy = policy
+        self._rebuild_index()
+        self._record({"op": "policy", "policy": policy.name})
+    
+    def set_grouping(self, group_of: Optional[Callable[[QueueJob], Hashable]]):
+        """
+        Index pending jobs by group, for get_next_job(prefer_groups=...).
+        
+        Args:
+            group_of: Function returning a job's group (e.g. the model it loads), or None
+        """
+        self.group_of = group_of
+        self._rebuild_index()
+    
+    def set_profiling(self, profile_of: Optional[Callable[[QueueJob], Hashable]]):
+        """
+        Total the duration of jobs not started yet per profile, for get_waiting_totals().
+        
+        Args:
+            profile_of: Function returning a job's throughput profile, or None
+        """
+        self.profile_of = profile_of
+        self._rebuild_waiting_totals()
+    
+    def get_waiting_totals(self) -> Dict[Hashable, tuple]:
+        """
+        Get the audio duration of pending jobs and jobs waiting to retry, per profile.
+        
+        Returns:
+            Dictionary profile -> (seconds of known durations, jobs of known duration,
+            jobs of unknown duration)
+        """
+        return {profile: tuple(totals) for profile, totals in self._waiting_totals.items() if any(totals)}
+    
+    def _count_waiting(self, job: QueueJob, sign: int):
+        """Add a job to (sign 1) or remove it from (sign -1) the waiting totals, if it isn't started yet."""
+        if self.profile_of is None or job.status not in (JobStatus.PENDING, JobStatus.RETRYING):
+            return
+        totals = self._waiting_totals.setdefault(self.profile_of(job), [0.0, 0, 0])
+        if job.duration:
+            totals[1] += sign
+            # Reset rather than accumulate rounding errors once no known durations are left
+            totals[0] = totals[0] + sign * job.duration if totals[1] else 0.0
+        else:
+            totals[2] += sign
+    
+    def _rebuild_waiting_totals(self):
+        """Recompute the waiting totals from the job list."""
+        self._waiting_totals = {}
+        for job in self._jobs_by_id.values():
+            self._count_waiting(job, 1)
+    
+    def set_job_priority(self, job: QueueJob, priority: int):
+        """Change a job's priority."""
+        old_key = self._schedule_key(job)
+        job.priority = priority
+        self._reschedule(job, old_key)
+        self._record({"op": "update", "job_id": job.job_id, "fields": {"priority": priority}})
+    
+    def set_job_duration(self, job: QueueJob, duration: Optional[float]):
+        """Set a job's audio duration (e.g. once probing has finished)."""
+        old_key = self._schedule_key(job)
+        self._count_waiting(job, -1)
+        job.duration = duration
+        self._count_waiting(job, 1)
+        self._reschedule(job, old_key)
+        self._record({"op": "update", "job_id": job.job_id, "fields": {"duration": duration}})
+    
+    def set_job_options(self, job: QueueJob, options: dict):
+        """Change a job's options (e.g. cheaper settings for a retry)."""
+        self._count_waiting(job, -1)  # The job's profile may have changed
+        job.options = options
+        self._count_waiting(job, 1)
+        self._push_group(job)  # The job's group may have changed
+        self._record({"op": "update", "job_id": job.job_id, "fields": {"options": options}})
+    
+    def _schedule_key(self, job: QueueJob) -> tuple:
+        """Sort key of a job under the current policy (smallest runs first)."""
+        if self.policy == SchedulingPolicy.SHORTEST_FIRST:
+            # Jobs of unknown duration run after all known ones
+            return (job.duration is None, job.duration or 0.0, job.job_id)
+        if self.policy == SchedulingPolicy.PRIORITY:
+            return (-job.priority, job.job_id)
+        return (job.job_id,)
+    
+    def _heap_name(self, job: QueueJob):
+        """Heap a job is indexed in."""
+        return job.output_dir if self.policy == SchedulingPolicy.FAIR_SHARE else None
+    
+    def _push(self, job: QueueJob):
+        """Index a pending job."""
+        if job.status == JobStatus.PENDING:
+            heap = self._ready.setdefault(self._heap_name(job), [])
+            heapq.heappush(heap, (self._schedule_key(job), job.job_id, job))
+            self._push_group(job)
+    
+    def _push_group(self, job: QueueJob):
+        """Index a pending job in its group's heap."""
+        if self.group_of is not None and job.status == JobStatus.PENDING:
+            heap = self._groups.setdefault(self.group_of(job), [])
+            heapq.heappush(heap, (self._schedule_key(job), job.job_id, job))
+    
+    def _reschedule(self, job: QueueJob, old_key: tuple):
+        """Re-index a job whose sort key may have changed (the old entry becomes stale)."""
+        if self._schedule_key(job) != old_key:
+            self._push(job)
+    
+    def _rebuild_index(self):
+        """Rebuild all heaps from the job list."""
+        self._ready = {}
+        self._groups = {}
+        for job in self._jobs_by_id.values():
+            self._push(job)
+    
+    def _peek(self, heap) -> Optional[tuple]:
+        """Get the first valid entry of a heap, dropping stale entries."""
+        while heap:
+            key, job_id, job = heap[0]
+            if (job.status == JobStatus.PENDING and self._jobs_by_id.get(job_id) is job
+                    and key == self._schedule_key(job)):
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+    
+    def _peek_group(self, group) -> Optional[tuple]:
+        """Get the first valid entry of a group's heap, dropping stale entries."""
+        heap = self._groups.get(group)
+        entry = self._peek(heap) if heap else None
+        while entry is not None and self.group_of(entry[2]) != group:
+            heapq.heappop(heap)  # Options changed since the job was indexed here
+            entry = self._peek(heap)
+        if entry is None:
+            self._groups.pop(group, None)
+        return entry
+    
+    def _select_heap(self, prefer_groups: Optional[Collection[Hashable]] = None):
+        """
+        Get the heap whose first entry is the next job to start (None if nothing is pending).
+        
+        The policy's next job runs unless it is outside prefer_groups and a job of a
+        preferred group with at least the same priority is pending.
+        """
+        heap = self._next_heap()
+        if heap is None or not prefer_groups or self.group_of is None:
+            return heap
+        next_job = heap[0][2]
+        if self.group_of(next_job) in prefer_groups:
+            return heap
+        best = None
+        for group in prefer_groups:
+            entry = self._peek_group(group)
+            if entry is not None and entry[2].priority >= next_job.priority and (best is None or entry[0] < best[0]):
+                best = entry
+        return self._groups[self.group_of(best[2])] if best else heap
+    
+    def _next_heap(self):
+        """Get the heap the next job should come from (None if nothing is pending)."""
+        if self.policy != SchedulingPolicy.FAIR_SHARE:
+            heap = self._ready.get(None)
+            return heap if heap and self._peek(heap) else None
+        
+        # The output directory with the fewest running (then started) jobs goes next
+        best_heap, best_rank = None, None
+        for output_dir, heap in list(self._ready.items()):
+            entry = self._peek(heap)
+            if entry is None:
+                del self._ready[output_dir]
+                continue
+            rank = (self._running_by_dir.get(output_dir, 0), self._started_by_dir.get(output_dir, 0), entry[0])
+            if best_rank is None or rank < best_rank:
+                best_heap, best_rank = heap, rank
+        return best_heap
+    
+    def get_next_job(self, prefer_groups: Optional[Collection[Hashable]] = None) -> Optional[QueueJob]:
+        """
+        Get the next pending job according to the scheduling policy.
+        
+        Args:
+            prefer_groups: Groups (see set_grouping()) whose jobs run first, e.g. models
+                that are already loaded, so jobs sharing them run before switching
+        """
         if self.is_paused:
             return None
         
-        for i, job in enumerate(self.jobs):
-            if job.status == JobStatus.PENDING:
-                self.current_job_index = i
-                return job
+        heap = self._select_heap(prefer_groups)
+        return heap[0][2] if heap else None
+    
+    def get_next_batch(self, max_files: int = 1, max_duration: Optional[float] = None,
+                       duration_of: Optional[Callable[[str], Optional[float]]] = None,
+                       prefer_groups: Optional[Collection[Hashable]] = None) -> List[QueueJob]:
+        """
+        Get the next run of pending jobs that can share one invocation.
         
-        return None
+        Jobs are taken in scheduling order while they have identical options and
+        output directory, up to max_files jobs. If max_duration (seconds) and
+        duration_of are given, the group also stops before its total audio
+        duration would exceed max_duration (the first job is always included).
+        prefer_groups is passed on to get_next_job().
+        """
+        first = self.get_next_job(prefer_groups)
+        if not first:
+            return []
+        
+        batch = [first]
+        limit_duration = bool(max_duration and duration_of)
+        total_duration = self._job_duration(first, duration_of) if limit_duration else 0.0
+        heap = self._select_heap(prefer_groups)
+        popped = [heapq.heappop(heap)]
+        while len(batch) < max_files:
+            entry = self._peek(heap)
+            if entry is None:
+                break
+            job = entry[2]
+            if any(job is queued for queued in batch):
+                # Second entry of a job requeued before its old entry was dropped
+                heapq.heappop(heap)
+                continue
+            if job.options != first.options or job.output_dir != first.output_dir:
+                break
+            if limit_duration:
+                job_duration = self._job_duration(job, duration_of)
+                if total_duration + job_duration > max_duration:
+                    break
+                total_duration += job_duration
+            popped.append(heapq.heappop(heap))
+            batch.append(job)
+        
+        # Entries stay indexed until the jobs leave the pending state
+        for entry in popped:
+            heapq.heappush(heap, entry)
+        return batch
+    
+    @staticmethod
+    def _job_duration(job: QueueJob, duration_of) -> float:
+        """Get the total audio duration of a job's input files (unknown counts as 0)."""
+        if not duration_of:
+            return 0.0
+        return sum(duration_of(f) or 0.0 for f in job.input_files)
     
     def get_current_job(self) -> Optional[QueueJob]:
-        """Get the currently processing job."""
-        if 0 <= self.current_job_index < len(self.jobs):
-            return self.jobs[self.current_job_index]
-        return None
+        """Get the most recently started job."""
+        return self.current_job
+    
+    def _set_status(self, job: QueueJob, status: JobStatus):
+        """Change a job's status, keeping the status and per-directory running counts in step."""
+        if job.status == status:
+            return
+        if self._jobs_by_id.get(job.job_id) is not job:
+            # Removed from the queue - its counts were settled by remove_job()
+            job.status = status
+            return
+        self._status_counts[job.status] -= 1
+        self._status_counts[status] += 1
+        if job.status == JobStatus.PROCESSING:
+            self._running_by_dir[job.output_dir] -= 1
+        elif status == JobStatus.PROCESSING:
+            self._running_by_dir[job.output_dir] = self._running_by_dir.get(job.output_dir, 0) + 1
+            self._started_by_dir[job.output_dir] = self._started_by_dir.get(job.output_dir, 0) + 1
+        self._count_waiting(job, -1)
+        job.status = status
+        self._count_waiting(job, 1)
+        self._record({
+            "op": "status",
+            "job_id": job.job_id,
+            "fields": {
+                "status": status.name,
+                "error_message": job.error_message,
+                "output_files": [str(f) for f in job.output_files],
+                "attempts": job.attempts,
+            },
+        }, sync=True)
     
     def mark_job_processing(self, job: QueueJob):
         """Mark a job as processing."""
-        job.status = JobStatus.PROCESSING
+        self._set_status(job, JobStatus.PROCESSING)
+        self.current_job = job
     
     def mark_job_completed(self, job: QueueJob, output_files: List[str] = None):
         """Mark a job as completed."""
-        job.status = JobStatus.COMPLETED
         if output_files:
             job.output_files = output_files
+        self._set_status(job, JobStatus.COMPLETED)
     
     def mark_job_failed(self, job: QueueJob, error_message: str):
         """Mark a job as failed."""
-        job.status = JobStatus.FAILED
         job.error_message = error_message
+        self._set_status(job, JobStatus.FAILED)
+    
+    def mark_job_retrying(self, job: QueueJob, error_message: str):
+        """Mark a failed job as waiting to be retried (see requeue_job)."""
+        job.error_message = error_message
+        self._set_status(job, JobStatus.RETRYING)
+    
+    def requeue_job(self, job: QueueJob):
+        """Make a job waiting to retry pending again."""
+        if job.status == JobStatus.RETRYING and self._jobs_by_id.get(job.job_id) is job:
+            self._set_status(job, JobStatus.PENDING)
+            self._push(job)
     
     def mark_job_cancelled(self, job: QueueJob):
         """Mark a job as cancelled."""
-        job.status = JobStatus.CANCELLED
+        self._set_status(job, JobStatus.CANCELLED)
     
     def pause(self):
         """Pause the queue."""
@@ -102,33 +507,55 @@ class ProcessingQueue:
     
     def clear_completed(self):
         """Remove completed jobs from the queue."""
-        self.jobs = [job for job in self.jobs if job.status != JobStatus.COMPLETED]
+        self._jobs_by_id = {
+            job_id: job for job_id, job in self._jobs_by_id.items() if job.status != JobStatus.COMPLETED
+        }
+        self._status_counts[JobStatus.COMPLETED] = 0
+        if self.journal is not None:
+            self.journal.rewrite(self.policy.name, [job.to_dict() for job in self._jobs_by_id.values()])
     
     def clear_all(self):
         """Clear all jobs from the queue."""
-        self.jobs = []
-        self.current_job_index = -1
+        self._jobs_by_id = {}
+        self._status_counts = Counter()
+        self.current_job = None
+        self._ready = {}
+        self._groups = {}
+        self._running_by_dir = {}
+        self._started_by_dir = {}
+        self._waiting_totals = {}
+        if self.journal is not None:
+            self.journal.clear()
+    
+    def get_status_count(self, status: JobStatus) -> int:
+        """Get count of jobs with a status."""
+        return self._status_counts[status]
     
     def get_pending_count(self) -> int:
         """Get count of pending jobs."""
-        return sum(1 for job in self.jobs if job.status == JobStatus.PENDING)
+        return self._status_counts[JobStatus.PENDING]
     
     def get_completed_count(self) -> int:
         """Get count of completed jobs."""
-        return sum(1 for job in self.jobs if job.status == JobStatus.COMPLETED)
+        return self._status_counts[JobStatus.COMPLETED]
     
     def get_failed_count(self) -> int:
         """Get count of failed jobs."""
-        return sum(1 for job in self.jobs if job.status == JobStatus.FAILED)
+        return self._status_counts[JobStatus.FAILED]
     
     def has_pending_jobs(self) -> bool:
         """Check if there are any pending jobs."""
-        return self.get_pending_count() > 0
+        return self._status_counts[JobStatus.PENDING] > 0
     
     def remove_job(self, job: QueueJob):
-        """Remove a job from the queue."""
-        if job in self.jobs:
-            self.jobs.remove(job)
-            if self.current_job_index >= len(self.jobs):
-                self.current_job_index = -1
+        """Remove a job from the queue (its heap entry is dropped lazily)."""
+        if self._jobs_by_id.get(job.job_id) is job:
+            del self._jobs_by_id[job.job_id]
+            self._status_counts[job.status] -= 1
+            self._count_waiting(job, -1)
+            if job.status == JobStatus.PROCESSING:
+                self._running_by_dir[job.output_dir] -= 1
+            if job is self.current_job:
+                self.current_job = None
+            self._record({"op": "remove", "job_id": job.job_id})
 
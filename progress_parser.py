@@ -0,0 +1,169 @@
+"""
+Progress parsing for Faster Whisper GUI.
+Turns faster-whisper-xxl output (-pp percentage lines and segment timestamps) into
+fraction complete, real-time factor and time remaining for a job.
+"""
+
+import re
+import time
+from datetime import timedelta
+
+
+# "[00:01:23.000 --> 00:01:25.500]" or "[01:23.000 --> 01:25.500]" segment lines
+SEGMENT_PATTERN = re.compile(
+    r"\[((?:\d+:)?\d{1,2}:\d{2}(?:[.,]\d+)?)\s*-->\s*((?:\d+:)?\d{1,2}:\d{2}(?:[.,]\d+)?)\]"
+)
+# "-pp" progress lines start with a percentage, e.g. " 45% |#####     | 123.4/274.2 [...]"
+PERCENT_PATTERN = re.compile(r"^\s*(?:progress:?\s*)?(\d{1,3}(?:\.\d+)?)\s*%", re.IGNORECASE)
+# "Processing audio with duration 05:00.000" printed before transcription starts
+DURATION_PATTERN = re.compile(r"audio with duration\s+((?:\d+:)?\d{1,2}:\d{2}(?:[.,]\d+)?)", re.IGNORECASE)
+# Audio seconds processed / total on tqdm-style progress lines
+AUDIO_SECONDS_PATTERN = re.compile(r"\|\s*(\d+(?:\.\d+)?)\s*/\s*(\d+(?:\.\d+)?)\b")
+# "Starting transcription on: C:\audio\file.mp3" printed as the executable starts on each input file
+FILE_START_PATTERN = re.compile(r"^\s*Starting transcription on:\s*(.+?)\s*$", re.IGNORECASE)
+
+MIN_ETA_SECONDS = 2.0  # Wall time between progress reports needed before estimating time remaining
+
+
+def parse_timestamp(text):
+    """Convert "HH:MM:SS.mmm" or "MM:SS.mmm" to seconds."""
+    seconds = 0.0
+    for part in text.replace(",", ".").split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def parse_file_start(line):
+    """
+    Get the input file named by the executable's per-file start line.
+    
+    Returns:
+        Path as printed, or None if the line doesn't start a file
+    """
+    match = FILE_START_PATTERN.match(line)
+    return match.group(1).strip("'\"") if match else None
+
+
+def parse_progress_line(line):
+    """
+    Parse one output line for progress information.
+    
+    Returns:
+        Dictionary with any of "fraction" (0-1), "position" (audio seconds processed)
+        and "duration" (total audio seconds), or None if the line has no progress.
+    """
+    # Segment lines first - transcribed text may itself contain a percentage
+    match = SEGMENT_PATTERN.search(line)
+    if match:
+        return {"position": parse_timestamp(match.group(2))}
+    
+    match = DURATION_PATTERN.search(line)
+    if match:
+        return {"duration": parse_timestamp(match.group(1))}
+    
+    match = PERCENT_PATTERN.match(line)
+    if match:
+        progress = {"fraction": min(float(match.group(1)), 100.0) / 100.0}
+        seconds = AUDIO_SECONDS_PATTERN.search(line)
+        if seconds and float(seconds.group(2)) > 0:
+            progress["position"] = float(seconds.group(1))
+            progress["duration"] = float(seconds.group(2))
+        return progress
+    
+    return None
+
+
+class ProgressTracker:
+    """Tracks the progress of one file being transcribed."""
+    
+    def __init__(self, duration=None, file_path=None, profile=None):
+        """
+        Initialize a tracker.
+        
+        Args:
+            duration: Audio duration in seconds if known (from probing)
+            file_path: Input file the progress belongs to
+            profile: Throughput profile of the settings used (see eta_estimator.get_profile_key)
+        """
+        self.duration = duration if duration and duration > 0 else None
+        self.file_path = file_path
+        self.profile = profile
+        self.restart()
+    
+    def restart(self):
+        """Reset progress and start timing now (e.g. when a batched file starts)."""
+        self.start_time = time.monotonic()
+        self.fraction = None
+        self.position = None
+        self._first_report = None  # (time, fraction) of the first progress report
+    
+    def feed(self, lines):
+        """
+        Parse output lines and update progress.
+        
+        Returns:
+            True if progress changed
+        """
+        changed = False
+        for line in lines:
+            progress = parse_progress_line(line)
+            if not progress:
+                continue
+            if progress.get("duration") and not self.duration:
+                self.duration = progress["duration"]
+            
+            position = progress.get("position")
+            fraction = progress.get("fraction")
+            if fraction is None and position is not None and self.duration:
+                fraction = min(position / self.duration, 1.0)
+            if position is None and fraction is not None and self.duration:
+                position = fraction * self.duration
+            
+            # Progress only moves forward (segments may be printed slightly out of order)
+            if position is not None and (self.position is None or position > self.position):
+                self.position = position
+                changed = True
+            if fraction is not None and (self.fraction is None or fraction > self.fraction):
+                self.fraction = fraction
+                changed = True
+            if changed and self._first_report is None:
+                self._first_report = (time.monotonic(), self.fraction or 0.0)
+        return changed
+    
+    @property
+    def elapsed(self):
+        """Wall seconds since the file started."""
+        return time.monotonic() - self.start_time
+    
+    @property
+    def rtf(self):
+        """Real-time factor: audio seconds processed per wall second (None if unknown)."""
+        elapsed = self.elapsed
+        if self.position is None or elapsed <= 0:
+            return None
+        return self.position / elapsed
+    
+    def eta(self):
+        """
+        Estimate the wall seconds remaining for this file.
+        
+        Uses the rate since the first progress report so model loading time
+        doesn't skew the estimate. Returns None until there is enough progress.
+        """
+        if self.fraction is None or self._first_report is None:
+            return None
+        first_time, first_fraction = self._first_report
+        progress_time = time.monotonic() - first_time
+        if progress_time < MIN_ETA_SECONDS or self.fraction <= first_fraction:
+            return None
+        rate = (self.fraction - first_fraction) / progress_time
+        return (1.0 - self.fraction) / rate
+    
+    def summary(self):
+        """Get a one-line throughput summary (None if no audio position was reported)."""
+        rtf = self.rtf
+        if rtf is None:
+            return None
+        audio = timedelta(seconds=int(self.position))
+        wall = timedelta(seconds=int(self.elapsed))
+        return f"Transcribed {audio} of audio in {wall} ({rtf:.1f}x real time)"
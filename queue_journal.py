@@ -0,0 +1,139 @@
+"""
+Persistent queue journal for Faster Whisper GUI.
+Records every queued job and status change in an append-only file so an interrupted
+queue can be resumed after a crash or restart.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from file_info_extractor import get_user_data_dir
+
+
+JOURNAL_FILENAME = "queue_journal.jsonl"
+MIN_COMPACT_RECORDS = 1000  # Records appended before compaction is considered
+
+
+class QueueJournal:
+    """
+    Append-only JSON lines journal of queue events.
+    
+    Each line is one record with an "op" field:
+    - "snapshot": start of a compacted journal (with the scheduling policy)
+    - "policy": scheduling policy changed
+    - "add": job added (full job dictionary)
+    - "status": job status changed (with error message / output files)
+    - "update": job fields changed (priority, duration, options)
+    - "remove": job removed
+    Replaying the records gives the queue state at the time of the last write.
+    A torn last line (crash while writing) is ignored.
+    """
+    
+    def __init__(self, path=None):
+        """
+        Initialize the journal.
+        
+        Args:
+            path: Journal file (default: user data directory)
+        """
+        self.path = Path(path) if path else get_user_data_dir() / JOURNAL_FILENAME
+        self._file = None
+        self._records_since_compaction = 0
+    
+    def load(self):
+        """
+        Replay the journal.
+        
+        Returns:
+            Tuple (policy name or None, list of job dictionaries in the order added)
+        """
+        policy = None
+        jobs = {}  # job_id -> job dictionary (insertion ordered)
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # Torn write
+                    op = record.get("op")
+                    if op in ("snapshot", "policy"):
+                        policy = record.get("policy")
+                        if op == "snapshot":
+                            jobs = {}
+                    elif op == "add":
+                        jobs[record["job"]["job_id"]] = record["job"]
+                    elif op in ("status", "update") and record.get("job_id") in jobs:
+                        jobs[record["job_id"]].update(record.get("fields", {}))
+                    elif op == "remove":
+                        jobs.pop(record.get("job_id"), None)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error reading queue journal: {e}")
+        return policy, list(jobs.values())
+    
+    def append(self, record, sync=False):
+        """
+        Append a record.
+        
+        Args:
+            record: JSON serializable dictionary with an "op" field
+            sync: Force the record to disk (fsync) before returning
+        """
+        try:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(json.dumps(record, default=str) + "\n")
+            self._file.flush()
+            if sync:
+                os.fsync(self._file.fileno())
+            self._records_since_compaction += 1
+        except OSError as e:
+            print(f"Error writing queue journal: {e}")
+    
+    def needs_compaction(self, live_jobs):
+        """Check if the journal has grown well beyond the live queue."""
+        return self._records_since_compaction >= max(MIN_COMPACT_RECORDS, 2 * live_jobs)
+    
+    def rewrite(self, policy, jobs):
+        """
+        Compact the journal to a snapshot of the given jobs.
+        
+        The snapshot is written to a temporary file and atomically replaces the
+        journal, so a crash during compaction leaves the old journal intact.
+        """
+        self.close()
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"op": "snapshot", "policy": policy}) + "\n")
+                for job in jobs:
+                    f.write(json.dumps({"op": "add", "job": job}, default=str) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            self._records_since_compaction = 0
+        except OSError as e:
+            print(f"Error compacting queue journal: {e}")
+    
+    def clear(self):
+        """Delete the journal (nothing to resume)."""
+        self.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error clearing queue journal: {e}")
+        self._records_since_compaction = 0
+    
+    def close(self):
+        """Close the journal file."""
+        if self._file:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
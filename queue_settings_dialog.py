@@ -7,19 +7,22 @@ from pathlib import Path
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox,
-    QRadioButton, QButtonGroup, QGroupBox
+    QRadioButton, QButtonGroup, QGroupBox, QComboBox, QSpinBox
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
+from processing_queue import SchedulingPolicy
+
 
 class QueueSettingsDialog(QDialog):
     """Dialog for reviewing and editing queue settings for multiple files."""
     
-    def __init__(self, file_list, default_options, use_same_settings=True, parent=None):
+    def __init__(self, file_list, default_options, use_same_settings=True, parent=None, file_overrides=None):
         super().__init__(parent)
         self.file_list = file_list
         self.default_options = default_options
+        self.file_overrides = file_overrides or {}  # Per-file suggested options (e.g. from audio analysis)
         self.file_options = {}  # Will store options for each file
         self.init_ui()
         # Set initial mode based on parameter
@@ -68,13 +71,30 @@ class QueueSettingsDialog(QDialog):
         mode_group.setLayout(mode_layout)
         layout.addWidget(mode_group)
         
+        # Scheduling policy
+        order_layout = QHBoxLayout()
+        order_layout.addWidget(QLabel("Processing Order:"))
+        self.policy_combo = QComboBox()
+        for policy in SchedulingPolicy:
+            self.policy_combo.addItem(policy.value, policy)
+        self.policy_combo.setToolTip(
+            "In order added: files run in the order shown.\n"
+            "Shortest files first: short files finish quickly while long ones fill idle workers.\n"
+            "Highest priority first: uses the Priority column (higher runs first).\n"
+            "Fair share per output folder: alternates between output folders."
+        )
+        self.policy_combo.currentIndexChanged.connect(self.on_policy_changed)
+        order_layout.addWidget(self.policy_combo)
+        order_layout.addStretch()
+        layout.addLayout(order_layout)
+        
         # Files table
         table_label = QLabel("Files and Settings:")
         layout.addWidget(table_label)
         
         self.files_table = QTableWidget()
-        self.files_table.setColumnCount(3)
-        self.files_table.setHorizontalHeaderLabels(["File", "Settings", "Actions"])
+        self.files_table.setColumnCount(4)
+        self.files_table.setHorizontalHeaderLabels(["File", "Settings", "Actions", "Priority"])
         self.files_table.horizontalHeader().setStretchLastSection(True)
         self.files_table.setAlternatingRowColors(True)
         self.files_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
@@ -97,6 +117,12 @@ class QueueSettingsDialog(QDialog):
             edit_btn.setEnabled(False)  # Disabled by default
             edit_btn.clicked.connect(lambda checked, idx=i: self.edit_file_settings(idx))
             self.files_table.setCellWidget(i, 2, edit_btn)
+            
+            # Priority (only used by the priority policy)
+            priority_spin = QSpinBox()
+            priority_spin.setRange(-100, 100)
+            priority_spin.setEnabled(False)
+            self.files_table.setCellWidget(i, 3, priority_spin)
         
         self.files_table.resizeColumnsToContents()
         layout.addWidget(self.files_table)
@@ -122,6 +148,7 @@ class QueueSettingsDialog(QDialog):
         """Apply default settings to all files."""
         for file_path in self.file_list:
             self.file_options[file_path] = self.default_options.copy()
+            self.file_options[file_path].update(self.file_overrides.get(file_path, {}))
         self.update_settings_display()
     
     def on_settings_mode_changed(self):
@@ -141,6 +168,14 @@ class QueueSettingsDialog(QDialog):
                 if btn:
                     btn.setEnabled(True)
     
+    def on_policy_changed(self):
+        """Enable the priority column only for the priority policy."""
+        use_priority = self.policy_combo.currentData() == SchedulingPolicy.PRIORITY
+        for i in range(self.files_table.rowCount()):
+            spin = self.files_table.cellWidget(i, 3)
+            if spin:
+                spin.setEnabled(use_priority)
+    
     def edit_file_settings(self, file_index):
         """Open settings editor for a specific file."""
         file_path = self.file_list[file_index]
@@ -243,4 +278,16 @@ class QueueSettingsDialog(QDialog):
     def get_file_options(self):
         """Get options for all files."""
         return self.file_options.copy()
+    
+    def get_scheduling_policy(self):
+        """Get the selected scheduling policy."""
+        return self.policy_combo.currentData()
+    
+    def get_file_priorities(self):
+        """Get the priority for each file (file path -> int)."""
+        priorities = {}
+        for i, file_path in enumerate(self.file_list):
+            spin = self.files_table.cellWidget(i, 3)
+            priorities[file_path] = spin.value() if spin else 0
+        return priorities
 
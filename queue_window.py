@@ -29,7 +29,7 @@ class QueueWindow(QDialog):
         layout = QVBoxLayout()
         
         # Header
-        header_label = QLabel("Processing Queue - Files will be processed sequentially")
+        header_label = QLabel("Processing Queue - Files are processed in the order chosen in the queue settings")
         header_label.setStyleSheet("font-weight: bold; font-size: 11pt; padding: 10px;")
         layout.addWidget(header_label)
         
@@ -110,6 +110,11 @@ class QueueWindow(QDialog):
                 status_item.setForeground(Qt.GlobalColor.green)
             elif status == "Failed":
                 status_item.setForeground(Qt.GlobalColor.red)
+            elif status == "Retrying":
+                status_item.setForeground(Qt.GlobalColor.darkYellow)
+                progress_bar = self.queue_table.cellWidget(file_index, 2)
+                if progress_bar:
+                    progress_bar.setVisible(False)
             elif status == "Processing":
                 status_item.setForeground(Qt.GlobalColor.blue)
                 # Show progress bar
@@ -130,6 +135,13 @@ class QueueWindow(QDialog):
         
         self.update_overall_progress()
     
+    def update_file_progress(self, file_index, fraction):
+        """Show how far a processing file has got (fraction 0-1)."""
+        progress_bar = self.queue_table.cellWidget(file_index, 2)
+        if progress_bar:
+            progress_bar.setRange(0, 100)
+            progress_bar.setValue(int(fraction * 100))
+    
     def update_overall_progress(self):
         """Update overall progress display."""
         total = self.queue_table.rowCount()
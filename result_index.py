@@ -0,0 +1,265 @@
+"""
+Result index for Faster Whisper GUI.
+Remembers which output files were produced for an input file's content with a given set of
+options, so inputs that were already transcribed with identical settings can be skipped.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from file_info_extractor import get_user_data_dir
+
+
+INDEX_FILENAME = "result_index.db"
+HASH_CHUNK_BYTES = 1024 * 1024  # Bytes hashed from the start and from the end of each file
+DEFAULT_MAX_ENTRIES = 50000
+
+# Options that only affect speed or console output, not the transcript
+IGNORED_OPTIONS = {"print_progress", "verbose", "check_files", "batch_recursive", "diarize_threads"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    content_hash TEXT NOT NULL,
+    options_hash TEXT NOT NULL,
+    input_path TEXT NOT NULL,
+    output_files TEXT NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (content_hash, options_hash)
+)
+"""
+
+
+def compute_content_hash(file_path, use_cache=True):
+    """
+    Compute a fast content hash of a file: its size plus the first and last MB.
+    
+    The hash is cached in the metadata cache (keyed by path, size and mtime), so
+    unchanged files are not read again.
+    
+    Returns:
+        Hex digest string, or None if the file cannot be read
+    """
+    cache = None
+    if use_cache:
+        from metadata_cache import get_metadata_cache
+        cache = get_metadata_cache()
+        cached = cache.get_analysis(file_path, "content_hash")
+        if cached:
+            return cached.get("hash")
+    
+    try:
+        size = os.path.getsize(file_path)
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(str(size).encode())
+        with open(file_path, "rb") as f:
+            digest.update(f.read(HASH_CHUNK_BYTES))
+            if size > 2 * HASH_CHUNK_BYTES:
+                f.seek(-HASH_CHUNK_BYTES, os.SEEK_END)
+                digest.update(f.read(HASH_CHUNK_BYTES))
+            elif size > HASH_CHUNK_BYTES:
+                digest.update(f.read())
+    except OSError:
+        return None
+    
+    content_hash = digest.hexdigest()
+    if cache is not None:
+        cache.put_analysis(file_path, "content_hash", {"hash": content_hash})
+    return content_hash
+
+
+def compute_options_hash(options):
+    """Compute a canonical hash of the options that affect the transcript."""
+    relevant = {key: value for key, value in options.items() if key not in IGNORED_OPTIONS}
+    canonical = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.blake2b(canonical.encode(), digest_size=20).hexdigest()
+
+
+class ResultIndex:
+    """SQLite index of (content hash, options hash) -> output files."""
+    
+    def __init__(self, db_path=None, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the index.
+        
+        Args:
+            db_path: Path to the SQLite database (default: user data directory)
+            max_entries: Maximum number of results kept (oldest are removed)
+        """
+        self.db_path = Path(db_path) if db_path else get_user_data_dir() / INDEX_FILENAME
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = None
+        try:
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+        except sqlite3.Error as e:
+            # Skipping finished files is an optimization only
+            print(f"Result index disabled: {e}")
+            self._conn = None
+    
+    def lookup(self, content_hash, options_hash):
+        """
+        Get the output files recorded for an input's content and options.
+        
+        Returns:
+            Dictionary with the previous "input_path" and its "output_files" (all still
+            existing), or None if there is no usable result (entries whose outputs
+            were deleted are dropped).
+        """
+        if self._conn is None or not content_hash:
+            return None
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT input_path, output_files FROM results WHERE content_hash = ? AND options_hash = ?",
+                    (content_hash, options_hash)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        if row is None:
+            return None
+        
+        try:
+            output_files = json.loads(row[1])
+        except ValueError:
+            output_files = []
+        if output_files and all(Path(f).exists() for f in output_files):
+            return {"input_path": row[0], "output_files": output_files}
+        
+        self.remove(content_hash, options_hash)
+        return None
+    
+    def record(self, content_hash, options_hash, input_path, output_files):
+        """Record the output files produced for an input."""
+        if self._conn is None or not content_hash or not output_files:
+            return
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO results (content_hash, options_hash, input_path, output_files, created) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (content_hash, options_hash, str(input_path),
+                     json.dumps([str(f) for f in output_files]), time.time())
+                )
+                count = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+                if count > self.max_entries:
+                    self._conn.execute(
+                        "DELETE FROM results WHERE rowid IN "
+                        "(SELECT rowid FROM results ORDER BY created ASC LIMIT ?)",
+                        (count - self.max_entries,)
+                    )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"Error writing result index: {e}")
+    
+    def remove(self, content_hash, options_hash):
+        """Forget a result."""
+        if self._conn is None:
+            return
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "DELETE FROM results WHERE content_hash = ? AND options_hash = ?",
+                    (content_hash, options_hash)
+                )
+                self._conn.commit()
+            except sqlite3.Error:
+                pass
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_result_index():
+    """Get the shared result index instance."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = ResultIndex()
+        return _index
+
+
+def record_result(input_file, options, output_files):
+    """Record the outputs of a finished transcription (only files named after the input)."""
+    stem = Path(input_file).stem
+    own_outputs = [f for f in output_files if Path(f).name.startswith(stem)]
+    if own_outputs:
+        get_result_index().record(
+            compute_content_hash(input_file), compute_options_hash(options), input_file, own_outputs
+        )
+
+
+def find_previous_results(file_options, max_workers=None):
+    """
+    Find inputs that were already transcribed with identical options.
+    
+    Args:
+        file_options: Dictionary input file path -> options
+        max_workers: Number of files hashed in parallel
+    
+    Returns:
+        Dictionary input file path -> {"input_path", "output_files"} of the previous result
+    """
+    index = get_result_index()
+    options_hashes = {}  # Hash each distinct options dict once
+    
+    def lookup(file_path):
+        options = file_options[file_path]
+        key = id(options)
+        if key not in options_hashes:
+            options_hashes[key] = compute_options_hash(options)
+        return file_path, index.lookup(compute_content_hash(file_path), options_hashes[key])
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers or min(8, (os.cpu_count() or 1) * 2)) as executor:
+        for file_path, previous in executor.map(lookup, list(file_options)):
+            if previous:
+                results[file_path] = previous
+    return results
+
+
+def reuse_outputs(previous, input_file, output_dir):
+    """
+    Make a previous result available for an input file.
+    
+    Outputs already in the right place are kept; otherwise they are copied to the
+    output directory and renamed after the new input file.
+    
+    Args:
+        previous: Result from find_previous_results()
+        input_file: Input file being skipped
+        output_dir: Output directory ("source" for the input file's folder)
+    
+    Returns:
+        List of output file paths for the input
+    """
+    input_path = Path(input_file)
+    old_stem = Path(previous["input_path"]).stem
+    dest_dir = input_path.parent if output_dir == "source" else Path(output_dir)
+    
+    reused = []
+    for output_file in previous["output_files"]:
+        source = Path(output_file)
+        name = source.name
+        if name.startswith(old_stem):
+            name = input_path.stem + name[len(old_stem):]
+        dest = dest_dir / name
+        try:
+            if dest.resolve() != source.resolve():
+                dest_dir.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, dest)
+            reused.append(str(dest))
+        except OSError as e:
+            print(f"Error copying previous result {source}: {e}")
+    return reused
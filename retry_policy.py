@@ -0,0 +1,133 @@
+"""
+Retry policy for Faster Whisper GUI queue jobs.
+Classifies why a job failed from the tail of its output and decides whether to retry it,
+how long to wait, and which cheaper settings to fall back to when memory ran out.
+"""
+
+import re
+from dataclasses import dataclass, field
+
+from progress_parser import SEGMENT_PATTERN
+
+
+OUTPUT_TAIL_LINES = 50  # Output lines kept per job for classifying its failure
+
+# Failure causes
+OUT_OF_MEMORY = "out_of_memory"
+FILE_LOCKED = "file_locked"
+NETWORK = "network"
+CRASH = "crash"
+INVALID_INPUT = "invalid_input"
+UNKNOWN = "unknown"
+
+FAILURE_DESCRIPTIONS = {
+    OUT_OF_MEMORY: "Out of memory",
+    FILE_LOCKED: "File locked or access denied",
+    NETWORK: "Network error (model download)",
+    CRASH: "Process crashed",
+    INVALID_INPUT: "Invalid or unreadable input file",
+    UNKNOWN: "Unknown error",
+}
+
+# Checked in order - the first match wins
+_FAILURE_PATTERNS = [
+    (OUT_OF_MEMORY, re.compile(
+        r"out of memory|CUDA_ERROR_OUT_OF_MEMORY|cudaErrorMemoryAllocation|CUBLAS_STATUS_ALLOC_FAILED"
+        r"|std::bad_alloc|MemoryError|Unable to allocate|not enough memory",
+        re.IGNORECASE)),
+    (INVALID_INPUT, re.compile(
+        r"No such file|FileNotFoundError|Invalid data found|does not contain any stream"
+        r"|could not find codec|Failed to load audio|Error opening input",
+        re.IGNORECASE)),
+    (FILE_LOCKED, re.compile(
+        r"Permission denied|PermissionError|being used by another process|WinError 32|Access is denied",
+        re.IGNORECASE)),
+    (NETWORK, re.compile(
+        r"ConnectionError|HTTPError|Max retries exceeded|timed out|Temporary failure in name resolution",
+        re.IGNORECASE)),
+]
+
+# Windows exception exit codes (e.g. 0xC0000005 access violation) and signals on other platforms
+_CRASH_EXIT_CODES = {3221225477, -1073741819, 3221226505, -1073740791, 3221225725, -1073741571}
+
+# Cheaper compute type to fall back to on memory exhaustion, per device
+_COMPUTE_FALLBACK = {
+    "cuda": {"float32": "float16", "float16": "int8_float16", "auto": "int8_float16",
+             "default": "int8_float16", "int8_float16": "int8"},
+    "cpu": {"float32": "int8", "float16": "int8", "auto": "int8", "default": "int8", "int8_float16": "int8"},
+}
+
+
+def classify_failure(output_lines, exit_code=None):
+    """
+    Classify why a job failed.
+    
+    Args:
+        output_lines: The last lines of the job's output (and any error message)
+        exit_code: Process exit code if it ran
+    
+    Returns:
+        One of the failure cause constants (OUT_OF_MEMORY, FILE_LOCKED, ...)
+    """
+    # The most recent error is the most relevant one
+    for line in reversed(output_lines):
+        if SEGMENT_PATTERN.search(line):
+            continue  # Transcribed text, not an error message
+        for cause, pattern in _FAILURE_PATTERNS:
+            if pattern.search(line):
+                return cause
+    if exit_code is not None and (exit_code in _CRASH_EXIT_CODES or exit_code < -1):
+        return CRASH
+    return UNKNOWN
+
+
+def get_fallback_options(options, device):
+    """
+    Get cheaper settings to retry with after running out of memory.
+    
+    Lowers the compute type one step and halves the diarization threads.
+    
+    Args:
+        options: Options the job failed with
+        device: Resolved device ("cuda" or "cpu")
+    
+    Returns:
+        New options dictionary, or None if there is nothing cheaper to fall back to
+    """
+    fallback = dict(options)
+    changed = False
+    
+    compute_type = options.get("compute_type") or "auto"
+    cheaper = _COMPUTE_FALLBACK.get(device, _COMPUTE_FALLBACK["cpu"]).get(compute_type)
+    if cheaper:
+        fallback["compute_type"] = cheaper
+        changed = True
+    
+    if options.get("diarize_enable"):
+        threads = int(options.get("diarize_threads") or 0)
+        if threads > 1:
+            fallback["diarize_threads"] = threads // 2
+            changed = True
+        elif threads == 0:
+            fallback["diarize_threads"] = 2  # Automatic usually means all cores
+            changed = True
+    
+    return fallback if changed else None
+
+
+@dataclass
+class RetryPolicy:
+    """When and how often a failed job is retried."""
+    max_attempts: int = 3  # Total runs including the first
+    backoff_seconds: float = 10.0  # Wait before the first retry
+    backoff_factor: float = 2.0  # Multiplier for each further retry
+    max_backoff_seconds: float = 300.0
+    retry_on: frozenset = field(default_factory=lambda: frozenset({OUT_OF_MEMORY, FILE_LOCKED, NETWORK, CRASH}))
+    
+    def should_retry(self, cause, attempts):
+        """Check if a job that has run `attempts` times and failed with `cause` should run again."""
+        return cause in self.retry_on and attempts < self.max_attempts
+    
+    def get_delay(self, attempts):
+        """Seconds to wait before the next run of a job that has run `attempts` times."""
+        return min(self.max_backoff_seconds, self.backoff_seconds * self.backoff_factor ** max(0, attempts - 1))
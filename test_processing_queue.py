@@ -0,0 +1,42 @@
+"""
+Tests for the processing queue's scheduling.
+Run with: python -m unittest test_processing_queue
+"""
+
+import unittest
+
+from processing_queue import ProcessingQueue
+
+
+class RetryThenBatchTest(unittest.TestCase):
+    """A job requeued for a retry must be scheduled once, even if its old heap entry is still indexed."""
+    
+    def test_retried_last_job_is_batched_once(self):
+        queue = ProcessingQueue()
+        job = queue.add_job(["a.mp3"], "out", {"model": "small"})
+        queue.mark_job_processing(job)
+        queue.mark_job_retrying(job, "out of memory")
+        queue.requeue_job(job)
+        
+        batch = queue.get_next_batch(max_files=4)
+        
+        self.assertEqual([j.job_id for j in batch], [job.job_id])
+    
+    def test_retried_job_is_batched_once_with_others(self):
+        queue = ProcessingQueue()
+        first = queue.add_job(["a.mp3"], "out", {"model": "small"})
+        queue.mark_job_processing(first)
+        queue.mark_job_retrying(first, "out of memory")
+        queue.requeue_job(first)
+        second = queue.add_job(["b.mp3"], "out", {"model": "small"})
+        
+        batch = queue.get_next_batch(max_files=4)
+        
+        self.assertEqual([j.job_id for j in batch], [first.job_id, second.job_id])
+        for job in batch:
+            queue.mark_job_processing(job)
+        self.assertEqual(queue.get_next_batch(max_files=4), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,512 @@
+"""
+Warm transcription backend for Faster Whisper GUI.
+Keeps a faster_whisper.WhisperModel loaded in a long-lived worker process and feeds
+it files over a pipe, so consecutive files don't each pay the model load time of a
+new faster-whisper-xxl process.
+"""
+
+import importlib.util
+import json
+import multiprocessing
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+from command_builder import (
+    OUTPUT_FORMAT_EXTENSIONS, DEFAULT_OUTPUT_FORMAT, get_output_dir_for_input, get_user_data_dir
+)
+
+
+# faster_whisper is only imported by the worker processes - checking for it here keeps
+# its heavy imports (CTranslate2, PyAV) out of the GUI process
+WARM_BACKEND_AVAILABLE = importlib.util.find_spec("faster_whisper") is not None
+
+# Options only faster-whisper-xxl implements -> feature name shown to the user.
+# Files using them are always run with the executable.
+EXE_ONLY_OPTIONS = {
+    "diarize_enable": "speaker diarization",
+    "ff_speechnorm": "audio filters",
+    "ff_loudnorm": "audio filters",
+    "ff_lowhighpass": "audio filters",
+    "ff_fftdn": "audio filters",
+    "highlight_words": "highlighted words",
+    "return_embeddings": "speaker embeddings",
+    "check_files": "input file checks",
+}
+# VAD methods built into faster_whisper (Silero)
+WARM_VAD_METHODS = {"silero_v4_fw", "silero_v5_fw"}
+
+STANDARD_LINE_WIDTH = 42  # Subtitle layout of faster-whisper-xxl's --standard
+STANDARD_LINE_COUNT = 2
+STANDARD_COMMA_CENT = 70
+DEFAULT_SPEAKER_LABEL = "SPEAKER"  # faster-whisper-xxl's --speaker default
+SENTENCE_ENDINGS = (".", "?", "!", "。", "？", "！")
+
+LOAD_POLL_INTERVAL = 0.1  # Seconds between checks for cancellation while waiting on the worker
+CANCEL_TIMEOUT = 10.0  # Seconds a worker gets to stop a cancelled file before it is terminated
+STOP_TIMEOUT = 5.0  # Seconds a worker gets to exit when shut down
+
+
+def get_exe_only_features(options):
+    """
+    Get the features of an options dict the warm backend can't provide.
+    
+    Returns:
+        List of feature names (empty if the warm backend can run the options)
+    """
+    features = []
+    for key, feature in EXE_ONLY_OPTIONS.items():
+        value = options.get(key)
+        if key == "ff_fftdn" and not value:
+            continue
+        if value and feature not in features:
+            features.append(feature)
+    tempo = options.get("ff_tempo")
+    if tempo and float(tempo) != 1.0 and "audio filters" not in features:
+        features.append("audio filters")
+    if options.get("speaker_label") and options["speaker_label"] != DEFAULT_SPEAKER_LABEL:
+        features.append("speaker labels")
+    if options.get("vad_enable", True) and options.get("vad_method") and options["vad_method"] not in WARM_VAD_METHODS:
+        features.append(f"{options['vad_method']} VAD")
+    return features
+
+
+def can_use_warm_backend(options):
+    """Check if faster_whisper is installed and can run files with the given options."""
+    return WARM_BACKEND_AVAILABLE and not get_exe_only_features(options)
+
+
+def get_model_key(options):
+    """Get the (model, device, compute_type) a warm worker process is loaded with for the given options."""
+    return (
+        options.get("model") or "large-v3",
+        options.get("device") or "auto",
+        options.get("compute_type") or "default",
+    )
+
+
+def get_transcribe_arguments(options):
+    """
+    Map an options dict (see FasterWhisperGUI.get_options_dict) onto WhisperModel.transcribe() arguments.
+    
+    Returns:
+        Dictionary of keyword arguments
+    """
+    language = options.get("language")
+    arguments = {
+        "task": options.get("task") or "transcribe",
+        "language": None if language in (None, "", "auto", "None") else language,
+        "word_timestamps": bool(options.get("word_timestamps", True)),
+        "vad_filter": bool(options.get("vad_enable", True)),
+    }
+    if options.get("beam_size"):
+        arguments["beam_size"] = int(options["beam_size"])
+    if options.get("patience"):
+        arguments["patience"] = float(options["patience"])
+    if options.get("temperature") is not None:
+        arguments["temperature"] = float(options["temperature"])
+    if arguments["vad_filter"] and options.get("vad_threshold") is not None:
+        arguments["vad_parameters"] = {"threshold": float(options["vad_threshold"])}
+    return arguments
+
+
+def get_subtitle_layout(options):
+    """
+    Get how subtitle cues are split and wrapped, following faster-whisper-xxl's options.
+    
+    Returns:
+        Dictionary with "sentence" (bool), "max_line_width", "max_line_count" (None for no limit)
+        and "max_comma_cent" (100 never breaks at commas)
+    """
+    if options.get("standard"):
+        return {"sentence": True, "max_line_width": STANDARD_LINE_WIDTH, "max_line_count": STANDARD_LINE_COUNT,
+                "max_comma_cent": STANDARD_COMMA_CENT}
+    return {
+        "sentence": bool(options.get("sentence") or options.get("diarize_enable")),
+        "max_line_width": options.get("max_line_width") or None,
+        "max_line_count": options.get("max_line_count") or None,
+        "max_comma_cent": int(options.get("max_comma_cent") or 100),
+    }
+
+
+def get_output_formats(options):
+    """Get the output formats to write for an options dict."""
+    formats = options.get("output_formats") or [DEFAULT_OUTPUT_FORMAT]
+    if not isinstance(formats, list):
+        formats = [formats]
+    if "all" in formats:
+        return list(OUTPUT_FORMAT_EXTENSIONS)
+    return [f for f in formats if f in OUTPUT_FORMAT_EXTENSIONS]
+
+
+def format_timestamp(seconds, separator="."):
+    """Format seconds as HH:MM:SS.mmm (or with "," for SRT)."""
+    milliseconds = int(round(max(seconds, 0.0) * 1000))
+    hours, milliseconds = divmod(milliseconds, 3600000)
+    minutes, milliseconds = divmod(milliseconds, 60000)
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}{separator}{milliseconds:03d}"
+
+
+def build_cues(segments, layout):
+    """
+    Split transcribed segments into subtitle cues.
+    
+    Args:
+        segments: List of dicts with "start", "end", "text" and optional "words"
+            (list of dicts with "start", "end", "word")
+        layout: Subtitle layout (see get_subtitle_layout())
+    
+    Returns:
+        List of (start, end, text) tuples, text wrapped to the layout's line width
+    """
+    width = layout.get("max_line_width")
+    max_chars = width * (layout.get("max_line_count") or 1) if width else None
+    # A cue this long ends at the next comma (100% never breaks at commas)
+    comma_cent = layout.get("max_comma_cent", 100)
+    comma_chars = max_chars * comma_cent / 100 if max_chars and comma_cent < 100 else None
+    cues = []
+    for segment in segments:
+        words = segment.get("words")
+        if not words or not (layout.get("sentence") or max_chars):
+            cues.append((segment["start"], segment["end"], segment["text"].strip()))
+            continue
+        current = []
+        for word in words:
+            text = "".join(w["word"] for w in current + [word]).strip()
+            if current and max_chars and len(text) > max_chars:
+                cues.append((current[0]["start"], current[-1]["end"], "".join(w["word"] for w in current).strip()))
+                current = []
+            current.append(word)
+            ends_sentence = layout.get("sentence") and word["word"].strip().endswith(SENTENCE_ENDINGS)
+            ends_at_comma = (comma_chars is not None and word["word"].strip().endswith((",", "，", "、"))
+                             and len("".join(w["word"] for w in current).strip()) >= comma_chars)
+            if ends_sentence or ends_at_comma:
+                cues.append((current[0]["start"], current[-1]["end"], "".join(w["word"] for w in current).strip()))
+                current = []
+        if current:
+            cues.append((current[0]["start"], current[-1]["end"], "".join(w["word"] for w in current).strip()))
+    if width:
+        cues = [(start, end, "\n".join(textwrap.wrap(text, width)) or text) for start, end, text in cues]
+    return [cue for cue in cues if cue[2]]
+
+
+def write_output_file(path, output_format, segments, info, layout):
+    """Write one output file in the given format."""
+    if output_format in ("srt", "vtt"):
+        separator = "," if output_format == "srt" else "."
+        blocks = []
+        for index, (start, end, text) in enumerate(build_cues(segments, layout), start=1):
+            timing = f"{format_timestamp(start, separator)} --> {format_timestamp(end, separator)}"
+            blocks.append(f"{index}\n{timing}\n{text}\n" if output_format == "srt" else f"{timing}\n{text}\n")
+        content = ("WEBVTT\n\n" if output_format == "vtt" else "") + "\n".join(blocks)
+    elif output_format == "json":
+        content = json.dumps({"language": info["language"], "duration": info["duration"], "segments": segments},
+                             ensure_ascii=False, indent=2)
+    elif output_format == "text":
+        content = "".join(f"[{format_timestamp(s['start'])} --> {format_timestamp(s['end'])}] {s['text'].strip()}\n"
+                          for s in segments)
+    elif output_format == "lrc":
+        content = "".join(f"[{int(s['start'] // 60):02d}:{s['start'] % 60:05.2f}]{s['text'].strip()}\n"
+                          for s in segments)
+    elif output_format == "tsv":
+        content = "start\tend\ttext\n" + "".join(
+            f"{int(s['start'] * 1000)}\t{int(s['end'] * 1000)}\t{s['text'].strip()}\n" for s in segments)
+    else:
+        content = "".join(f"{s['text'].strip()}\n" for s in segments)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def _resolve_model(model, model_dir):
+    """Use a model faster-whisper-xxl already downloaded to the model folder, else let faster_whisper fetch it."""
+    local_path = Path(model_dir) / f"faster-whisper-{model}"
+    if (local_path / "config.json").exists():
+        return str(local_path)
+    return model
+
+
+def _transcribe_file(whisper_model, connection, cancel_event, input_file, output_dir, arguments, formats, layout):
+    """
+    Transcribe one file in the worker process, reporting faster-whisper-xxl style output lines.
+    
+    Returns:
+        Exit code (0 on success, -1 if cancelled, 1 on error)
+    """
+    def report(*lines):
+        connection.send(("output", list(lines)))
+    
+    report(f"Starting transcription on: {input_file}")
+    try:
+        segment_iter, info = whisper_model.transcribe(input_file, **arguments)
+        duration = info.duration or 0.0
+        report(f"Detected language '{info.language}' with probability {info.language_probability:.2f}",
+               f"Processing audio with duration {format_timestamp(duration)}")
+        segments = []
+        for segment in segment_iter:  # Transcription happens as the generator is consumed
+            if cancel_event.is_set():
+                report("Transcription cancelled")
+                return -1
+            words = [{"start": w.start, "end": w.end, "word": w.word, "probability": w.probability}
+                     for w in (segment.words or [])]
+            segments.append({"start": segment.start, "end": segment.end, "text": segment.text, "words": words})
+            percent = int(100 * min(segment.end / duration, 1.0)) if duration else 0
+            report(f"[{format_timestamp(segment.start)} --> {format_timestamp(segment.end)}] {segment.text.strip()}",
+                   f"{percent:3d}% | {min(segment.end, duration):.1f}/{duration:.1f}")
+        
+        target_dir = get_output_dir_for_input(input_file, output_dir)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        stem = Path(input_file).stem
+        summary = {"language": info.language, "duration": duration}
+        for output_format in formats:
+            write_output_file(target_dir / f"{stem}{OUTPUT_FORMAT_EXTENSIONS[output_format]}",
+                              output_format, segments, summary, layout)
+        report(f"100% | {duration:.1f}/{duration:.1f}", f"Subtitles are written to '{target_dir}' directory.")
+        return 0
+    except Exception as e:
+        # Reported like the executable's tracebacks, so failures are classified the same way
+        report(f"{type(e).__name__}: {e}")
+        return 1
+
+
+def _serve(connection, cancel_event, model, device, compute_type, model_dir):
+    """
+    Worker process: load the model once, then transcribe files until told to stop.
+    
+    Messages received: ("transcribe", input_file, output_dir, arguments, formats, layout), ("stop",)
+    Messages sent: ("loaded", seconds) or ("failed", message) once, then per file
+    ("output", lines)... followed by ("done", exit code)
+    """
+    started = time.time()
+    try:
+        from faster_whisper import WhisperModel
+        whisper_model = WhisperModel(_resolve_model(model, model_dir), device=device,
+                                     compute_type=compute_type, download_root=str(model_dir))
+    except Exception as e:
+        connection.send(("failed", f"{type(e).__name__}: {e}"))
+        return
+    connection.send(("loaded", time.time() - started))
+    
+    while True:
+        try:
+            message = connection.recv()
+        except (EOFError, OSError):
+            return  # The GUI exited
+        if message[0] != "transcribe":
+            return
+        exit_code = _transcribe_file(whisper_model, connection, cancel_event, *message[1:])
+        connection.send(("done", exit_code))
+
+
+class WarmModelServer:
+    """
+    A worker process with one model loaded, transcribing one file at a time.
+    
+    The process is started on first use and kept running between files. If it exits
+    (crash, or terminated after a cancel that didn't stop in time) it is started again,
+    and the model reloaded, on the next use.
+    """
+    
+    def __init__(self, model, device="auto", compute_type="default", model_dir=None):
+        """
+        Initialize the server.
+        
+        Args:
+            model: Model name (e.g. "large-v3")
+            device: "auto", "cuda" or "cpu"
+            compute_type: CTranslate2 compute type (e.g. "float16")
+            model_dir: Model folder (default: _models in the user data directory)
+        """
+        self.key = (model, device, compute_type)
+        self.model_dir = Path(model_dir) if model_dir else get_user_data_dir() / "_models"
+        self.last_used = time.time()
+        self.pool = None  # ModelPool managing this server's memory (see model_pool)
+        self._process = None
+        self._connection = None
+        self._cancel_event = None
+        self._loaded = False
+        self._lock = threading.Lock()  # One transcription at a time
+    
+    @property
+    def description(self):
+        """Model, device and compute type for display."""
+        return f"{self.key[0]} ({self.key[1]}, {self.key[2]})"
+    
+    def is_alive(self):
+        """Check if the worker process is running."""
+        return self._process is not None and self._process.is_alive()
+    
+    def is_loaded(self):
+        """Check if the worker process is running with the model loaded."""
+        return self._loaded and self.is_alive()
+    
+    def is_busy(self):
+        """Check if a transcription is running (or waiting) on this server."""
+        return self._lock.locked()
+    
+    @property
+    def pid(self):
+        """Process id of the worker process (None if not running)."""
+        return self._process.pid if self.is_alive() else None
+    
+    def transcribe(self, input_files, output_dir, options, on_output, is_cancelled=None):
+        """
+        Transcribe files one after another (blocks until done; call from a worker thread).
+        
+        Args:
+            input_files: Input file paths
+            output_dir: Output directory path ("source" for each input file's folder)
+            options: Dictionary of option values (see get_transcribe_arguments())
+            on_output: Function called with each list of output lines
+            is_cancelled: Optional function returning True once the run should stop
+        
+        Returns:
+            Exit code: 0 on success, -1 if cancelled, otherwise the failed file's exit code
+        """
+        is_cancelled = is_cancelled or (lambda: False)
+        while not self._lock.acquire(timeout=LOAD_POLL_INTERVAL):
+            if is_cancelled():
+                return -1  # Still waiting for another file using this model
+        try:
+            self.last_used = time.time()
+            arguments = get_transcribe_arguments(options)
+            formats = get_output_formats(options)
+            layout = get_subtitle_layout(options)
+            
+            exit_code = self._ensure_loaded(on_output, is_cancelled)
+            if exit_code != 0:
+                return exit_code
+            for input_file in input_files:
+                self._cancel_event.clear()
+                self._connection.send(("transcribe", str(Path(input_file).absolute()), output_dir,
+                                       arguments, formats, layout))
+                exit_code = self._wait_for("done", on_output, is_cancelled)
+                if exit_code != 0:
+                    return exit_code
+            on_output(["Operation finished"])
+            return 0
+        finally:
+            self.last_used = time.time()
+            if self.pool is not None and self.is_loaded():
+                self.pool.enforce_budget(self, on_output)  # Memory grows with longer files
+            self._lock.release()
+    
+    def close(self):
+        """Stop the worker process, unloading the model."""
+        with self._lock:
+            self._stop()
+    
+    def try_close(self):
+        """
+        Stop the worker process unless a transcription is using it.
+        
+        Returns:
+            True if the worker was stopped
+        """
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._stop()
+            return True
+        finally:
+            self._lock.release()
+    
+    def _ensure_loaded(self, on_output, is_cancelled):
+        """Start the worker process and wait for its model to load, if needed."""
+        if self.is_loaded():
+            on_output([f"Using loaded model {self.description}"])
+            return 0
+        if self.is_alive():
+            # A previous run was cancelled while the model was loading
+            on_output([f"Waiting for model {self.description} to finish loading..."])
+            return self._wait_for("loaded", on_output, is_cancelled)
+        
+        self._stop()
+        if self.pool is not None:
+            self.pool.make_room(self, on_output)
+        on_output([f"Loading model {self.description}..."])
+        context = multiprocessing.get_context("spawn")
+        self._connection, child_connection = context.Pipe()
+        self._cancel_event = context.Event()
+        self._process = context.Process(
+            target=_serve,
+            args=(child_connection, self._cancel_event, *self.key, str(self.model_dir)),
+            name=f"warm-model-{self.key[0]}",
+            daemon=True
+        )
+        self._process.start()
+        child_connection.close()  # Only the worker's end stays open, so its exit is seen as EOF
+        return self._wait_for("loaded", on_output, is_cancelled)
+    
+    def _wait_for(self, expected, on_output, is_cancelled):
+        """
+        Relay worker messages until the expected one arrives.
+        
+        Returns:
+            Exit code (0 once loaded)
+        """
+        cancel_deadline = None
+        while True:
+            if cancel_deadline is None and is_cancelled():
+                if expected == "loaded":
+                    return -1  # Let the model finish loading in the background for the next file
+                self._cancel_event.set()
+                cancel_deadline = time.monotonic() + CANCEL_TIMEOUT
+            if cancel_deadline is not None and time.monotonic() > cancel_deadline:
+                on_output(["Worker did not stop in time - unloading model"])
+                self._stop()
+                return -1
+            
+            try:
+                if not self._connection.poll(LOAD_POLL_INTERVAL):
+                    if not self._process.is_alive():
+                        raise EOFError
+                    continue
+                message = self._connection.recv()
+            except (EOFError, OSError):
+                self._process.join(STOP_TIMEOUT)
+                exit_code = self._process.exitcode
+                on_output([f"Model worker process exited unexpectedly (exit code {exit_code})"])
+                self._stop()
+                return -1 if cancel_deadline is not None else (exit_code or 1)
+            
+            kind = message[0]
+            if kind == "output":
+                on_output(message[1])
+            elif kind == "loaded":
+                self._loaded = True
+                on_output([f"Model loaded in {message[1]:.1f} s"])
+                if self.pool is not None:
+                    self.pool.enforce_budget(self, on_output)
+                return 0
+            elif kind == "failed":
+                on_output([f"Failed to load model {self.description}", message[1]])
+                self._stop()
+                return 1
+            elif kind == "done":
+                return message[1]
+    
+    def _stop(self):
+        """Stop the worker process (caller holds the lock)."""
+        self._loaded = False
+        if self._process is None:
+            return
+        if self._process.is_alive():
+            try:
+                self._connection.send(("stop",))
+            except (OSError, ValueError):
+                pass
+            self._process.join(STOP_TIMEOUT)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join(STOP_TIMEOUT)
+            if self._process.is_alive():
+                self._process.kill()
+                self._process.join(STOP_TIMEOUT)
+        try:
+            self._connection.close()
+        except OSError:
+            pass
+        self._process = None
+        self._connection = None